@@ -20,7 +20,7 @@ class NetworkApi:
         self.api_key = environ.get('ETHERSCAN_API_KEY')
 
     def log(self, text: str):
-        tests.test_suite_data.current_test.testruns[-1].steps.append(text)
+        tests.test_suite_data.current_test.testruns[-1].steps.append(text, kind='api')
         logging.info(text)
 
     def send_etherscan_request(self, params):
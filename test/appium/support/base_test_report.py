@@ -1,33 +1,39 @@
 import hmac
-import json
 import os
 import re
 import urllib
 from hashlib import md5
 
-from support.test_data import SingleTestData
+from support.report_model import ReportModel
+from support.result_store import ResultStore
 
 
 class BaseTestReport:
     TEST_REPORT_DIR = "%s/../report" % os.path.dirname(os.path.abspath(__file__))
+    # (result store, report model) by report directory, shared by all reports of the process
+    shared_results = dict()
 
     def __init__(self):
         self.sauce_username = os.environ.get('SAUCE_USERNAME')
         self.sauce_access_key = os.environ.get('SAUCE_ACCESS_KEY')
-        self.init_report()
+        report_dir = os.path.realpath(self.TEST_REPORT_DIR)
+        if report_dir not in BaseTestReport.shared_results:
+            self.init_report()
+            results = ResultStore(os.path.join(report_dir, 'results.sqlite'))
+            BaseTestReport.shared_results[report_dir] = results, ReportModel(results, self.get_status)
+        self.results, self.model = BaseTestReport.shared_results[report_dir]
 
     def init_report(self):
         if not os.path.exists(self.TEST_REPORT_DIR):
-            os.makedirs(self.TEST_REPORT_DIR)
+            os.makedirs(self.TEST_REPORT_DIR, exist_ok=True)
+        # xdist workers write into the report of the run which is prepared by the master process
+        if os.environ.get('PYTEST_XDIST_WORKER'):
+            return
         # delete all old files in report dir
         file_list = [f for f in os.listdir(self.TEST_REPORT_DIR)]
         for f in file_list:
             os.remove(os.path.join(self.TEST_REPORT_DIR, f))
 
-    def get_test_report_file_path(self, test_name):
-        file_name = "%s.json" % test_name
-        return os.path.join(self.TEST_REPORT_DIR, file_name)
-
     def save_logs(self, logs: dict):
         logs_paths = {}
         for log in logs.keys():
@@ -48,53 +54,20 @@ class BaseTestReport:
                 else:
                     logs_paths = ''
 
-        file_path = self.get_test_report_file_path(test.name)
-        test_dict = {
-            'testrail_case_id': test.testrail_case_id,
-            'name': test.name,
-            'logs_paths': logs_paths,
-            'testruns': list(),
-            'group_name': test.group_name,
-            'secured': test.secured
-        }
-        for testrun in test.testruns:
-            test_dict['testruns'].append(testrun.__dict__)
-        json.dump(test_dict, open(file_path, 'w'))
+        # steps are formatted only now, when the report is saved
+        self.results.save_test(test, logs_paths, self.get_status(test))
+        self.model.invalidate()
+
+    def get_status(self, test):
+        if self.is_test_successful(test):
+            return 'passed'
+        return 'xfailed' if test.testruns[-1].xfail else 'failed'
 
     def get_all_tests(self):
-        tests = list()
-        file_list = [f for f in os.listdir(self.TEST_REPORT_DIR) if f.endswith('json')]
-        for file_name in file_list:
-            file_path = os.path.join(self.TEST_REPORT_DIR, file_name)
-            test_data = json.load(open(file_path))
-            testruns = list()
-            for testrun_data in test_data['testruns']:
-                testruns.append(SingleTestData.TestRunData(
-                    steps=testrun_data['steps'],
-                    jobs=testrun_data['jobs'],
-                    error=testrun_data['error'],
-                    first_commands=testrun_data['first_commands'],
-                    xfail=testrun_data['xfail']))
-            tests.append(SingleTestData(name=test_data['name'],
-                                        logs_paths=test_data['logs_paths'],
-                                        testruns=testruns,
-                                        testrail_case_id=test_data['testrail_case_id'],
-                                        grop_name=test_data['group_name'],
-                                        secured=test_data['secured']))
-        return tests
+        return self.model.tests
 
     def get_tests_by_status(self):
-        tests = self.get_all_tests()
-        passed, failed, xfailed = list(), list(), list()
-        for test in tests:
-            if self.is_test_successful(test):
-                passed.append(test)
-            else:
-                if test.testruns[-1].xfail:
-                    xfailed.append(test)
-                else:
-                    failed.append(test)
-        return passed, failed, xfailed
+        return self.model.get_tests_by_status()
 
     def get_sauce_token(self, job_id):
         return hmac.new(bytes(self.sauce_username + ":" + self.sauce_access_key, 'latin-1'),
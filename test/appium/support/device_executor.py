@@ -0,0 +1,97 @@
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+
+import pytest
+
+
+class Devices(object):
+    """
+    Runs steps on several devices at once. Each device executes its steps in its own thread (`driver.worker`),
+    so steps sent to one device are still performed one after another, in the order they were sent.
+    Items are views (or anything else with a `driver`) or drivers, one per device.
+    Failures of all devices are collected: appended to `errors` if it's given, otherwise raised after all devices
+    finished - the original exception if only one device failed.
+    """
+
+    def __init__(self, items, errors=None, timeout=600):
+        self.items = list(items)
+        self.errors = errors
+        self.timeout = timeout
+
+    @staticmethod
+    def get_driver(item):
+        return getattr(item, 'driver', item)
+
+    def submit(self, item, func, *args, **kwargs):
+        return self.get_driver(item).worker.submit(func, *args, **kwargs)
+
+    def collect(self, futures, timeout=None):
+        """Waits for (device index, future) pairs, returns results by device index with None for failed ones"""
+        timeout = timeout if timeout else self.timeout
+        results, failures = dict(), list()
+        for index, future in futures:
+            try:
+                results[index] = future.result(timeout)
+            except FutureTimeoutError:
+                failures.append((index, TimeoutError("step is not finished in %s seconds" % timeout)))
+                results[index] = None
+            except (Exception, pytest.fail.Exception) as e:
+                failures.append((index, e))
+                results[index] = None
+        self.report_failures(failures)
+        return results
+
+    def report_failures(self, failures):
+        if not failures:
+            return
+        messages = ["Device %s: %s" % (index + 1, str(error).strip() or type(error).__name__)
+                    for index, error in failures]
+        if self.errors is not None:
+            for message in messages:
+                self.errors.append(message)
+        elif len(failures) == 1:
+            raise failures[0][1]
+        else:
+            pytest.fail('\n '.join(messages))
+
+    def all(self, func, *args_per_device, timeout=None):
+        """
+        Calls `func(item, *args)` on all devices at once, `args_per_device` are iterables with a value per device:
+        `devices.all(lambda home, name: home.get_chat(name).click(), usernames)`. Returns list of results.
+        """
+        per_device_args = list(zip(*args_per_device)) if args_per_device else [()] * len(self.items)
+        futures = [(index, self.submit(item, func, item, *per_device_args[index]))
+                   for index, item in enumerate(self.items)]
+        results = self.collect(futures, timeout)
+        return [results[index] for index in range(len(self.items))]
+
+    def run(self, func, indexes=None, timeout=None):
+        """Calls `func(index)` for devices with given indexes (all by default) at once, returns results by index"""
+        indexes = range(len(self.items)) if indexes is None else indexes
+        return self.collect([(index, self.submit(self.items[index], func, index)) for index in indexes], timeout)
+
+    def any(self, func, *args_per_device, timeout=None):
+        """True if `func` returns truthy value on any of devices"""
+        return any(self.all(func, *args_per_device, timeout=timeout))
+
+    @contextmanager
+    def parallel(self, timeout=None):
+        """
+        Block for different steps on different devices, all of them are awaited at the end of the block:
+            with devices.parallel() as block:
+                block.run(0, home_1.send_message, 'hi')
+                block.run(1, home_2.get_chat, username)
+        """
+        block = ParallelBlock(self)
+        yield block
+        block.results = self.collect(block.futures, timeout)
+
+
+class ParallelBlock(object):
+    def __init__(self, devices: Devices):
+        self.devices = devices
+        self.futures = list()
+        self.results = dict()
+
+    def run(self, index, func, *args, **kwargs):
+        self.futures.append((index, self.devices.submit(self.devices.items[index], func, *args, **kwargs)))
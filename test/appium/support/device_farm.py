@@ -0,0 +1,251 @@
+import fcntl
+import json
+import logging
+import os
+import re
+import subprocess
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+
+
+def get_worker_number():
+    """Number of the xdist worker (`gw3` -> 3), None when tests are run without xdist"""
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    return int(re.sub(r'\D', '', worker)) if worker else None
+
+
+class LocalDevice(object):
+    def __init__(self, farm, serial, slot):
+        self.farm = farm
+        self.serial = serial
+        self.slot = slot
+
+    @property
+    def capabilities(self):
+        """Device and ports of UiAutomator2 server, MJPEG server and chromedriver which are unique for the device"""
+        return {'udid': self.serial,
+                'systemPort': self.farm.system_port + self.slot,
+                'mjpegServerPort': self.farm.mjpeg_server_port + self.slot,
+                'chromedriverPort': self.farm.chromedriver_port + self.slot}
+
+    def release(self):
+        self.farm.release(self)
+
+    @property
+    def is_emulator(self):
+        return self.serial.startswith('emulator-')
+
+    def emu(self, *args, timeout=300):
+        """Runs an emulator console command, returns its output"""
+        return subprocess.check_output(['adb', '-s', self.serial, 'emu'] + list(args), universal_newlines=True,
+                                       timeout=timeout)
+
+    def has_snapshot(self, name):
+        try:
+            return name in self.emu('avd', 'snapshot', 'list', timeout=30).split()
+        except (subprocess.SubprocessError, OSError):
+            return False
+
+    def save_snapshot(self, name):
+        try:
+            return 'KO' not in self.emu('avd', 'snapshot', 'save', name)
+        except (subprocess.SubprocessError, OSError):
+            return False
+
+    def install_app(self, apk, timeout=300):
+        try:
+            return 'Success' in subprocess.check_output(['adb', '-s', self.serial, 'install', '-r', '-g', apk],
+                                                        universal_newlines=True, timeout=timeout)
+        except (subprocess.SubprocessError, OSError):
+            return False
+
+    def load_snapshot(self, name, timeout=120):
+        """Restores the snapshot and waits until the device is ready again"""
+        try:
+            if 'KO' in self.emu('avd', 'snapshot', 'load', name):
+                return False
+            subprocess.check_call(['adb', '-s', self.serial, 'wait-for-device'], timeout=timeout)
+        except (subprocess.SubprocessError, OSError):
+            return False
+        return self.farm.is_healthy(self.serial)
+
+
+class LocalDeviceFarm(object):
+    """
+    Devices and emulators connected to adb, shared between xdist workers of the run: a device is leased by one
+    session at a time, leases are kept in a state file guarded by `flock` and are dropped when the worker dies.
+    Each worker uses its own Appium server (port `appium_port` + worker number), which is started if it's not running.
+    With `snapshot_reset` emulators are restored from an AVD snapshot with the app installed before new sessions,
+    instead of starting them on a device left in any state by the previous session.
+    """
+    appium_port = 4723
+    system_port = 8200
+    mjpeg_server_port = 7810
+    chromedriver_port = 9515
+    # unhealthy devices are not leased by the worker again for that time
+    unhealthy_timeout = 60
+
+    def __init__(self, state_dir=tempfile.gettempdir(), appium_binary='appium', snapshot_reset=False):
+        run_id = os.environ.get('PYTEST_XDIST_TESTRUNUID', 'pid%s' % os.getpid())
+        self.state_path = os.path.join(state_dir, 'local_devices_%s.json' % run_id)
+        self.worker = '%s:%s' % (os.environ.get('PYTEST_XDIST_WORKER', 'master'), os.getpid())
+        self.appium_binary = appium_binary
+        self.snapshot_reset = snapshot_reset
+        self.server = None
+        self.unhealthy = dict()
+
+    @contextmanager
+    def state(self):
+        with open(self.state_path, 'a+') as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                state_file.seek(0)
+                content = state_file.read()
+                state = json.loads(content) if content else dict()
+                state.setdefault('leases', dict())
+                yield state
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(json.dumps(state))
+            finally:
+                fcntl.flock(state_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _drop_dead_workers(state):
+        for serial, lease in list(state['leases'].items()):
+            try:
+                os.kill(int(lease['worker'].split(':')[-1]), 0)
+            except (ProcessLookupError, ValueError):
+                del state['leases'][serial]
+
+    @staticmethod
+    def get_serials():
+        output = subprocess.check_output(['adb', 'devices'], universal_newlines=True)
+        return [line.split()[0] for line in output.splitlines()[1:] if line.strip().endswith('device')]
+
+    @staticmethod
+    def is_healthy(serial):
+        try:
+            output = subprocess.check_output(['adb', '-s', serial, 'shell', 'getprop', 'sys.boot_completed'],
+                                             universal_newlines=True, timeout=10)
+        except (subprocess.SubprocessError, OSError):
+            return False
+        return output.strip() == '1'
+
+    def try_lease(self, quantity=1):
+        """Returns `quantity` healthy devices if they are free right now, otherwise None"""
+        serials = [serial for serial in self.get_serials()
+                   if time.time() - self.unhealthy.get(serial, 0) > self.unhealthy_timeout]
+        with self.state() as state:
+            self._drop_dead_workers(state)
+            leased_slots = {lease['slot'] for lease in state['leases'].values()}
+            free = [serial for serial in serials if serial not in state['leases']][:quantity]
+            if len(free) < quantity:
+                return None
+            devices = list()
+            for serial in free:
+                slot = min(set(range(len(leased_slots) + quantity)) - leased_slots)
+                leased_slots.add(slot)
+                state['leases'][serial] = {'worker': self.worker, 'slot': slot}
+                devices.append(LocalDevice(self, serial, slot))
+        # devices are checked after they are leased, so other workers don't wait for slow adb calls
+        unhealthy = [device for device in devices if not self.is_healthy(device.serial)]
+        if unhealthy:
+            for device in unhealthy:
+                self.unhealthy[device.serial] = time.time()
+            for device in devices:
+                device.release()
+            return None
+        return devices
+
+    def lease(self, quantity=1, timeout=1800, poll_frequency=10):
+        """Waits until `quantity` healthy devices are not used by other sessions, returns them"""
+        if len(self.get_serials()) < quantity:
+            raise RuntimeError("%s devices are needed, but only %s are connected to adb" %
+                               (quantity, len(self.get_serials())))
+        end_time = time.time() + timeout
+        while True:
+            devices = self.try_lease(quantity)
+            if devices:
+                return devices
+            if time.time() > end_time:
+                raise TimeoutError("%s free devices are not found in %s seconds" % (quantity, timeout))
+            time.sleep(poll_frequency)
+
+    def release(self, device):
+        with self.state() as state:
+            lease = state['leases'].get(device.serial)
+            if lease and lease['worker'] == self.worker:
+                del state['leases'][device.serial]
+
+    @staticmethod
+    def reset_device(device, snapshot_name, app_id):
+        """
+        Restores the emulator from the snapshot, returns True if it's restored.
+        Otherwise the app is uninstalled, so the new session installs it from scratch.
+        """
+        if device.is_emulator and device.has_snapshot(snapshot_name) and device.load_snapshot(snapshot_name):
+            return True
+        logging.info("Device %s is not restored from snapshot %s, the app is reinstalled" %
+                     (device.serial, snapshot_name))
+        subprocess.call(['adb', '-s', device.serial, 'uninstall', app_id],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return False
+
+    @staticmethod
+    def save_clean_snapshot(device, snapshot_name, apk):
+        """
+        Installs the app and saves the snapshot before a session is started on the emulator,
+        so restored emulators have neither the app nor UiAutomator2 server running
+        """
+        if device.install_app(apk) and device.save_snapshot(snapshot_name):
+            return True
+        logging.info("Snapshot %s is not saved on device %s" % (snapshot_name, device.serial))
+        return False
+
+    # Appium server
+
+    @property
+    def server_port(self):
+        worker_number = get_worker_number()
+        return self.appium_port if worker_number is None else self.appium_port + 1 + worker_number
+
+    @property
+    def server_url(self):
+        return 'http://localhost:%s/wd/hub' % self.server_port
+
+    def is_server_running(self):
+        try:
+            with urllib.request.urlopen(self.server_url + '/status', timeout=5) as response:
+                return response.status == 200
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def ensure_server(self, timeout=60):
+        """Returns URL of the Appium server of this worker, starts the server if it's not running"""
+        if self.is_server_running():
+            return self.server_url
+        logging.info("Starting Appium server on port %s" % self.server_port)
+        self.server = subprocess.Popen([self.appium_binary, '--port', str(self.server_port), '--base-path', '/wd/hub',
+                                        '--relaxed-security'],
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        end_time = time.time() + timeout
+        while not self.is_server_running():
+            if self.server.poll() is not None or time.time() > end_time:
+                self.stop_server()
+                raise RuntimeError("Appium server is not started on port %s" % self.server_port)
+            time.sleep(1)
+        return self.server_url
+
+    def stop_server(self):
+        if self.server is None:
+            return
+        self.server.terminate()
+        try:
+            self.server.wait(10)
+        except subprocess.TimeoutExpired:
+            self.server.kill()
+        self.server = None
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import statistics
+import time
+from contextlib import closing
+
+
+def split_scope(nodeid):
+    """xdist_group name of a test (nodeid ends with `@group` in `loadgroup` mode) or the nodeid itself"""
+    if nodeid.rfind('@') > nodeid.rfind(']'):
+        return nodeid.split('@')[-1]
+    return nodeid
+
+
+class DurationHistory(object):
+    """
+    Durations of test phases (setup, call, teardown) of previous runs in a local SQLite database.
+    Estimates of xdist groups are averages of their total durations in the latest `runs_to_average` runs.
+    """
+    runs_to_average = 5
+    # used for tests which were never run
+    default_test_duration = 300
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self.connect()) as connection, connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS durations '
+                               '(run TEXT, nodeid TEXT, scope TEXT, phase TEXT, duration REAL, devices INTEGER, '
+                               'outcome TEXT, recorded_at REAL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS durations_scope ON durations (scope, run)')
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        return connection
+
+    def record(self, run, reports):
+        """Saves (nodeid, phase, duration, devices, outcome) of reports in one transaction"""
+        if not reports:
+            return
+        with closing(self.connect()) as connection, connection:
+            connection.executemany(
+                'INSERT INTO durations VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [(run, nodeid, split_scope(nodeid), phase, duration, devices, outcome, time.time())
+                 for nodeid, phase, duration, devices, outcome in reports])
+
+    def get_estimates(self):
+        """Returns {scope: (seconds, devices)} of scopes which were run before"""
+        with closing(self.connect()) as connection:
+            rows = connection.execute('SELECT scope, run, SUM(duration), MAX(devices), MAX(recorded_at) '
+                                      'FROM durations GROUP BY scope, run').fetchall()
+        runs = dict()
+        for scope, _, duration, devices, recorded_at in rows:
+            runs.setdefault(scope, list()).append((recorded_at, duration, devices or 1))
+        estimates = dict()
+        for scope, scope_runs in runs.items():
+            latest = sorted(scope_runs, reverse=True)[:self.runs_to_average]
+            estimates[scope] = (statistics.mean(duration for _, duration, _ in latest),
+                                max(devices for _, _, devices in latest))
+        return estimates
+
+    def get_test_duration(self):
+        """Median total duration of a test, for groups without history"""
+        with closing(self.connect()) as connection:
+            durations = [row[0] for row in connection.execute(
+                'SELECT SUM(duration) FROM durations GROUP BY run, nodeid').fetchall()]
+        return statistics.median(durations) if durations else self.default_test_duration
@@ -1,14 +1,35 @@
+import functools
 import os
 
 from support.base_test_report import BaseTestReport
 from support.testrail_report import TestrailReport
 
 
+@functools.lru_cache()
+def get_repo():
+    """status-mobile repo with a GitHub client created once per process"""
+    from github import Github
+    from tests.conftest import github_token
+    return Github(github_token).get_user('status-im').get_repo('status-mobile')
+
+
+@functools.lru_cache()
+def get_pull(pr_number):
+    return get_repo().get_pull(int(pr_number))
+
+
 class GithubHtmlReport(BaseTestReport):
     TEST_REPORT_DIR = "%s/../report" % os.path.dirname(os.path.abspath(__file__))
 
-    def __init__(self):
+    def __init__(self, testrail_report: TestrailReport = None):
         super(GithubHtmlReport, self).__init__()
+        self._testrail_report = testrail_report
+
+    @property
+    def testrail_report(self):
+        if self._testrail_report is None:
+            self._testrail_report = TestrailReport()
+        return self._testrail_report
 
     def list_of_failed_testrail_ids(self, tests_data):
         ids_failed_test = []
@@ -20,7 +41,7 @@ class GithubHtmlReport(BaseTestReport):
     def build_html_report(self, run_id):
         tests = self.get_all_tests()
         passed, failed, xfailed = self.get_tests_by_status()
-        not_executed_tests = TestrailReport().get_not_executed_tests(run_id)
+        not_executed_tests = self.testrail_report.get_not_executed_tests(run_id)
 
         if len(tests) > 0:
             title_html = "## %.0f%% of end-end tests have passed\n" % (len(passed) / len(tests) * 100)
@@ -76,9 +97,7 @@ class GithubHtmlReport(BaseTestReport):
         from tests import pytest_config_global
         pr_id = pytest_config_global['pr_number']
 
-        from github import Github
-        from conftest import github_token
-        branch_name = Github(github_token).get_user('status-im').get_repo('status-mobile').get_pull(int(pr_id)).head.ref
+        branch_name = get_pull(pr_id).head.ref
 
         if not_executed_tests:
             html += "<li><a href=\"%s\">Rerun not executed tests</a></li>" % self.get_jenkins_link_to_rerun_e2e(
@@ -120,7 +139,7 @@ class GithubHtmlReport(BaseTestReport):
         return html
 
     def build_test_row_html(self, index, test, run_id):
-        test_rail_link = TestrailReport().get_test_result_link(run_id, test.testrail_case_id)
+        test_rail_link = self.testrail_report.get_test_result_link(run_id, test.testrail_case_id)
         if test_rail_link:
             html = "<tr><td><b>%s. <a href=\"%s\">%s</a>, id: %s </b></td></tr>" % (
                 index + 1, test_rail_link, test.name, test.testrail_case_id)
@@ -0,0 +1,30 @@
+from xdist.scheduler import LoadGroupScheduling
+
+from support.duration_history import DurationHistory
+
+
+class LongestFirstGroupScheduling(LoadGroupScheduling):
+    """
+    `loadgroup` scheduling which gives the longest group left to the next free worker instead of the next one
+    in collection order, so long groups don't start at the end of the run while other workers are idle.
+    Durations come from `DurationHistory`; groups without history are estimated by the number of tests.
+    Groups with more devices weigh more: their sessions also have to wait for free devices/concurrency.
+    """
+    device_weight = 0.1
+
+    def __init__(self, config, log=None, history: DurationHistory = None):
+        super().__init__(config, log)
+        self.estimates = history.get_estimates() if history else dict()
+        self.test_duration = history.get_test_duration() if history else DurationHistory.default_test_duration
+
+    def get_weight(self, scope):
+        try:
+            duration, devices = self.estimates[scope]
+        except KeyError:
+            duration, devices = self.test_duration * len(self.workqueue[scope]), 1
+        return duration * (1 + self.device_weight * (devices - 1))
+
+    def _assign_work_unit(self, node):
+        if self.workqueue:
+            self.workqueue.move_to_end(max(self.workqueue, key=self.get_weight), last=False)
+        super()._assign_work_unit(node)
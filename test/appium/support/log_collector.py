@@ -0,0 +1,128 @@
+import base64
+import gzip
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from http.client import RemoteDisconnected
+
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import ProtocolError
+
+
+class LogSegment(object):
+    def __init__(self, test_name, path, start, end):
+        self.test_name = test_name
+        self.path = path
+        self.start = start
+        self.end = end
+
+    def read(self):
+        with gzip.open(self.path, 'rb') as segment:
+            return segment.read()
+
+
+class LogCollector(object):
+    """
+    Pulls app logs from all devices at once and only the part which was added since the previous pull:
+    via `tail -c` in `mobile: shell` when the Appium server allows it, otherwise the whole file is pulled
+    and only the new part is kept. New parts are stored as gzip segments tagged with the test they belong to,
+    logs of a test or whole logs are assembled from segments on demand.
+    Segments are kept in a temporary directory until `cleanup`.
+    """
+
+    def __init__(self, app_path_getter, segments_dir=None):
+        self.get_app_path = app_path_getter
+        self._segments_dir = segments_dir
+        self.offsets = dict()
+        self.segments = dict()
+        self.shell_available = dict()
+
+    @property
+    def segments_dir(self):
+        if self._segments_dir is None:
+            self._segments_dir = tempfile.mkdtemp(prefix='app_logs_')
+        return self._segments_dir
+
+    def cleanup(self):
+        if self._segments_dir:
+            shutil.rmtree(self._segments_dir, ignore_errors=True)
+        self._segments_dir = None
+        self.segments = dict()
+
+    def _shell(self, driver, script):
+        return driver.execute_script('mobile: shell', {'command': 'sh', 'args': ['-c', script]})
+
+    def _pull_with_shell(self, driver, path, offset):
+        # size goes first to notice that the log was recreated, e.g. after app data was cleared;
+        # -1 if the log is not created yet
+        script = "[ -f '%s' ] || { echo -1; exit 0; }; stat -c %%s '%s' && tail -c +%s '%s' | base64"
+        output = self._shell(driver, script % (path, path, offset + 1, path))
+        size, _, content = output.partition('\n')
+        if int(size.strip()) < 0:
+            return 0, b''
+        if int(size.strip()) < offset:
+            return self._pull_with_shell(driver, path, 0)
+        return offset, base64.b64decode(content)
+
+    def pull_new_content(self, driver, file_name):
+        key = (driver.session_id, file_name)
+        offset = self.offsets.get(key, 0)
+        path = self.get_app_path() + file_name
+        if self.shell_available.get(driver.session_id, True):
+            try:
+                offset, content = self._pull_with_shell(driver, path, offset)
+                self.offsets[key] = offset + len(content)
+                return content
+            except WebDriverException:
+                self.shell_available[driver.session_id] = False
+        content = base64.b64decode(driver.pull_file(path))
+        if len(content) < offset:
+            offset = 0
+        self.offsets[key] = len(content)
+        return content[offset:]
+
+    def collect(self, drivers: dict, test_name, file_names=('geth.log', 'requests.log')):
+        """Pulls new parts of logs from all drivers concurrently, errors of single pulls are ignored"""
+        def pull(driver, file_name):
+            try:
+                self.add_segment(driver.session_id, file_name, test_name, self.pull_new_content(driver, file_name))
+            except (WebDriverException, AttributeError, RemoteDisconnected, ProtocolError):
+                pass
+
+        jobs = [(driver, file_name) for driver in drivers.values() for file_name in file_names]
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            list(executor.map(lambda job: pull(*job), jobs))
+
+    def add_segment(self, session_id, file_name, test_name, content: bytes):
+        if not content:
+            return
+        segments = self.segments.setdefault((session_id, file_name), list())
+        start = segments[-1].end if segments else 0
+        path = os.path.join(self.segments_dir, '%s_%s_%s.gz' % (session_id, file_name, len(segments)))
+        with gzip.open(path, 'wb', compresslevel=6) as segment:
+            segment.write(content)
+        segments.append(LogSegment(test_name, path, start, start + len(content)))
+
+    def get_log(self, session_id, file_name, test_name=None):
+        """Whole log pulled so far or only the part written during the test"""
+        return b''.join(segment.read() for segment in self.segments.get((session_id, file_name), list())
+                        if test_name is None or segment.test_name == test_name)
+
+    def save_logs(self, drivers: dict, report_dir, name, test_name=None, file_names=('geth.log', 'requests.log')):
+        """Saves logs as gzip files named like `<name>_geth<device number>.log.gz`, returns paths by file name"""
+        logs_paths = dict()
+        for index, driver in drivers.items():
+            for file_name in file_names:
+                content = self.get_log(driver.session_id, file_name, test_name)
+                if not content:
+                    continue
+                base, extension = os.path.splitext(file_name)
+                log_name = '%s_%s%s%s.gz' % (name, base, index + 1, extension)
+                log_path = os.path.join(report_dir, log_name)
+                with gzip.open(log_path, 'wb') as log_file:
+                    log_file.write(content)
+                logs_paths[log_name] = log_path
+        return logs_paths
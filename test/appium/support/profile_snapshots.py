@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from selenium.common.exceptions import WebDriverException
+
+
+def get_apk_hash(apk):
+    """Hash of the APK file if it's available locally, otherwise of its URL or name, which include the build"""
+    sha = hashlib.sha256()
+    if apk and os.path.isfile(apk):
+        with open(apk, 'rb') as apk_file:
+            for chunk in iter(lambda: apk_file.read(1024 * 1024), b''):
+                sha.update(chunk)
+    else:
+        sha.update(str(apk).encode())
+    return sha.hexdigest()
+
+
+class ProfileSnapshots(object):
+    """
+    App data with a profile which is onboarded once per APK build and profile parameters, restored into new sessions
+    instead of onboarding through UI again. Snapshots are tar archives of the app data directory made with `run-as`
+    via `mobile: shell`, so they need a debuggable build and Appium server started with `--relaxed-security`:
+    otherwise nothing is captured and onboarding goes through UI as usual.
+    Snapshots are stored in a directory named by the APK hash, so a new build never gets data of another one.
+    A restored profile has the installation identity of the captured one, so in sessions of one test or class
+    (`start_group`) a snapshot is used by one session only: devices which talk to each other never share an identity.
+    """
+    remote_archive = '/data/local/tmp/profile_snapshot_%s.tar'
+    excluded = ('cache', 'code_cache', 'lib')
+
+    def __init__(self, apk, enabled=False, cache_dir=os.path.join(tempfile.gettempdir(), 'profile_snapshots')):
+        self.apk = apk
+        self.enabled = enabled
+        self.cache_dir = cache_dir
+        self.shell_available = dict()
+        # snapshot keys used by sessions of the group, by session id
+        self.groups = dict()
+        self._apk_dir = None
+
+    @property
+    def apk_dir(self):
+        if self._apk_dir is None:
+            self._apk_dir = os.path.join(self.cache_dir, get_apk_hash(self.apk)[:16])
+        return self._apk_dir
+
+    @staticmethod
+    def get_key(kind, **params):
+        return '%s_%s' % (kind, hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:32])
+
+    def get_path(self, key):
+        return os.path.join(self.apk_dir, '%s.tar' % key)
+
+    def is_available(self, driver, key=None):
+        if not self.enabled or not self.shell_available.get(driver.session_id, True):
+            return False
+        return key is None or os.path.isfile(self.get_path(key))
+
+    def start_group(self, drivers):
+        """Sessions used by one test or class, e.g. all sessions of MultipleSharedDeviceTestCase class"""
+        group = dict()
+        for driver in drivers:
+            self.groups[driver.session_id] = group
+
+    def claim(self, driver, key):
+        """Returns True if no other session of the group uses the snapshot"""
+        group = self.groups.setdefault(driver.session_id, dict())
+        if group.setdefault(key, driver.session_id) == driver.session_id:
+            return True
+        logging.info("Profile snapshot %s is used by another device of the test" % key)
+        return False
+
+    def _shell(self, driver, script):
+        try:
+            return driver.execute_script('mobile: shell', {'command': 'sh', 'args': ['-c', script]})
+        except WebDriverException:
+            self.shell_available[driver.session_id] = False
+            raise
+
+    @staticmethod
+    def get_app_id(driver):
+        return driver.capabilities.get('appPackage') or driver.current_package
+
+    def is_shell_available(self, driver, app_id):
+        try:
+            self._shell(driver, 'run-as %s true' % app_id)
+            return True
+        except WebDriverException as e:
+            logging.info("Profile snapshots are not available: %s" % e)
+            return False
+
+    def capture(self, driver, key):
+        """
+        Saves data of the app, returns True if the app was restarted for that (even if the snapshot is not saved),
+        so it has to be signed in again
+        """
+        if not self.is_available(driver) or not self.claim(driver, key):
+            return False
+        app_id, remote_path = self.get_app_id(driver), self.remote_archive % driver.session_id
+        if not self.is_shell_available(driver, app_id):
+            return False
+        exclude = ' '.join('--exclude=%s' % name for name in self.excluded)
+        driver.terminate_app(app_id)
+        try:
+            self._shell(driver, 'run-as %s tar -cf - %s . > %s' % (app_id, exclude, remote_path))
+            content = driver.pull_file(remote_path)
+            self._shell(driver, 'rm -f %s' % remote_path)
+        except WebDriverException as e:
+            logging.info("Profile snapshot is not captured: %s" % e)
+            return True
+        finally:
+            driver.activate_app(app_id)
+        os.makedirs(self.apk_dir, exist_ok=True)
+        temp_path = '%s.%s' % (self.get_path(key), os.getpid())
+        with open(temp_path, 'w') as snapshot:
+            snapshot.write(content)
+        # another worker may capture the same profile at the same time, any of the snapshots is fine
+        os.replace(temp_path, self.get_path(key))
+        return True
+
+    def restore(self, driver, key):
+        """Replaces data of the app with the snapshot and starts the app, returns False if there is no snapshot"""
+        if not self.is_available(driver, key) or not self.claim(driver, key):
+            return False
+        app_id, remote_path = self.get_app_id(driver), self.remote_archive % driver.session_id
+        if not self.is_shell_available(driver, app_id):
+            return False
+        with open(self.get_path(key)) as snapshot:
+            content = snapshot.read()
+        driver.terminate_app(app_id)
+        try:
+            driver.push_file(remote_path, content)
+            self._shell(driver, 'cat %s | run-as %s tar -xf - && rm -f %s' % (remote_path, app_id, remote_path))
+        except WebDriverException as e:
+            logging.info("Profile snapshot is not restored: %s" % e)
+            driver.execute_script('mobile: clearApp', {'appId': app_id})
+            return False
+        finally:
+            driver.activate_app(app_id)
+        return True
+
+    def invalidate(self, key):
+        try:
+            os.remove(self.get_path(key))
+        except FileNotFoundError:
+            pass
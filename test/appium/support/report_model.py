@@ -0,0 +1,40 @@
+import threading
+
+
+class ReportModel(object):
+    """
+    Tests of the run loaded from the result store once and shared by all reporters of the process.
+    Tests are loaded again only after they were changed: by `invalidate` on writes of this process
+    or when the store reports other changes (saves of xdist workers).
+    """
+
+    def __init__(self, results, get_status):
+        self.results = results
+        self.get_status = get_status
+        self._lock = threading.Lock()
+        self._version = None
+        self._tests = None
+        self._by_status = None
+
+    def invalidate(self):
+        with self._lock:
+            self._version = None
+
+    def _load(self):
+        with self._lock:
+            version = self.results.get_version()
+            if self._tests is None or version != self._version:
+                self._tests = self.results.get_tests()
+                self._by_status = {'passed': list(), 'failed': list(), 'xfailed': list()}
+                for test in self._tests:
+                    self._by_status[self.get_status(test)].append(test)
+                self._version = version
+            return self._tests, self._by_status
+
+    @property
+    def tests(self):
+        return self._load()[0]
+
+    def get_tests_by_status(self):
+        by_status = self._load()[1]
+        return by_status['passed'], by_status['failed'], by_status['xfailed']
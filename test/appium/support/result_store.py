@@ -0,0 +1,101 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+from support.test_data import SingleTestData
+
+
+class ResultStore(object):
+    """
+    Test results of the run in SQLite (WAL mode), written by all xdist workers at once.
+    Saving a test updates its row and testruns and only appends steps which were recorded since the previous save.
+    Tests are read with queries by status, group or TestRail case id.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # (test name, testrun number) -> number of saved steps, per process
+        self.saved_steps = dict()
+        self._lock = threading.Lock()
+        with closing(self.connect()) as connection, connection:
+            connection.executescript('''
+                CREATE TABLE IF NOT EXISTS tests (name TEXT PRIMARY KEY, testrail_case_id INTEGER, group_name TEXT,
+                    secured INTEGER, logs_paths TEXT, status TEXT, updated_at REAL);
+                CREATE INDEX IF NOT EXISTS tests_status ON tests (status);
+                CREATE INDEX IF NOT EXISTS tests_group_name ON tests (group_name);
+                CREATE INDEX IF NOT EXISTS tests_testrail_case_id ON tests (testrail_case_id);
+                CREATE TABLE IF NOT EXISTS testruns (test_name TEXT, number INTEGER, jobs TEXT, error TEXT,
+                    first_commands TEXT, xfail TEXT, PRIMARY KEY (test_name, number));
+                CREATE TABLE IF NOT EXISTS steps (test_name TEXT, testrun_number INTEGER, position INTEGER, text TEXT,
+                    PRIMARY KEY (test_name, testrun_number, position));
+            ''')
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=60)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
+
+    @staticmethod
+    def get_new_steps(steps, start):
+        if hasattr(steps, 'get_steps'):
+            return steps.get_steps(start)
+        return list(steps)[start:]
+
+    def save_test(self, test, logs_paths, status):
+        with self._lock, closing(self.connect()) as connection, connection:
+            connection.execute('INSERT OR REPLACE INTO tests VALUES (?, ?, ?, ?, ?, ?, ?)',
+                               (test.name, test.testrail_case_id, test.group_name, int(bool(test.secured)),
+                                json.dumps(logs_paths), status, time.time()))
+            for number, testrun in enumerate(test.testruns):
+                connection.execute('INSERT OR REPLACE INTO testruns VALUES (?, ?, ?, ?, ?, ?)',
+                                   (test.name, number, json.dumps(testrun.jobs), testrun.error,
+                                    json.dumps(testrun.first_commands), testrun.xfail))
+                # the last saved step gets its duration only when the next one is recorded, so it's saved again
+                start = max(0, self.saved_steps.get((test.name, number), 0) - 1)
+                steps = self.get_new_steps(testrun.steps, start)
+                connection.executemany('INSERT OR REPLACE INTO steps VALUES (?, ?, ?, ?)',
+                                       [(test.name, number, start + index, text) for index, text in enumerate(steps)])
+                self.saved_steps[(test.name, number)] = start + len(steps)
+
+    def get_version(self):
+        """Changes whenever any test is saved"""
+        with closing(self.connect()) as connection:
+            return connection.execute('SELECT COUNT(*), MAX(updated_at) FROM tests').fetchone()
+
+    def get_tests(self, status=None, group_name=None, testrail_case_id=None):
+        conditions, args = list(), list()
+        for column, value in ('status', status), ('group_name', group_name), ('testrail_case_id', testrail_case_id):
+            if value is not None:
+                conditions.append('%s = ?' % column)
+                args.append(value)
+        where = ' WHERE %s' % ' AND '.join(conditions) if conditions else ''
+        names = 'SELECT name FROM tests%s' % where
+        with closing(self.connect()) as connection:
+            tests = connection.execute('SELECT name, testrail_case_id, group_name, secured, logs_paths FROM tests%s '
+                                       'ORDER BY name' % where, args).fetchall()
+            testruns = connection.execute('SELECT test_name, number, jobs, error, first_commands, xfail FROM testruns '
+                                          'WHERE test_name IN (%s) ORDER BY test_name, number' % names,
+                                          args).fetchall()
+            steps = connection.execute('SELECT test_name, testrun_number, text FROM steps WHERE test_name IN (%s) '
+                                       'ORDER BY test_name, testrun_number, position' % names, args).fetchall()
+        steps_by_testrun = dict()
+        for test_name, number, text in steps:
+            steps_by_testrun.setdefault((test_name, number), list()).append(text)
+        testruns_by_test = dict()
+        for test_name, number, jobs, error, first_commands, xfail in testruns:
+            testruns_by_test.setdefault(test_name, list()).append(SingleTestData.TestRunData(
+                steps=steps_by_testrun.get((test_name, number), list()),
+                jobs=json.loads(jobs),
+                error=error,
+                first_commands=json.loads(first_commands),
+                xfail=xfail))
+        return [SingleTestData(name=name,
+                               logs_paths=json.loads(logs_paths),
+                               testruns=testruns_by_test.get(name, list()),
+                               testrail_case_id=testrail_case_id,
+                               grop_name=group,
+                               secured=bool(secured))
+                for name, testrail_case_id, group, secured, logs_paths in tests]
@@ -0,0 +1,135 @@
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+
+import requests
+
+
+class SauceAdmission(object):
+    """
+    Admits new SauceLabs sessions only when the account has free concurrency.
+    Sessions in flight are counted across all xdist workers of the run in a state file guarded by `flock`,
+    waiting requests are granted by priority (number of devices a group needs) and then in FIFO order.
+    Sessions started by other runs on the same account are taken into account by polling the concurrency API.
+    """
+    default_concurrency = 16
+    api_poll_interval = 30
+
+    def __init__(self, username, access_key, apibase, concurrency=None, state_dir=tempfile.gettempdir()):
+        self.username = username
+        self.access_key = access_key
+        self.apibase = apibase
+        self.concurrency = int(concurrency) if concurrency else None
+        run_id = os.environ.get('PYTEST_XDIST_TESTRUNUID', 'pid%s' % os.getpid())
+        self.state_path = os.path.join(state_dir, 'sauce_admission_%s.json' % run_id)
+        self.worker = '%s:%s' % (os.environ.get('PYTEST_XDIST_WORKER', 'master'), os.getpid())
+
+    @contextmanager
+    def state(self):
+        with open(self.state_path, 'a+') as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                state_file.seek(0)
+                content = state_file.read()
+                state = json.loads(content) if content else dict()
+                state.setdefault('in_flight', dict())
+                state.setdefault('queue', list())
+                state.setdefault('external', {'sessions': 0, 'updated_at': 0})
+                state.setdefault('allowed', None)
+                yield state
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(json.dumps(state))
+            finally:
+                fcntl.flock(state_file, fcntl.LOCK_UN)
+
+    def get_account_concurrency(self):
+        """Returns (allowed, currently running) virtual machines of the organization"""
+        url = 'https://api.%s/rest/v1.2/users/%s/concurrency' % (self.apibase, self.username)
+        response = requests.get(url, auth=(self.username, self.access_key), timeout=10)
+        response.raise_for_status()
+        organization = response.json()['concurrency']['organization']
+        return organization['allowed']['vms'], organization['current']['vms']
+
+    def _update_account_state(self, state):
+        if time.time() - state['external']['updated_at'] < self.api_poll_interval:
+            return
+        state['external']['updated_at'] = time.time()
+        try:
+            allowed, current = self.get_account_concurrency()
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            logging.info("Can't get SauceLabs concurrency, only sessions of this run are counted: %s" % e)
+            return
+        state['allowed'] = allowed
+        state['external']['sessions'] = max(0, current - sum(state['in_flight'].values()))
+
+    @staticmethod
+    def _drop_dead_workers(state):
+        for worker in list(state['in_flight']):
+            try:
+                os.kill(int(worker.split(':')[-1]), 0)
+            except (ProcessLookupError, ValueError):
+                del state['in_flight'][worker]
+        state['queue'] = [ticket for ticket in state['queue'] if ticket['worker'] in state['in_flight']]
+
+    def get_allowed(self, state):
+        return self.concurrency or state['allowed'] or self.default_concurrency
+
+    def get_capacity(self, state):
+        return self.get_allowed(state) - state['external']['sessions'] - sum(state['in_flight'].values())
+
+    def try_acquire(self, ticket):
+        with self.state() as state:
+            state['in_flight'].setdefault(self.worker, 0)
+            self._drop_dead_workers(state)
+            self._update_account_state(state)
+            if ticket['id'] not in [queued['id'] for queued in state['queue']]:
+                state['queue'].append(ticket)
+            state['queue'].sort(key=lambda queued: (-queued['priority'], queued['enqueued_at']))
+            # a group bigger than the whole concurrency can only start alone
+            needed = min(ticket['quantity'], self.get_allowed(state))
+            if state['queue'][0]['id'] == ticket['id'] and self.get_capacity(state) >= needed:
+                state['queue'].pop(0)
+                state['in_flight'][self.worker] += ticket['quantity']
+                return True
+            return False
+
+    def new_ticket(self, quantity, priority=None):
+        return {'id': uuid.uuid4().hex, 'worker': self.worker, 'quantity': quantity,
+                'priority': quantity if priority is None else priority, 'enqueued_at': time.time()}
+
+    def cancel(self, ticket):
+        with self.state() as state:
+            state['queue'] = [queued for queued in state['queue'] if queued['id'] != ticket['id']]
+
+    def acquire_now(self, quantity=1, priority=None):
+        """Returns True if `quantity` sessions can be started right away, then they are counted as in flight"""
+        ticket = self.new_ticket(quantity, priority)
+        if self.try_acquire(ticket):
+            return True
+        self.cancel(ticket)
+        return False
+
+    def acquire_blocking(self, quantity=1, priority=None, poll_frequency=2, max_poll_frequency=15):
+        """
+        Waits until `quantity` sessions can be started. Sessions the worker keeps meanwhile hold slots
+        other workers may be waiting for, so they should be quit before.
+        """
+        ticket = self.new_ticket(quantity, priority)
+        interval = poll_frequency
+        try:
+            while not self.try_acquire(ticket):
+                time.sleep(interval)
+                interval = min(interval * 1.5, max_poll_frequency)
+        except BaseException:
+            self.cancel(ticket)
+            raise
+
+    def release(self, quantity=1):
+        with self.state() as state:
+            state['in_flight'][self.worker] = max(0, state['in_flight'].get(self.worker, 0) - quantity)
@@ -0,0 +1,204 @@
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import aiohttp
+
+
+class SauceApi(object):
+    """
+    Asynchronous SauceLabs REST client with one pooled HTTP session.
+    Requests are run in an event loop of a background thread, so tests only wait for results they need:
+    job updates are queued and sent in the background, updates of the same job are sent in order and the ones
+    which are not sent yet are merged. `base_url` may point to a local stub server.
+    """
+    connections_limit = 20
+    request_timeout = 30
+    # only positive lookups are cached: files are removed from the storage by retention, not by tests
+    storage_index_ttl = 3600
+
+    def __init__(self, username, access_key, apibase, base_url=None, cache_dir=tempfile.gettempdir()):
+        self.username = username
+        self.access_key = access_key
+        self.base_url = (base_url if base_url else 'https://api.%s' % apibase).rstrip('/')
+        self.storage_index_path = os.path.join(cache_dir, 'sauce_storage_%s.json' % (apibase or 'local'))
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._lock = threading.Lock()
+        self._pending_updates = dict()
+        self._job_locks = dict()
+        self._futures = set()
+
+    @property
+    def loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='sauce-api', daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coroutine):
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def run(self, coroutine, timeout=None):
+        # raises concurrent.futures.TimeoutError, which is not asyncio.TimeoutError before Python 3.11
+        return self.submit(coroutine).result(timeout)
+
+    async def get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth(self.username or '', self.access_key or ''),
+                connector=aiohttp.TCPConnector(limit=self.connections_limit),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout))
+        return self._session
+
+    async def request(self, method, path, **kwargs):
+        """Returns (status, parsed JSON body or None)"""
+        session = await self.get_session()
+        async with session.request(method, self.base_url + path, **kwargs) as response:
+            try:
+                body = await response.json(content_type=None)
+            except ValueError:
+                body = None
+            return response.status, body
+
+    # Jobs
+
+    def update_job(self, job_id, **fields):
+        """Queues update of job fields (`name`, `passed`, ...), doesn't wait for it"""
+        with self._lock:
+            if job_id in self._pending_updates:
+                self._pending_updates[job_id].update(fields)
+                return
+            self._pending_updates[job_id] = dict(fields)
+        self.submit(self._send_job_update(job_id))
+
+    async def _send_job_update(self, job_id):
+        async with self._job_locks.setdefault(job_id, asyncio.Lock()):
+            with self._lock:
+                fields = self._pending_updates.pop(job_id)
+            try:
+                status, _ = await self.request('PUT', '/rest/v1/%s/jobs/%s' % (self.username, job_id), json=fields)
+                if status >= 400:
+                    logging.info("SauceLabs job %s is not updated, status %s" % (job_id, status))
+            except (aiohttp.ClientError, asyncio.TimeoutError, concurrent.futures.TimeoutError) as e:
+                logging.info("SauceLabs job %s is not updated: %s" % (job_id, e))
+
+    async def _get_job_commands(self, job_id, timeout, poll_frequency):
+        url = '/rest/v1/%s/jobs/%s/assets/log.json' % (self.username, job_id)
+        end_time = time.time() + timeout
+        while True:
+            try:
+                status, commands = await self.request('GET', url)
+                if status == 200 and isinstance(commands, list):
+                    return commands
+            except (aiohttp.ClientError, asyncio.TimeoutError, concurrent.futures.TimeoutError):
+                pass
+            if time.time() + poll_frequency > end_time:
+                return None
+            await asyncio.sleep(poll_frequency)
+
+    async def _get_jobs_commands(self, job_ids, timeout, poll_frequency):
+        commands = await asyncio.gather(*[self._get_job_commands(job_id, timeout, poll_frequency)
+                                          for job_id in job_ids])
+        return dict(zip(job_ids, commands))
+
+    def get_jobs_commands(self, job_ids, timeout=60, poll_frequency=2):
+        """
+        Polls command logs (log.json) of finished jobs at once, returns them by job id.
+        Logs which are not available in `timeout` seconds are None.
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return dict()
+        return self.run(self._get_jobs_commands(job_ids, timeout, poll_frequency))
+
+    # Storage
+
+    def _read_storage_index(self):
+        try:
+            with open(self.storage_index_path) as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError):
+            return dict()
+        return {name: checked_at for name, checked_at in index.items()
+                if time.time() - checked_at < self.storage_index_ttl}
+
+    def _write_storage_index(self, index):
+        path = '%s.%s' % (self.storage_index_path, os.getpid())
+        try:
+            with open(path, 'w') as index_file:
+                json.dump(index, index_file)
+            os.replace(path, self.storage_index_path)
+        except OSError:
+            pass
+
+    def add_to_storage_index(self, file_name):
+        index = self._read_storage_index()
+        index[file_name] = time.time()
+        self._write_storage_index(index)
+
+    async def _find_storage_file(self, file_name):
+        status, body = await self.request('GET', '/v1/storage/files', params={'q': file_name, 'per_page': 100})
+        if status != 200 or not body:
+            return False
+        return any(item.get('name') == file_name for item in body.get('items', list()))
+
+    def is_uploaded(self, file_name):
+        """Looks up the file in the cached storage index first, then searches the storage by name"""
+        if file_name in self._read_storage_index():
+            return True
+        try:
+            found = self.run(self._find_storage_file(file_name), timeout=self.request_timeout * 2)
+        except (aiohttp.ClientError, asyncio.TimeoutError, concurrent.futures.TimeoutError):
+            return False
+        if found:
+            self.add_to_storage_index(file_name)
+        return found
+
+    # Shutdown
+
+    def flush(self, timeout=60):
+        """Waits for queued requests to be sent"""
+        end_time = time.time() + timeout
+        while True:
+            with self._lock:
+                futures = list(self._futures)
+            if not futures:
+                return
+            for future in futures:
+                try:
+                    future.result(max(0, end_time - time.time()))
+                except Exception:
+                    pass
+            if time.time() >= end_time:
+                return
+
+    def close(self, timeout=60):
+        if self._loop is None:
+            return
+        self.flush(timeout)
+        if self._session is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result(10)
+            except Exception:
+                pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(10)
+        self._loop.close()
+        self._loop, self._thread, self._session = None, None, None
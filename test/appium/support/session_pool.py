@@ -0,0 +1,120 @@
+import json
+import logging
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from support.test_rerun import should_rerun_test
+
+
+def get_capabilities_key(capabilities):
+    """Sessions are interchangeable if capabilities are equal apart from the SauceLabs job name"""
+    if hasattr(capabilities, 'to_capabilities'):
+        capabilities = capabilities.to_capabilities()
+    capabilities = dict(capabilities)
+    if isinstance(capabilities.get('sauce:options'), dict):
+        capabilities['sauce:options'] = {key: value for key, value in capabilities['sauce:options'].items()
+                                         if key != 'name'}
+    return json.dumps(capabilities, sort_keys=True, default=str)
+
+
+class PooledSession(object):
+    def __init__(self, driver, key):
+        self.driver = driver
+        self.key = key
+        self.uses = 1
+        self.created_at = time.time()
+        # names of test classes/tests the session was used by, for the SauceLabs job name
+        self.names = list()
+
+    @property
+    def age(self):
+        return time.time() - self.created_at
+
+
+class SessionPool(object):
+    """
+    Warm Appium sessions of this worker, reused by the next test class with the same capabilities.
+    Between uses the app is terminated, its data is cleared and it's started again, which is what a new session does
+    with `noReset` off. Capabilities include the app, so a session is never reused with another APK.
+    Sessions are quit instead of being reused after `max_reuse` uses, when they are older than `max_age` seconds,
+    fail the health check or were used by a test which failed with one of `RERUN_ERRORS`.
+    """
+
+    def __init__(self, max_reuse=1, max_age=2400):
+        self.max_reuse = max_reuse
+        self.max_age = max_age
+        self.idle = list()
+        self.sessions = dict()
+
+    @property
+    def enabled(self):
+        return self.max_reuse > 1
+
+    def acquire(self, key, quantity=1):
+        """Returns up to `quantity` warm sessions for capabilities key, each with the app in its initial state"""
+        drivers = list()
+        for session in [session for session in self.idle if session.key == key]:
+            if len(drivers) == quantity:
+                break
+            self.idle.remove(session)
+            try:
+                self.reset_app(session.driver)
+            except WebDriverException as e:
+                logging.info("Session %s is dropped from the pool: %s" % (session.driver.session_id, e))
+                self.sessions.pop(session.driver.session_id, None)
+                self.quit(session.driver)
+                continue
+            session.uses += 1
+            drivers.append(session.driver)
+        return drivers
+
+    def add(self, driver, key):
+        self.sessions[driver.session_id] = PooledSession(driver, key)
+
+    def finish(self, driver):
+        """Forgets the session which is going to be quit, returns names of tests it was used by"""
+        session = self.sessions.pop(driver.session_id, None)
+        return session.names if session else list()
+
+    def release(self, driver, name, errors=()):
+        """Returns True if the session is kept for reuse, otherwise it should be finished by the caller"""
+        session = self.sessions.get(driver.session_id)
+        if not session:
+            return False
+        session.names.append(name)
+        if not self.enabled or session.uses >= self.max_reuse or session.age >= self.max_age \
+                or any(error and should_rerun_test(error) for error in errors) or not self.is_healthy(driver):
+            return False
+        self.idle.append(session)
+        return True
+
+    def drain(self):
+        """Returns drivers of all idle sessions, which are not reused anymore"""
+        drivers = [session.driver for session in self.idle]
+        self.idle = list()
+        return drivers
+
+    @staticmethod
+    def get_app_id(driver):
+        return driver.capabilities.get('appPackage') or driver.current_package
+
+    @staticmethod
+    def is_healthy(driver):
+        try:
+            return bool(driver.current_package)
+        except WebDriverException:
+            return False
+
+    def reset_app(self, driver):
+        app_id = self.get_app_id(driver)
+        driver.terminate_app(app_id)
+        driver.execute_script('mobile: clearApp', {'appId': app_id})
+        driver.activate_app(app_id)
+
+    @staticmethod
+    def quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
@@ -0,0 +1,86 @@
+import json
+import tempfile
+import threading
+import time
+
+
+class StepRecorder(object):
+    """
+    Test run steps kept as compact (timestamp, device, kind, text, args) records.
+    Text is formatted only when steps are read for a report, each step gets the time until the next one as duration.
+    Only the latest `max_steps_in_memory` records are kept in memory, older ones are spilled to a temporary file.
+    """
+    max_steps_in_memory = 2000
+    # steps which took longer are shown with their duration in reports
+    slow_step_seconds = 1
+
+    def __init__(self):
+        self._records = list()
+        self._spill_file = None
+        self._spilled_count = 0
+        self._lock = threading.Lock()
+
+    def append(self, text: str, *args, device=None, kind='info'):
+        with self._lock:
+            self._records.append((time.time(), device, kind, text, args))
+            if len(self._records) > self.max_steps_in_memory:
+                self._spill(self._records[:self.max_steps_in_memory // 2])
+                del self._records[:self.max_steps_in_memory // 2]
+
+    def _spill(self, records):
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self._spill_file.seek(0, 2)
+        for timestamp, device, kind, text, args in records:
+            self._spill_file.write(json.dumps([timestamp, device, kind, self.format_text(text, args)]) + '\n')
+        self._spilled_count += len(records)
+
+    @staticmethod
+    def format_text(text, args):
+        return text % args if args else text
+
+    def records(self):
+        """Yields (timestamp, device, kind, text) for all steps, spilled ones first"""
+        with self._lock:
+            records = list(self._records)
+            if self._spill_file:
+                self._spill_file.seek(0)
+                spilled = [json.loads(line) for line in self._spill_file]
+            else:
+                spilled = list()
+        for timestamp, device, kind, text in spilled:
+            yield timestamp, device, kind, text
+        for timestamp, device, kind, text, args in records:
+            yield timestamp, device, kind, self.format_text(text, args)
+
+    def get_steps(self, start=0):
+        """Steps formatted for reports, with durations of slow steps, from the step with index `start`"""
+        steps = list()
+        previous = None
+        for index, record in enumerate(self.records()):
+            if previous and index > start:
+                steps.append(self.format_step(previous, record[0] - previous[0]))
+            previous = record
+        if previous and len(self) > start:
+            steps.append(self.format_step(previous, None))
+        return steps
+
+    def format_step(self, record, duration):
+        _, device, _, text = record
+        if device is not None:
+            text = 'Device %s: %s ' % (device, text)
+        if duration is not None and duration >= self.slow_step_seconds:
+            text += '(%.1fs)' % duration
+        return text
+
+    def __iter__(self):
+        return iter(self.get_steps())
+
+    def __len__(self):
+        return self._spilled_count + len(self._records)
+
+    def __bool__(self):
+        return bool(len(self))
+
+    def __getitem__(self, item):
+        return self.get_steps()[item]
@@ -1,5 +1,7 @@
 from typing import Dict
 
+from support.step_recorder import StepRecorder
+
 
 class SingleTestData(object):
     def __init__(self, name, testruns, testrail_case_id, logs_paths, grop_name, secured):
@@ -19,7 +21,7 @@ class SingleTestData(object):
             self.xfail = xfail
 
     def create_new_testrun(self):
-        self.testruns.append(SingleTestData.TestRunData(list(), dict(), None, dict(), xfail=''))
+        self.testruns.append(SingleTestData.TestRunData(StepRecorder(), dict(), None, dict(), xfail=''))
 
 
 class TestSuiteData(object):
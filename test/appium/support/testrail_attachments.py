@@ -0,0 +1,57 @@
+import gzip
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def compress(path, directory):
+    """Path of the gzipped copy of the file in `directory`, files which are gzipped already are used as is"""
+    if path.endswith('.gz'):
+        return path
+    compressed_path = os.path.join(directory, os.path.basename(path) + '.gz')
+    with open(path, 'rb') as source, gzip.open(compressed_path, 'wb', compresslevel=6) as target:
+        shutil.copyfileobj(source, target, 1024 * 1024)
+    return compressed_path
+
+
+class AttachmentUploader(object):
+    """
+    Uploads files to TestRail results at once with at most `max_workers` uploads in flight.
+    Files are gzipped before upload. Uploads are not retried here: TestrailClient retries them on connection errors
+    and 429 only, as after a read error the file may be attached already.
+    """
+
+    def __init__(self, add_attachment, max_workers=4):
+        self.add_attachment = add_attachment
+        self.max_workers = max_workers
+
+    def upload(self, result_id, path):
+        try:
+            return self.add_attachment(method='add_attachment_to_result/%s' % result_id, path=path)
+        except requests.exceptions.RequestException as e:
+            logging.warning("Attachment %s is not uploaded to result %s: %s" % (path, result_id, e))
+
+    def upload_all(self, attachments):
+        """Uploads (result id, file path) pairs, returns responses in the same order, None for missing files"""
+        if not attachments:
+            return list()
+        with tempfile.TemporaryDirectory(prefix='testrail_attachments_') as directory, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # the same logs may be attached to several results, e.g. logs of a class which setup failed
+            paths = sorted(set(path for _, path in attachments))
+            compressed = dict(zip(paths, executor.map(lambda path: self.compress(path, directory), paths)))
+            futures = [executor.submit(self.upload, result_id, compressed[path]) if compressed[path] else None
+                       for result_id, path in attachments]
+            return [future.result() if future else None for future in futures]
+
+    @staticmethod
+    def compress(path, directory):
+        try:
+            # own directory for each file: files from different directories may have the same name
+            return compress(path, tempfile.mkdtemp(dir=directory))
+        except FileNotFoundError:
+            return None
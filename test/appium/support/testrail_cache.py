@@ -0,0 +1,53 @@
+import json
+import os
+import time
+
+
+class CachedItem(object):
+    def __init__(self, data, fetched_at, checked_at):
+        self.data = data
+        # when data was fetched completely and when it was last revalidated
+        self.fetched_at = fetched_at
+        self.checked_at = checked_at
+
+    @property
+    def age(self):
+        return time.time() - self.checked_at
+
+    @property
+    def full_age(self):
+        return time.time() - self.fetched_at
+
+
+class TestrailCache(object):
+    """
+    TestRail data kept in JSON files between runs, shared by all processes of the machine.
+    Readers decide what is fresh enough by the age of items; writes are atomic.
+    """
+
+    def __init__(self, directory=os.path.join(os.path.expanduser('~'), '.cache', 'status-e2e', 'testrail')):
+        self.directory = directory
+
+    def get_path(self, key):
+        return os.path.join(self.directory, '%s.json' % key)
+
+    def load(self, key):
+        try:
+            with open(self.get_path(key)) as cache_file:
+                item = json.load(cache_file)
+            return CachedItem(item['data'], item['fetched_at'], item['checked_at'])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, key, data, fetched_at=None, checked_at=None):
+        now = time.time()
+        item = {'data': data, 'fetched_at': fetched_at if fetched_at else now,
+                'checked_at': checked_at if checked_at else now}
+        temp_path = '%s.%s' % (self.get_path(key), os.getpid())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'w') as cache_file:
+                json.dump(item, cache_file)
+            os.replace(temp_path, self.get_path(key))
+        except OSError:
+            pass
@@ -0,0 +1,81 @@
+import json
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class TestrailRetry(Retry):
+    """
+    Retries idempotent requests on connection and read errors, 429 and 5xx. POST requests are retried only
+    on connection errors (nothing is sent) and on 429, which TestRail rejects without processing: after a read
+    error a result, a run or an attachment may be added already.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method and method.upper() == 'POST':
+            return status_code == 429
+        return super(TestrailRetry, self).is_retry(method, status_code, has_retry_after)
+
+
+class TestrailClient(object):
+    """
+    TestRail API v2 client with keep-alive connections, retries with backoff which honor `Retry-After`
+    and requests spaced to stay within the API rate limit. Thread-safe.
+    """
+    # TestRail Cloud allows 180 requests per minute
+    requests_per_minute = 180
+    timeout = 60
+
+    def __init__(self, url, user, password, pool_size=10):
+        self.url = url
+        self.api_url = self.url + 'api/v2/'
+        self.session = requests.Session()
+        self.session.auth = (user or '', password or '')
+        self.session.headers['x-api-ident'] = 'beta'
+        retry = TestrailRetry(total=5, backoff_factor=2, status_forcelist=(429, 500, 502, 503, 504),
+                              allowed_methods=Retry.DEFAULT_ALLOWED_METHODS, respect_retry_after_header=True,
+                              raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._lock = threading.Lock()
+        self._next_request_at = 0
+
+    def wait_for_rate_limit(self):
+        with self._lock:
+            now = time.time()
+            delay = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + 60 / self.requests_per_minute
+        if delay > 0:
+            time.sleep(delay)
+
+    def request(self, method, api_method, **kwargs):
+        self.wait_for_rate_limit()
+        return self.session.request(method, self.api_url + api_method, timeout=self.timeout, **kwargs)
+
+    def get(self, method):
+        rval = self.request('GET', method).json()
+        if 'error' in rval:
+            logging.error("Failed TestRail request: %s" % rval['error'])
+        return rval
+
+    def get_all(self, method, key):
+        """Items of all pages of a bulk request, e.g. `get_all('get_tests/1', 'tests')`"""
+        items = list()
+        while method:
+            page = self.get(method)
+            if isinstance(page, list):
+                # API without pagination
+                return page
+            items.extend(page[key])
+            next_page = (page.get('_links') or dict()).get('next')
+            method = next_page.split('api/v2/', 1)[-1] if next_page else None
+        return items
+
+    def post(self, method, data):
+        data = bytes(json.dumps(data), 'utf-8')
+        return self.request('POST', method, data=data, headers={'Content-Type': 'application/json'}).json()
@@ -1,19 +1,28 @@
-import base64
 import itertools
-import json
-import logging
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 from os import environ
 from sys import argv
 
 import emoji
-import requests
 
 from support.base_test_report import BaseTestReport
+from support.testrail_attachments import AttachmentUploader
+from support.testrail_cache import TestrailCache
+from support.testrail_client import TestrailClient
 
 
 class TestrailReport(BaseTestReport):
+    # cached cases, milestones and runs are used without requests while they are younger than TTL,
+    # then only changes since they were checked are requested
+    cases_ttl = 3600
+    # full refetch, as deleted cases are not returned as changes
+    cases_max_age = 24 * 3600
+    milestones_ttl = 3600
+    runs_ttl = 120
+    # difference between TestRail and local clocks
+    clock_skew = 300
 
     def __init__(self):
         super(TestrailReport, self).__init__()
@@ -30,30 +39,23 @@ class TestrailReport(BaseTestReport):
             'passed': 1,
             'undefined_fail': 10}
 
-        self.headers = dict()
-        self.headers['Authorization'] = 'Basic %s' % str(
-            base64.b64encode(bytes('%s:%s' % (self.user, self.password), 'utf-8')), 'ascii').strip()
-        self.headers['Content-Type'] = 'application/json'
-        self.headers['x-api-ident'] = 'beta'
-
         self.url = 'https://ethstatus.testrail.net/index.php?/'
         self.api_url = self.url + 'api/v2/'
+        self.client = TestrailClient(self.url, self.user, self.password)
+        self.cache = TestrailCache()
+        # tests and results of runs by run id, requested again only after results are added
+        self.run_tests = dict()
+        self.run_results = dict()
 
     def get(self, method):
-        rval = requests.get(self.api_url + method, headers=self.headers).json()
-        if 'error' in rval:
-            logging.error("Failed TestRail request: %s" % rval['error'])
-        return rval
+        return self.client.get(method)
 
     def post(self, method, data):
-        data = bytes(json.dumps(data), 'utf-8')
-        return requests.post(self.api_url + method, data=data, headers=self.headers).json()
+        return self.client.post(method, data)
 
     def add_attachment(self, method, path):
-        files = {'attachment': (open(path, 'rb'))}
-        result = requests.post(self.api_url + method, headers={'Authorization': self.headers['Authorization']},
-                               files=files)
-        files['attachment'].close()
+        with open(path, 'rb') as attachment:
+            result = self.client.request('POST', method, files={'attachment': attachment})
         try:
             return result.json()
         except JSONDecodeError:
@@ -63,13 +65,60 @@ class TestrailReport(BaseTestReport):
         return self.get('get_suites/%s' % self.project_id)
 
     def get_tests(self):
-        return self.get('get_tests/%s' % self.run_id)['tests']
+        return self.get_run_tests(self.run_id)
+
+    def get_run_tests(self, run_id):
+        if run_id not in self.run_tests:
+            self.run_tests[run_id] = self.client.get_all('get_tests/%s' % run_id, 'tests')
+        return self.run_tests[run_id]
+
+    def get_results_index(self, run_id):
+        """Results of the run by case id, from one bulk request"""
+        if run_id not in self.run_results:
+            case_ids = {test['id']: test['case_id'] for test in self.get_run_tests(run_id)}
+            index = dict()
+            for result in self.client.get_all('get_results_for_run/%s' % run_id, 'results'):
+                index.setdefault(case_ids.get(result['test_id']), list()).append(result)
+            self.run_results[run_id] = index
+        return self.run_results[run_id]
 
     def get_milestones(self):
-        return self.get('get_milestones/%s' % self.project_id)['milestones']
+        key = 'milestones_%s' % self.project_id
+        cached = self.cache.load(key)
+        if cached and cached.age < self.milestones_ttl:
+            return cached.data
+        milestones = self.get('get_milestones/%s' % self.project_id)['milestones']
+        self.cache.save(key, milestones)
+        return milestones
+
+    def get_project_runs(self):
+        """Ids and names of runs of the project, newest first"""
+        key = 'runs_%s' % self.project_id
+        cached = self.cache.load(key)
+        if cached and cached.age < self.runs_ttl:
+            return cached.data
+        checked_at = time.time()
+        method = 'get_runs/%s' % self.project_id
+        runs = dict()
+        if cached:
+            # run numbers of PRs are counted from this list, so all runs are requested when there is no cache
+            runs = {run['id']: run for run in cached.data}
+            method += '&created_after=%d' % (cached.checked_at - self.clock_skew)
+        for run in self.client.get_all(method, 'runs'):
+            runs[run['id']] = {'id': run['id'], 'name': run['name']}
+        runs = sorted(runs.values(), key=lambda run: run['id'], reverse=True)
+        self.cache.save(key, runs, cached.fetched_at if cached else checked_at, checked_at)
+        return runs
+
+    def add_run_to_cache(self, run):
+        key = 'runs_%s' % self.project_id
+        cached = self.cache.load(key)
+        if cached:
+            runs = [{'id': run['id'], 'name': run['name']}] + [i for i in cached.data if i['id'] != run['id']]
+            self.cache.save(key, runs, cached.fetched_at, cached.checked_at)
 
     def get_runs(self, pr_number):
-        return [i for i in self.get('get_runs/%s' % self.project_id)['runs'] if 'PR-%s ' % pr_number in i['name']]
+        return [i for i in self.get_project_runs() if 'PR-%s ' % pr_number in i['name']]
 
     def get_run(self, run_id: int):
         return self.get('get_run/%s' % run_id)
@@ -91,17 +140,33 @@ class TestrailReport(BaseTestReport):
         run = self.post('add_run/%s' % self.project_id, request_body)
         try:
             self.run_id = run['id']
+            # xdist workers get the run name from the cache right after that
+            self.add_run_to_cache(run)
         except KeyError:
             print("TestRail error when creating a run: %s" % run)
         print("Testrun: %sruns/view/%s" % (self.url, self.run_id))
 
+    def get_section_cases(self, section_id):
+        key = 'cases_%s_%s_%s' % (self.project_id, self.suite_id, section_id)
+        method = 'get_cases/%s&suite_id=%s&section_id=%s' % (self.project_id, self.suite_id, section_id)
+        cached = self.cache.load(key)
+        if cached and cached.age < self.cases_ttl:
+            return cached.data
+        checked_at = time.time()
+        if cached and cached.full_age < self.cases_max_age and not self.client.get_all(
+                '%s&updated_after=%d' % (method, cached.checked_at - self.clock_skew), 'cases'):
+            self.cache.save(key, cached.data, cached.fetched_at, checked_at)
+            return cached.data
+        cases = self.client.get_all(method, 'cases')
+        self.cache.save(key, cases, checked_at, checked_at)
+        return cases
+
     def get_cases(self, section_ids):
-        test_cases = list()
-        for section_id in section_ids:
-            test_cases.append(
-                self.get('get_cases/%s&suite_id=%s&section_id=%s' % (self.project_id, self.suite_id, section_id))[
-                    'cases'])
-        return itertools.chain.from_iterable(test_cases)
+        section_ids = list(section_ids)
+        if not section_ids:
+            return iter(list())
+        with ThreadPoolExecutor(max_workers=len(section_ids)) as executor:
+            return itertools.chain.from_iterable(list(executor.map(self.get_section_cases, section_ids)))
 
     def get_regression_cases(self):
         test_cases = dict()
@@ -136,15 +201,13 @@ class TestrailReport(BaseTestReport):
                 case_ids = value.split(',')
         if len(case_ids) == 0:
             if 'smoke' in argv:
-                for category in test_cases['pr']:
-                    for case in self.get_cases([test_cases['pr'][category]]):
-                        case_ids.append(case['id'])
+                for case in self.get_cases(test_cases['pr'].values()):
+                    case_ids.append(case['id'])
                 case_ids.extend([703133, 702742, 702745, 702843])
             # elif 'nightly' in argv:
             else:
-                for category in test_cases['nightly']:
-                    for case in self.get_cases([test_cases['nightly'][category]]):
-                        case_ids.append(case['id'])
+                for case in self.get_cases(test_cases['nightly'].values()):
+                    case_ids.append(case['id'])
         return case_ids
 
     def add_results(self):
@@ -189,36 +252,30 @@ class TestrailReport(BaseTestReport):
                  'status_id': self.outcomes['undefined_fail'] if last_testrun.error else self.outcomes['passed'],
                  'comment': comment})
 
+        try:
+            case_ids = {test['id']: test['case_id'] for test in self.get_run_tests(self.run_id)}
+        except KeyError:
+            case_ids = dict()
         results = self.post('add_results_for_cases/%s' % self.run_id, data={"results": data})
+        self.run_tests.pop(self.run_id, None)
+        self.run_results.pop(self.run_id, None)
         try:
             results[0]
         except (IndexError, KeyError):
             print("Got TestRail error when adding results: \n%s" % results)
+            results = list()
 
+        result_ids = dict()
+        for data_item, result in zip(data, results):
+            # results are returned in the order they were sent, test ids are checked when they are known
+            result_ids[case_ids.get(result.get('test_id'), data_item['case_id'])] = result['id']
+        attachments = list()
         for test in all_tests:
             last_testrun = test.testruns[-1]
-            if last_testrun.error:
-                try:
-                    device = list(last_testrun.jobs.keys())[0]
-                except IndexError:
-                    continue
-                for res in results:
-                    if last_testrun.first_commands:
-                        try:
-                            pattern = r"%s\?auth=.*#%s" % (device, str(last_testrun.first_commands[device]))
-                        except KeyError:
-                            pattern = device
-                    else:
-                        pattern = device
-                    if re.findall(pattern, res['comment']):
-                        res_id = res['id']
-                        try:
-                            for log in test.logs_paths.keys():
-                                self.add_attachment(method='add_attachment_to_result/%s' % str(res_id),
-                                                    path=test.logs_paths[log])
-                        except (AttributeError, FileNotFoundError):
-                            pass
-                        break
+            if last_testrun.error and last_testrun.jobs and test.testrail_case_id in result_ids \
+                    and isinstance(test.logs_paths, dict):
+                attachments.extend((result_ids[test.testrail_case_id], path) for path in test.logs_paths.values())
+        AttachmentUploader(self.add_attachment).upload_all(attachments)
 
         self.change_test_run_description()
 
@@ -282,7 +339,7 @@ class TestrailReport(BaseTestReport):
         return self.post('update_run/%s' % self.run_id, request_body)
 
     def get_run_results(self, test_run_id=None):
-        return self.get('get_results_for_run/%s' % (test_run_id if test_run_id else self.run_id))['results']
+        return self.client.get_all('get_results_for_run/%s' % (test_run_id if test_run_id else self.run_id), 'results')
 
     def is_run_successful(self):
         for test in self.get_run_results():
@@ -293,7 +350,7 @@ class TestrailReport(BaseTestReport):
 
     def get_test_result_link(self, test_run_id, test_case_id):
         try:
-            test_id = self.get('get_results_for_case/%s/%s' % (test_run_id, test_case_id))['results'][0]['test_id']
+            test_id = self.get_results_index(test_run_id)[test_case_id][0]['test_id']
             return '%stests/view/%s' % (self.url, test_id)
         except (KeyError, JSONDecodeError):
             print('Cannot extract result for %s e2e' % test_case_id)
@@ -301,8 +358,8 @@ class TestrailReport(BaseTestReport):
 
     def get_not_executed_tests(self, test_run_id):
         try:
-            results = self.get("get_tests/%s&status_id=3" % test_run_id)
-            return [result['case_id'] for result in results["tests"]]
+            # status 3 is "Untested"
+            return [test['case_id'] for test in self.get_run_tests(test_run_id) if test['status_id'] == 3]
         except KeyError:
             print('Cannot extract result for %s' % test_run_id)
             pass
@@ -3,7 +3,7 @@ import functools
 import json
 import logging
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from urllib3.exceptions import MaxRetryError
@@ -12,31 +12,133 @@ from support.appium_container import AppiumContainer
 from support.test_data import TestSuiteData
 
 
-async def start_threads(test_name: str, quantity: int, func: type, returns: dict, **kwargs):
+# drivers are created in their own threads, so late sessions can be quit even when the event loop is not running
+_driver_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix='driver')
+
+
+def _quit_created(future):
+    if not future.cancelled() and future.exception() is None:
+        try:
+            future.result().quit()
+        except Exception:
+            pass
+
+
+def _quit_when_created(future, on_finished=None):
+    # session which is created after its slot was cancelled or timed out is not needed anymore,
+    # `on_finished` is called when it's quit or its creation failed
+    def quit_driver(done):
+        _quit_created(done)
+        if on_finished:
+            on_finished()
+
+    future.add_done_callback(quit_driver)
+
+
+def _hand_over(future, release, late_sessions):
+    # the slot of the session is released by `release` only after the session is quit
+    late_sessions.append(future)
+    _quit_when_created(future, release)
+
+
+async def _abandon(future, grace, release, late_sessions):
+    """
+    Waits up to `grace` seconds for the session which is not needed anymore to be created and quits it.
+    Returns False if it's still being created: then it's handed over to be quit later.
+    """
+    future.cancel()
+    try:
+        await asyncio.wait([asyncio.wrap_future(future)], timeout=grace)
+    except asyncio.CancelledError:
+        _hand_over(future, release, late_sessions)
+        raise
+    if not future.done():
+        _hand_over(future, release, late_sessions)
+        return False
+    await asyncio.get_event_loop().run_in_executor(None, _quit_created, future)
+    return True
+
+
+async def _create_driver(test_name: str, index: int, func: type, timeout: int, retries: int, release=None,
+                         late_sessions=None, grace=120, **kwargs):
+    """
+    Creates the driver in up to `retries` attempts. A new attempt starts only after the session of the timed out one
+    is quit, so the index never has more than one session being created.
+    """
+    late_sessions = late_sessions if late_sessions is not None else list()
+    for attempt in range(retries):
+        future = _driver_executor.submit(func, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        except (MaxRetryError, asyncio.TimeoutError) as e:
+            print("%s when creating driver %s for %s, attempt %s" % (type(e).__name__, index + 1, test_name,
+                                                                      attempt + 1))
+            if isinstance(e, asyncio.TimeoutError) and not await _abandon(future, grace, release, late_sessions):
+                raise
+            if attempt == retries - 1:
+                raise
+            await asyncio.sleep(10 * (attempt + 1))
+        except asyncio.CancelledError:
+            _hand_over(future, release, late_sessions)
+            raise
+
+
+async def start_drivers(test_name: str, quantity: int, func: type, admission=None, setup=None, timeout=600,
+                        retries=3, **kwargs):
+    """
+    Creates `quantity` drivers concurrently, each with its own timeout and retry budget.
+    If one of them can't be created, the others are cancelled and already created ones are quit.
+    `setup(driver, index)` is run for all created drivers in parallel. Returns dict of drivers by index.
+    `admission` is SauceAdmission which admitted `quantity` sessions: slots of drivers which are not created
+    are released right away, slots of abandoned sessions which may still be created after they are quit,
+    the others on quit.
+    """
+    if not quantity:
+        return dict()
     loop = asyncio.get_event_loop()
-    #    from tests.conftest import sauce
-    #     for _ in range(60):
-    #         if 16 - len([job for job in sauce.jobs.get_user_jobs() if job['status'] == 'in progress']) < quantity:
-    #             time.sleep(10)
-    for i in range(quantity):
-        returns[i] = loop.run_in_executor(None, functools.partial(func, **kwargs))
-    for k in returns:
-        for _ in range(3):
+    late_sessions = list()
+    release = admission.release if admission else None
+    tasks = [loop.create_task(_create_driver(test_name, i, func, timeout, retries, release=release,
+                                             late_sessions=late_sessions, **kwargs))
+             for i in range(quantity)]
+    await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    for task in tasks:
+        task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    drivers = {i: result for i, result in enumerate(results) if not isinstance(result, BaseException)}
+    if admission:
+        for driver in drivers.values():
+            driver.admission = admission
+        admission.release(quantity - len(drivers) - len(late_sessions))
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        for driver in drivers.values():
             try:
-                returns[k] = await returns[k]
-                break
-            except MaxRetryError:
-                print("MaxRetryError when creating a driver for %s" % test_name)
-                time.sleep(10)
-    # for k in returns:
-    #     for _ in range(30):
-    #         try:
-    #             k.session_id
-    #             break
-    #         except AttributeError:
-    #             print("AttributeError when creating a driver for %s" % test_name)
-    #             time.sleep(3)
-    return returns
+                driver.quit()
+            except Exception:
+                pass
+        raise next((error for error in errors if not isinstance(error, asyncio.CancelledError)), errors[0])
+    if setup:
+        try:
+            await asyncio.gather(*[loop.run_in_executor(None, setup, driver, index)
+                                   for index, driver in drivers.items()])
+        except BaseException:
+            for driver in drivers.values():
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            raise
+    return drivers
+
+
+def run_for_each_driver(drivers: dict, func):
+    """Calls `func(driver)` for all drivers at once in separate threads, returns results by driver index"""
+    if len(drivers) < 2:
+        return {index: func(driver) for index, driver in drivers.items()}
+    with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+        futures = {index: executor.submit(func, driver) for index, driver in drivers.items()}
+        return {index: future.result() for index, future in futures.items()}
 
 
 async def run_in_parallel(funcs):
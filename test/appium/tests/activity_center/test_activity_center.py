@@ -4,6 +4,7 @@ import re
 import pytest
 from selenium.common.exceptions import TimeoutException
 
+from support.device_executor import Devices
 from tests import marks, run_in_parallel
 from tests.base_test_case import MultipleSharedDeviceTestCase, create_shared_drivers
 from tests.users import transaction_senders
@@ -22,12 +23,16 @@ class TestActivityCenterContactRequestMultipleDevicePR(MultipleSharedDeviceTestC
                                                                                    'username': self.username_1}),
                                                       (self.device_2.create_user, {'username': self.username_2}))))
         self.homes = self.home_1, self.home_2 = self.device_1.get_home_view(), self.device_2.get_home_view()
+        self.devices = Devices(self.homes)
         self.profile_1, self.profile_2 = self.home_1.get_profile_view(), self.home_2.get_profile_view()
         self.public_key_1 = self.home_1.get_public_key()
         self.profile_link_2 = self.home_2.get_link_to_profile()
         self.home_2.close_share_tab_button.click_until_absense_of_element(self.home_2.link_to_profile_button)
-        [home.navigate_back_to_home_view() for home in self.homes]
-        [home.chats_tab.click() for home in self.homes]
+        def _open_chats(home):
+            home.navigate_back_to_home_view()
+            home.chats_tab.click()
+
+        self.devices.all(_open_chats)
 
     @marks.testrail_id(702850)
     def test_activity_center_contact_request_decline(self):
@@ -249,10 +254,11 @@ class TestActivityMultipleDevicePR(MultipleSharedDeviceTestCase):
             run_in_parallel(((self.device_1.create_user, {'username': self.username_1}),
                              (self.device_2.create_user, {'username': self.username_2}))))
         self.homes = self.home_1, self.home_2 = self.device_1.get_home_view(), self.device_2.get_home_view()
+        self.devices = Devices(self.homes)
         self.profile_1, self.profile_2 = self.home_1.get_profile_view(), self.home_2.get_profile_view()
         self.public_key_2 = self.home_2.get_public_key()
         self.home_2.navigate_back_to_home_view()
-        [home.chats_tab.click() for home in self.homes]
+        self.devices.all(lambda home: home.chats_tab.click())
 
         self.home_1.add_contact(self.public_key_2)
         self.home_2.handle_contact_request(self.username_1)
@@ -389,10 +395,11 @@ class TestActivityMultipleDevicePRTwo(MultipleSharedDeviceTestCase):
             run_in_parallel(((self.device_1.create_user, {'username': self.username_1}),
                              (self.device_2.create_user, {'username': self.username_2}))))
         self.homes = self.home_1, self.home_2 = self.device_1.get_home_view(), self.device_2.get_home_view()
+        self.devices = Devices(self.homes)
         self.profile_1, self.profile_2 = self.home_1.get_profile_view(), self.home_2.get_profile_view()
         self.public_key_2 = self.home_2.get_public_key()
         self.home_2.navigate_back_to_home_view()
-        [home.chats_tab.click() for home in self.homes]
+        self.devices.all(lambda home: home.chats_tab.click())
 
         self.home_1.add_contact(self.public_key_2)
         self.home_2.handle_contact_request(self.username_1)
@@ -1,24 +1,29 @@
 import asyncio
 import base64
+import functools
 import logging
 import re
-import subprocess
 import sys
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from http.client import RemoteDisconnected
 
 import pytest
-import requests
 from appium import webdriver
 from appium.options.common import AppiumOptions
 from appium.webdriver.common.mobileby import MobileBy
-from sauceclient import SauceException
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
-from selenium.webdriver.support.wait import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
 from urllib3.exceptions import MaxRetryError, ProtocolError
 
 from support.api.network_api import NetworkApi
-from tests import test_suite_data, start_threads, appium_container, pytest_config_global, transl
+from support.device_farm import LocalDeviceFarm
+from support.log_collector import LogCollector
+from support.profile_snapshots import ProfileSnapshots, get_apk_hash
+from support.sauce_admission import SauceAdmission
+from support.session_pool import SessionPool, get_capabilities_key
+from tests import test_suite_data, start_drivers, run_for_each_driver, appium_container, pytest_config_global, \
+    transl
 from tests.conftest import sauce_username, sauce_access_key, apibase, github_report, run_name
 
 executor_sauce_lab = 'https://%s:%s@ondemand.%s:443/wd/hub' % (sauce_username, sauce_access_key, apibase)
@@ -27,6 +32,15 @@ executor_local = 'http://localhost:4723/wd/hub'
 
 implicit_wait = 5
 
+local_farm = LocalDeviceFarm(snapshot_reset=pytest_config_global.get('local_reset') == 'snapshot')
+log_collector = LogCollector(lambda: get_app_path())
+profile_snapshots = ProfileSnapshots(pytest_config_global.get('apk'),
+                                     enabled=bool(pytest_config_global.get('profile_snapshots')))
+session_pool = SessionPool(max_reuse=int(pytest_config_global.get('max_session_reuse', 1)))
+
+sauce_admission = SauceAdmission(sauce_username, sauce_access_key, apibase,
+                                 concurrency=pytest_config_global.get('sauce_concurrency'))
+
 
 def get_capabilities_local():
     desired_caps = dict()
@@ -48,16 +62,49 @@ def get_capabilities_local():
     return desired_caps
 
 
-def add_local_devices_to_capabilities():
-    updated_capabilities = list()
-    raw_out = re.split(r'[\r\\n]+', str(subprocess.check_output(['adb', 'devices'])).rstrip())
-    for line in raw_out[1:]:
-        serial = re.findall(r"(([\d.\d:]*\d+)|\bemulator-\d+)", line)
-        if serial:
-            capabilities = get_capabilities_local()
-            capabilities['udid'] = serial[0][0]
-            updated_capabilities.append(capabilities)
-    return updated_capabilities
+@functools.lru_cache()
+def get_clean_snapshot_name():
+    """AVD snapshot of an emulator with the apk installed, named by the apk hash"""
+    return 'status_%s_clean' % get_apk_hash(pytest_config_global['apk'])[:16]
+
+
+def create_local_drivers(quantity, warm_drivers=(), capabilities=None):
+    """
+    Warm drivers and new sessions on devices leased from the local farm, each device with its own ports.
+    The device is released when the session is quit.
+    If devices are not free right away, warm drivers and idle sessions of the pool are quit before waiting:
+    they keep devices which this or other workers may be waiting for.
+    """
+    drivers = dict(enumerate(warm_drivers))
+    if len(drivers) == quantity:
+        return drivers
+    executor = local_farm.ensure_server()
+    devices = local_farm.try_lease(quantity - len(drivers))
+    if not devices:
+        finish_pooled_sessions(warm_drivers)
+        drivers = dict()
+        devices = local_farm.lease(quantity)
+    new_drivers = list()
+    try:
+        for device in devices:
+            restored = local_farm.snapshot_reset and \
+                local_farm.reset_device(device, get_clean_snapshot_name(), get_app_package())
+            device_capabilities = dict(capabilities if capabilities else get_capabilities_local())
+            device_capabilities.update(device.capabilities)
+            if local_farm.snapshot_reset and not restored and device.is_emulator:
+                local_farm.save_clean_snapshot(device, get_clean_snapshot_name(), device_capabilities['app'])
+            driver = Driver(executor, device_capabilities)
+            driver.device = device
+            new_drivers.append(driver)
+    except BaseException:
+        for driver in new_drivers:
+            session_pool.quit(driver)
+        for device in devices[len(new_drivers):]:
+            device.release()
+        raise
+    for driver in new_drivers:
+        drivers[len(drivers)] = driver
+    return drivers
 
 
 def get_capabilities_sauce_lab():
@@ -102,12 +149,16 @@ def get_capabilities_sauce_lab():
 #     return caps
 
 
-def get_app_path():
-    app_folder = 'im.status.ethereum'
+def get_app_package():
+    app_package = 'im.status.ethereum'
     apk = pytest_config_global['apk']
     if re.findall(r'pr\d\d\d\d\d', apk) or re.findall(r'\d\d\d\d\d.apk', apk):
-        app_folder += '.pr'
-    app_path = '/storage/emulated/0/Android/data/%s/files/Download/' % app_folder
+        app_package += '.pr'
+    return app_package
+
+
+def get_app_path():
+    app_path = '/storage/emulated/0/Android/data/%s/files/Download/' % get_app_package()
     return app_path
 
 
@@ -165,16 +216,111 @@ class AbstractTestCase:
 
 
 class Driver(webdriver.Remote):
+    # SauceAdmission the session was admitted by, its slot is released on quit
+    admission = None
+    # LocalDevice the session runs on, it's released on quit
+    device = None
 
     @property
     def number(self):
         return test_suite_data.current_test.testruns[-1].jobs[self.session_id]
 
-    def info(self, text: str, device=True):
-        if device:
-            text = 'Device %s: %s ' % (self.number, text)
-        logging.info(text)
-        test_suite_data.current_test.testruns[-1].steps.append(text)
+    @property
+    def views(self):
+        # views created for this session by BaseView.get_instance
+        try:
+            return self._views
+        except AttributeError:
+            self._views = dict()
+            return self._views
+
+    @property
+    def keyboard(self):
+        try:
+            return self._keyboard
+        except AttributeError:
+            from views.keyboard import Keyboard
+            self._keyboard = Keyboard(self)
+            return self._keyboard
+
+    @property
+    def gestures(self):
+        try:
+            return self._gestures
+        except AttributeError:
+            from views.gestures import Gestures
+            self._gestures = Gestures(self)
+            return self._gestures
+
+    @property
+    def worker(self):
+        # thread performing steps of this device sent from support.device_executor.Devices
+        try:
+            return self._worker
+        except AttributeError:
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='device')
+            return self._worker
+
+    @property
+    def current_implicit_wait(self):
+        scoped_wait = getattr(self, '_scoped_implicit_wait', None)
+        return scoped_wait if scoped_wait is not None else getattr(self, '_implicit_wait_seconds', 0)
+
+    def implicitly_wait(self, time_to_wait):
+        # sent to the server with the next lookup which needs it
+        self._implicit_wait_seconds = time_to_wait
+
+    def _apply_implicit_wait(self):
+        wait = self.current_implicit_wait
+        if wait != getattr(self, '_applied_implicit_wait', None):
+            super().implicitly_wait(wait)
+            self._applied_implicit_wait = wait
+
+    def find_element(self, *args, **kwargs):
+        self._apply_implicit_wait()
+        return super().find_element(*args, **kwargs)
+
+    def find_elements(self, *args, **kwargs):
+        self._apply_implicit_wait()
+        return super().find_elements(*args, **kwargs)
+
+    @contextmanager
+    def implicit_wait_scope(self, seconds=0):
+        """
+        Changes implicit wait of lookups inside the scope, e.g. to 0 for lookups that are expected to miss.
+        The wait is sent to the server only before a lookup which needs another value than the last sent one,
+        so explicit waits which follow each other cost no extra requests.
+        """
+        previous_wait = getattr(self, '_scoped_implicit_wait', None)
+        if seconds is not None:
+            self._scoped_implicit_wait = seconds
+        try:
+            yield self
+        finally:
+            self._scoped_implicit_wait = previous_wait
+
+    def quit(self):
+        try:
+            super().quit()
+        finally:
+            if hasattr(self, '_worker'):
+                self._worker.shutdown(wait=False)
+                del self._worker
+            if self.admission:
+                self.admission.release()
+                self.admission = None
+            if self.device:
+                self.device.release()
+                self.device = None
+
+    def info(self, text: str, *args, device=True):
+        """Records a test step, `text` is formatted with `args` only when it is logged or reported"""
+        number = self.number if device else None
+        steps = test_suite_data.current_test.testruns[-1].steps
+        steps.append(text, *args, device=number, kind='device' if device else 'test')
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            text = steps.format_text(text, args)
+            logging.info('Device %s: %s ' % (number, text) if device else text)
 
     def fail(self, text: str):
         pytest.fail('Device %s: %s' % (self.number, text))
@@ -203,8 +349,27 @@ class SingleDeviceTestCase(AbstractTestCase):
             self.environment == 'sauce' else (executor_local, get_capabilities_local())
         for key, value in kwargs.items():
             capabilities[key] = value
-        self.driver = Driver(executor, capabilities)
+        key = get_capabilities_key(capabilities)
+        warm_drivers = [] if pytest_config_global['docker'] else session_pool.acquire(key)
+        if warm_drivers:
+            self.driver = warm_drivers[0]
+        else:
+            if self.environment == 'sauce':
+                admit_sauce_sessions(1)
+            try:
+                if self.environment == 'local' and not pytest_config_global['docker']:
+                    self.driver = create_local_drivers(1, capabilities=capabilities)[0]
+                else:
+                    self.driver = Driver(executor, capabilities)
+            except BaseException:
+                if self.environment == 'sauce':
+                    sauce_admission.release()
+                raise
+            if self.environment == 'sauce':
+                self.driver.admission = sauce_admission
+            session_pool.add(self.driver, key)
         test_suite_data.current_test.testruns[-1].jobs[self.driver.session_id] = 1
+        profile_snapshots.start_group([self.driver])
         self.driver.implicitly_wait(implicit_wait)
         self.errors = Errors()
 
@@ -217,7 +382,10 @@ class SingleDeviceTestCase(AbstractTestCase):
         try:
             self.add_alert_text_to_report(self.driver)
             geth_content = pull_geth(self.driver)
-            self.driver.quit()
+            if not session_pool.release(self.driver, method.__name__,
+                                        [test_suite_data.current_test.testruns[-1].error]):
+                session_pool.finish(self.driver)
+                self.driver.quit()
             if pytest_config_global['docker']:
                 appium_container.stop_container()
         except (WebDriverException, AttributeError):
@@ -234,11 +402,11 @@ class LocalMultipleDeviceTestCase(AbstractTestCase):
         self.errors = Errors()
 
     def create_drivers(self, quantity):
-        capabilities = self.add_local_devices_to_capabilities()
-        for driver in range(quantity):
-            self.drivers[driver] = Driver(self.executor_local, capabilities[driver])
-            test_suite_data.current_test.testruns[-1].jobs[self.drivers[driver].session_id] = driver + 1
-            self.drivers[driver].implicitly_wait(self.implicitly_wait)
+        self.drivers = create_local_drivers(quantity)
+        profile_snapshots.start_group(self.drivers.values())
+        for index, driver in self.drivers.items():
+            test_suite_data.current_test.testruns[-1].jobs[driver.session_id] = index + 1
+            driver.implicitly_wait(implicit_wait)
 
     def teardown_method(self, method):
         for driver in self.drivers:
@@ -261,15 +429,19 @@ class SauceMultipleDeviceTestCase(AbstractTestCase):
         self.errors = Errors()
 
     def create_drivers(self, quantity=2, max_duration=1800, custom_implicitly_wait=None):
-        self.drivers = self.loop.run_until_complete(start_threads(quantity,
+        def setup_driver(driver, index):
+            test_suite_data.current_test.testruns[-1].jobs[driver.session_id] = index + 1
+            driver.implicitly_wait(custom_implicitly_wait if custom_implicitly_wait else implicit_wait)
+
+        admit_sauce_sessions(quantity)
+        self.drivers = self.loop.run_until_complete(start_drivers(test_suite_data.current_test.name,
+                                                                  quantity,
                                                                   Driver,
-                                                                  self.drivers,
-                                                                  executor_sauce_lab,
-                                                                  get_capabilities_sauce_lab()))
-        for driver in range(quantity):
-            test_suite_data.current_test.testruns[-1].jobs[self.drivers[driver].session_id] = driver + 1
-            self.drivers[driver].implicitly_wait(
-                custom_implicitly_wait if custom_implicitly_wait else implicit_wait)
+                                                                  admission=sauce_admission,
+                                                                  setup=setup_driver,
+                                                                  command_executor=executor_sauce_lab,
+                                                                  options=get_capabilities_sauce_lab()))
+        profile_snapshots.start_group(self.drivers.values())
 
     def teardown_method(self, method):
         geth_names, geth_contents = [], []
@@ -294,36 +466,48 @@ class SauceMultipleDeviceTestCase(AbstractTestCase):
 def create_shared_drivers(quantity):
     drivers = dict()
     if pytest_config_global['env'] == 'local':
-        capabilities = add_local_devices_to_capabilities()
-        for i in range(quantity):
-            driver = Driver(executor_local, capabilities[i])
+        # warm sessions keep their devices, so any of them fits
+        key = get_capabilities_key(get_capabilities_local())
+        drivers = create_local_drivers(quantity, session_pool.acquire(key, quantity))
+        for i, driver in drivers.items():
+            if driver.session_id not in session_pool.sessions:
+                session_pool.add(driver, key)
             test_suite_data.current_test.testruns[-1].jobs[driver.session_id] = i + 1
             driver.implicitly_wait(implicit_wait)
-            drivers[i] = driver
+        profile_snapshots.start_group(drivers.values())
         loop = None
         return drivers, loop
     else:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         print('SC Executor: %s' % executor_sauce_lab)
+        options = get_capabilities_sauce_lab()
+        key = get_capabilities_key(options)
+        drivers = dict(enumerate(admit_sauce_sessions(quantity, session_pool.acquire(key, quantity))))
+
+        def setup_driver(driver, index):
+            test_suite_data.current_test.testruns[-1].jobs[driver.session_id] = index + 1
+            driver.implicitly_wait(implicit_wait)
+
         try:
-            drivers = loop.run_until_complete(start_threads(test_suite_data.current_test.name,
-                                                            quantity,
-                                                            Driver,
-                                                            drivers,
-                                                            command_executor=executor_sauce_lab,
-                                                            options=get_capabilities_sauce_lab()))
-            if len(drivers) < quantity:
-                test_suite_data.current_test.testruns[-1].error = "Not all %s drivers are created" % quantity
-
-            for i in range(quantity):
-                test_suite_data.current_test.testruns[-1].jobs[drivers[i].session_id] = i + 1
-                drivers[i].implicitly_wait(implicit_wait)
+            new_drivers = loop.run_until_complete(start_drivers(test_suite_data.current_test.name,
+                                                                quantity - len(drivers),
+                                                                Driver,
+                                                                admission=sauce_admission,
+                                                                command_executor=executor_sauce_lab,
+                                                                options=options))
+            for driver in new_drivers.values():
+                session_pool.add(driver, key)
+                drivers[len(drivers)] = driver
+            loop.run_until_complete(asyncio.gather(*[loop.run_in_executor(None, setup_driver, driver, index)
+                                                     for index, driver in drivers.items()]))
+            profile_snapshots.start_group(drivers.values())
             return drivers, loop
-        except (MaxRetryError, AttributeError) as e:
+        except (MaxRetryError, WebDriverException, asyncio.TimeoutError, AttributeError) as e:
             test_suite_data.current_test.testruns[-1].error = str(e)
             for _, driver in drivers.items():
                 try:
+                    session_pool.finish(driver)
                     driver.quit()
                 except (WebDriverException, AttributeError):
                     pass
@@ -356,7 +540,11 @@ class LocalSharedMultipleDeviceTestCase(AbstractTestCase):
 
     @classmethod
     def teardown_class(cls):
+        errors = [test.testruns[-1].error for test in test_suite_data.tests if test.group_name == cls.__name__]
         for driver in cls.drivers:
+            if session_pool.release(cls.drivers[driver], cls.__name__, errors):
+                continue
+            session_pool.finish(cls.drivers[driver])
             try:
                 cls.drivers[driver].quit()
             except WebDriverException:
@@ -368,8 +556,8 @@ class SauceSharedMultipleDeviceTestCase(AbstractTestCase):
     def setup_method(self, method):
         if not self.drivers:
             pytest.fail(test_suite_data.current_test.testruns[-1].error)
-        for _, driver in self.drivers.items():
-            driver.execute_script("sauce:context=Started %s" % method.__name__)
+        run_for_each_driver(self.drivers,
+                            lambda driver: driver.execute_script("sauce:context=Started %s" % method.__name__))
         jobs = test_suite_data.current_test.testruns[-1].jobs
         if not jobs:
             for index, driver in self.drivers.items():
@@ -378,25 +566,16 @@ class SauceSharedMultipleDeviceTestCase(AbstractTestCase):
         test_suite_data.current_test.group_name = self.__class__.__name__
 
     def teardown_method(self, method):
-        log_names, log_contents = [], []
+        test_name = test_suite_data.current_test.name
         for driver in self.drivers:
             try:
                 self.print_sauce_lab_info(self.drivers[driver])
                 self.add_alert_text_to_report(self.drivers[driver])
-                log_names.append(
-                    '%s_geth%s.log' % (test_suite_data.current_test.name, str(self.drivers[driver].number)))
-                log_contents.append(pull_geth(self.drivers[driver]))
-                log_names.append(
-                    '%s_requests%s.log' % (test_suite_data.current_test.name, str(self.drivers[driver].number)))
-                log_contents.append(pull_requests_log(self.drivers[driver]))
             except (WebDriverException, AttributeError, RemoteDisconnected, ProtocolError):
                 pass
-            finally:
-                try:
-                    logs = {log_names[i]: log_contents[i] for i in range(len(log_names))}
-                    test_suite_data.current_test.logs_paths = github_report.save_logs(logs)
-                except IndexError:
-                    pass
+        log_collector.collect(self.drivers, test_name)
+        test_suite_data.current_test.logs_paths = log_collector.save_logs(self.drivers, github_report.TEST_REPORT_DIR,
+                                                                          test_name, test_name=test_name)
 
     @pytest.fixture(scope='class', autouse=True)
     def prepare(self, request):
@@ -408,45 +587,23 @@ class SauceSharedMultipleDeviceTestCase(AbstractTestCase):
 
     @classmethod
     def teardown_class(cls):
-        from tests.conftest import sauce
-        requests_session = requests.Session()
-        requests_session.auth = (sauce_username, sauce_access_key)
         if test_suite_data.tests[0].testruns[-1].error and 'setup failed' in test_suite_data.tests[0].testruns[
             -1].error:
             group_setup_failed = True
         else:
             group_setup_failed = False
-        log_contents, log_names = list(), list()
+        logs_paths = dict()
+        errors = [test.testruns[-1].error for test in test_suite_data.tests if test.group_name == cls.__name__]
         try:
-            for i, driver in cls.drivers.items():
-                if group_setup_failed:
-                    log_contents.append(pull_geth(driver=driver))
-                    log_names.append('%s_geth%s.log' % (cls.__name__, i))
-                    log_contents.append(pull_requests_log(driver=driver))
-                    log_names.append('%s_requests%s.log' % (cls.__name__, i))
-                session_id = driver.session_id
-                try:
-                    sauce.jobs.update_job(username=sauce_username, job_id=session_id, name=cls.__name__)
-                except (RemoteDisconnected, SauceException, requests.exceptions.ConnectionError):
-                    pass
-                try:
-                    driver.quit()
-                except WebDriverException:
-                    pass
-                url = 'https://api.%s/rest/v1/%s/jobs/%s/assets/%s' % (apibase, sauce_username, session_id, "log.json")
-                try:
-                    WebDriverWait(driver, 60, 2).until(lambda _: requests_session.get(url).status_code == 200)
-                    commands = requests_session.get(url).json()
-                    for command in commands:
-                        try:
-                            if command['message'].startswith("Started "):
-                                for test in test_suite_data.tests:
-                                    if command['message'] == "Started %s" % test.name:
-                                        test.testruns[-1].first_commands[session_id] = commands.index(command) + 1
-                        except KeyError:
-                            continue
-                except (RemoteDisconnected, requests.exceptions.ConnectionError, TimeoutException):
-                    pass
+            if group_setup_failed:
+                log_collector.collect(cls.drivers, cls.__name__)
+                logs_paths = log_collector.save_logs(cls.drivers, github_report.TEST_REPORT_DIR, cls.__name__)
+            jobs = list()
+            for driver in cls.drivers.values():
+                if not group_setup_failed and session_pool.release(driver, cls.__name__, errors):
+                    continue
+                jobs.append((driver, ', '.join(session_pool.finish(driver)) or cls.__name__))
+            finish_sauce_sessions(jobs)
         except AttributeError:
             pass
         finally:
@@ -455,15 +612,61 @@ class SauceSharedMultipleDeviceTestCase(AbstractTestCase):
             except AttributeError:
                 pass
 
-        logs = dict(zip(log_names, log_contents))
-        logs_paths = github_report.save_logs(logs)
-
         for test in test_suite_data.tests:
             if group_setup_failed:
                 test.logs_paths = logs_paths
             github_report.save_test(test)
 
 
+def finish_sauce_sessions(jobs):
+    """
+    Quits sessions given as (driver, SauceLabs job name) pairs and links tests to their first command
+    in the job logs, which are polled for all jobs at once
+    """
+    from tests.conftest import sauce_api
+    for driver, job_name in jobs:
+        sauce_api.update_job(driver.session_id, name=job_name)
+    run_for_each_driver(dict(enumerate(driver for driver, _ in jobs)), session_pool.quit)
+    jobs_commands = sauce_api.get_jobs_commands([driver.session_id for driver, _ in jobs])
+    tests_by_command = {"Started %s" % test.name: test for test in test_suite_data.tests}
+    for session_id, commands in jobs_commands.items():
+        for number, command in enumerate(commands or list(), start=1):
+            test = tests_by_command.get(command.get('message')) if isinstance(command, dict) else None
+            if test:
+                test.testruns[-1].first_commands[session_id] = number
+
+
+def admit_sauce_sessions(quantity, warm_drivers=()):
+    """
+    Admits new SauceLabs sessions which are needed in addition to `warm_drivers` to get `quantity` of them,
+    returns warm drivers which are still to be used.
+    If the sessions can't be started right away, warm drivers and idle sessions of the pool are quit before waiting:
+    they hold slots which other workers may be waiting for, while waiting for slots held by this one.
+    """
+    warm_drivers = list(warm_drivers)
+    if len(warm_drivers) >= quantity or sauce_admission.acquire_now(quantity - len(warm_drivers)):
+        return warm_drivers
+    finish_pooled_sessions(warm_drivers)
+    sauce_admission.acquire_blocking(quantity)
+    return list()
+
+
+def finish_pooled_sessions(drivers=()):
+    """Quits sessions left warm in the pool (at the end of the worker run) and `drivers` taken from it"""
+    drivers = list(drivers) + session_pool.drain()
+    if not drivers:
+        return
+    if pytest_config_global['env'] == 'sauce':
+        finish_sauce_sessions([(driver, ', '.join(session_pool.finish(driver))) for driver in drivers])
+    else:
+        for driver in drivers:
+            session_pool.finish(driver)
+            session_pool.quit(driver)
+    # reports of tests from reused sessions get links to their first commands only now
+    for test in test_suite_data.tests:
+        github_report.save_test(test)
+
+
 if pytest_config_global['env'] == 'local':
     MultipleDeviceTestCase = LocalMultipleDeviceTestCase
     MultipleSharedDeviceTestCase = LocalSharedMultipleDeviceTestCase
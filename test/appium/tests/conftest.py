@@ -1,7 +1,9 @@
 import os
 import re
 import signal
+import sys
 import time
+import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -15,6 +17,7 @@ from requests.exceptions import ConnectionError as c_er
 
 import tests
 from support.device_stats_db import DeviceStatsDB
+from support.duration_history import DurationHistory
 from support.test_rerun import should_rerun_test
 from tests import test_suite_data, appium_container
 
@@ -69,6 +72,33 @@ def pytest_addoption(parser):
                      metavar="NAME",
                      default=None,
                      help="only run tests matching the environment NAME.")
+    parser.addoption('--max_session_reuse',
+                     action='store',
+                     default=1,
+                     help='How many test classes can use the same Appium session, 1 means no reuse')
+    parser.addoption('--profile_snapshots',
+                     action='store',
+                     default=False,
+                     help='boolean; Restore profiles onboarded once per apk instead of onboarding them through UI')
+    parser.addoption('--duration_history',
+                     action='store',
+                     default=os.path.join(os.path.expanduser('~'), '.cache', 'status-e2e', 'durations.sqlite'),
+                     help='Path to SQLite database with test durations of previous runs, used to run longest '
+                          'xdist groups first; empty string to disable')
+    parser.addoption('--local_reset',
+                     action='store',
+                     default='session',
+                     help='For local only: session - new session on the device as is, snapshot - restore emulators '
+                          'from a snapshot with the apk installed before new sessions')
+    parser.addoption('--sauce_concurrency',
+                     action='store',
+                     default=None,
+                     help='How many SauceLabs sessions can run at once, by default the account limit is used')
+    parser.addoption('--sauce_api_url',
+                     action='store',
+                     default=None,
+                     help='Base URL of SauceLabs REST API, e.g. of a local stub server; '
+                          'API of the datacenter by default')
     parser.addoption("--apk_upgrade",
                      action="store",
                      metavar="NAME",
@@ -148,7 +178,11 @@ testrail_report = None
 github_report = None
 apibase = None
 sauce = None
+sauce_api = None
 run_name = None
+duration_history = None
+# (nodeid, phase, duration, devices, outcome) of this run, saved to duration history at the end
+duration_reports = list()
 
 
 def is_master(config):
@@ -156,10 +190,7 @@ def is_master(config):
 
 
 def is_uploaded():
-    stored_files = sauce.storage.files()
-    for i in range(len(stored_files)):
-        if stored_files[i].name == test_suite_data.apk_name:
-            return True
+    return sauce_api.is_uploaded(test_suite_data.apk_name)
 
 
 @contextmanager
@@ -190,6 +221,7 @@ def _upload_and_check_response(apk_file_path):
             raise UploadApkException("Incorrect apk was uploaded to Sauce storage, response:\n%s" % resp)
     except AttributeError:
         raise UploadApkException("Error when uploading apk to Sauce storage, response:\n%s" % resp)
+    sauce_api.add_to_storage_index(resp.name)
 
 
 def _upload_and_check_response_with_retries(apk_file_path, retries=3):
@@ -243,8 +275,11 @@ def pytest_configure(config):
     from support.github_report import GithubHtmlReport
     global github_report
     from saucelab_api_client.saucelab_api_client import SauceLab
-    github_report = GithubHtmlReport()
+    github_report = GithubHtmlReport(testrail_report)
     tests.pytest_config_global = vars(config.option)
+    global duration_history
+    if is_master(config) and config.getoption('duration_history'):
+        duration_history = DurationHistory(config.getoption('duration_history'))
     config.addinivalue_line("markers", "testrail_id(name): empty")
     global apibase
     if config.getoption('datacenter') == 'us-west-1':
@@ -256,6 +291,9 @@ def pytest_configure(config):
 
     global sauce
     sauce = SauceLab('https://api.' + apibase + '/', sauce_username, sauce_access_key)
+    from support.sauce_api import SauceApi
+    global sauce_api
+    sauce_api = SauceApi(sauce_username, sauce_access_key, apibase, base_url=config.getoption('sauce_api_url'))
     if config.getoption('log_steps'):
         import logging
         logging.basicConfig(level=logging.INFO)
@@ -276,9 +314,8 @@ def pytest_configure(config):
 
     pr_number = config.getoption('pr_number')
     if pr_number:
-        from github import Github
-        repo = Github(github_token).get_user('status-im').get_repo('status-mobile')
-        pull = repo.get_pull(int(pr_number))
+        from support.github_report import get_pull
+        pull = get_pull(pr_number)
         pull.get_commits()[0].create_status(
             state='pending',
             context='Mobile e2e tests',
@@ -302,9 +339,8 @@ def pytest_unconfigure(config):
         if config.getoption('testrail_report'):
             testrail_report.add_results()
         if config.getoption('pr_number'):
-            from github import Github
-            repo = Github(github_token).get_user('status-im').get_repo('status-mobile')
-            pull = repo.get_pull(int(config.getoption('pr_number')))
+            from support.github_report import get_pull
+            pull = get_pull(config.getoption('pr_number'))
             comment = pull.create_issue_comment(github_report.build_html_report(testrail_report.run_id))
             if not testrail_report.is_run_successful():
                 pull.get_commits()[0].create_status(state='failure', context='Mobile e2e tests',
@@ -316,6 +352,40 @@ def pytest_unconfigure(config):
                                                     target_url=comment.html_url)
 
 
+def pytest_sessionstart(session):
+    config = session.config
+    # templates are loaded once in each process running tests, not in xdist master
+    if config.getoption('env') in ('sauce', 'local') and \
+            (not is_master(config) or not getattr(config.option, 'numprocesses', None)):
+        from views.image_checks import template_index
+        template_index.preload()
+
+
+def pytest_sessionfinish(session):
+    if session.config.getoption('env') in ('sauce', 'local') and 'tests.base_test_case' in sys.modules:
+        from tests.base_test_case import finish_pooled_sessions, local_farm, log_collector
+        finish_pooled_sessions()
+        local_farm.stop_server()
+        log_collector.cleanup()
+    if sauce_api:
+        sauce_api.close()
+    if duration_history:
+        duration_history.record(uuid.uuid4().hex, duration_reports)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption('dist') == 'loadgroup' and duration_history:
+        from support.group_scheduler import LongestFirstGroupScheduling
+        return LongestFirstGroupScheduling(config, log, history=duration_history)
+
+
+def pytest_runtest_logreport(report):
+    if duration_history:
+        devices = dict(report.user_properties).get('devices', 0)
+        duration_reports.append((report.nodeid, report.when, report.duration, devices, report.outcome))
+
+
 def should_save_device_stats(config):
     db_args = [config.getoption(option) for option in
                ('stats_db_host', 'stats_db_port', 'stats_db_username', 'stats_db_password', 'stats_db_database')]
@@ -341,6 +411,10 @@ def pytest_runtest_makereport(item, call):
     secured_test = "secured" in item.keywords._markers or "secured" in item.parent.keywords._markers
 
     if report.when == 'setup':
+        drivers = getattr(item.instance, 'drivers', None)
+        devices = len(drivers) if drivers else int(bool(getattr(item.instance, 'driver', None)))
+        item.user_properties.append(('devices', devices))
+        report.user_properties.append(('devices', devices))
         is_group = "xdist_group" in item.keywords._markers or "xdist_group" in item.parent.keywords._markers
         error_intro, error = 'Test setup failed:', ''
         final_error = '%s %s' % (error_intro, error)
@@ -409,12 +483,8 @@ def pytest_runtest_makereport(item, call):
 
 
 def update_sauce_jobs(test_name, job_ids, passed):
-    from sauceclient import SauceException
     for job_id in job_ids.keys():
-        try:
-            sauce.jobs.update_job(username=sauce_username, job_id=job_id, name=test_name, passed=passed)
-        except (RemoteDisconnected, SauceException, c_er):
-            pass
+        sauce_api.update_job(job_id, name=test_name, passed=passed)
 
 
 def get_testrail_case_id(item):
@@ -6,6 +6,7 @@ from _pytest.outcomes import Failed
 from appium.webdriver.connectiontype import ConnectionType
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from support.device_executor import Devices
 from tests import marks, run_in_parallel, transl
 from tests.base_test_case import MultipleSharedDeviceTestCase, create_shared_drivers
 from views.base_element import Button
@@ -368,7 +369,7 @@ class TestOneToOneChatMultipleSharedDevicesNewUi(MultipleSharedDeviceTestCase):
             self.device_1.driver.fail("Failed to open chat view after tap on PN")
 
         self.device_1.just_fyi("Checks there are no PN after message was seen")
-        [home.open_notification_bar() for home in self.homes]
+        Devices(self.homes).all(lambda home: home.open_notification_bar())
         if (self.device_2.element_by_text_part(message).is_element_displayed()
                 or self.device_1.element_by_text_part(emoji_unicode).is_element_displayed()):
             self.errors.append("PN are keep staying after message was seen by user")
@@ -376,9 +377,8 @@ class TestOneToOneChatMultipleSharedDevicesNewUi(MultipleSharedDeviceTestCase):
 
     @marks.testrail_id(702855)
     def test_1_1_chat_edit_message(self):
-        for home in self.homes:
-            home.navigate_back_to_home_view()
-            home.chats_tab.click()
+        Devices(self.homes).all(lambda home: home.navigate_back_to_home_view())
+        Devices(self.homes).all(lambda home: home.chats_tab.click())
         self.home_2.get_chat(self.username_1).click()
         self.home_1.get_chat(self.username_2).click()
 
@@ -588,8 +588,7 @@ class TestOneToOneChatMultipleSharedDevicesNewUiTwo(MultipleSharedDeviceTestCase
     @marks.testrail_id(702783)
     def test_1_1_chat_is_shown_message_sent_delivered_from_offline(self):
         self.home_1.just_fyi('Turn on airplane mode and check that offline status is shown on home view')
-        for home in self.homes:
-            home.driver.set_network_connection(ConnectionType.AIRPLANE_MODE)
+        Devices(self.homes).all(lambda home: home.driver.set_network_connection(ConnectionType.AIRPLANE_MODE))
 
         # Not implemented yet
         # self.home_1.connection_offline_icon.wait_and_click(20)
@@ -611,8 +610,7 @@ class TestOneToOneChatMultipleSharedDevicesNewUiTwo(MultipleSharedDeviceTestCase
             self.errors.append('Message status is not "Sending", it is "%s"!' % status)
 
         self.home_2.just_fyi('Device2 goes back online and checks that status of the message is changed to "delivered"')
-        for home in self.homes:
-            home.driver.set_network_connection(ConnectionType.ALL_NETWORK_ON)
+        Devices(self.homes).all(lambda home: home.driver.set_network_connection(ConnectionType.ALL_NETWORK_ON))
 
         self.home_1.just_fyi('Device1 goes back online and checks that 1-1 chat will be fetched')
         if not self.chat_1.chat_element_by_text(message_1).is_element_displayed(120):
@@ -5,7 +5,8 @@ from _pytest.outcomes import Failed
 from appium.webdriver.connectiontype import ConnectionType
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
-from tests import marks, run_in_parallel, transl
+from support.device_executor import Devices
+from tests import marks, transl
 from tests.base_test_case import MultipleSharedDeviceTestCase, create_shared_drivers
 from views.chat_view import ChatView
 from views.sign_in_view import SignInView
@@ -22,46 +23,29 @@ class TestGroupChatMultipleDeviceMergedNewUI(MultipleSharedDeviceTestCase):
         self.public_keys, self.usernames, self.chats = {}, {}, {}
         self.sign_in_views = [SignInView(self.drivers[key]) for key in self.drivers]
         self.usernames = ('user admin', 'member_1', 'member_2')
-        self.loop.run_until_complete(
-            run_in_parallel(
-                (
-                    (self.sign_in_views[0].create_user, {'enable_notifications': True, 'username': self.usernames[0]}),
-                    (self.sign_in_views[1].create_user, {'enable_notifications': True, 'username': self.usernames[1]}),
-                    (self.sign_in_views[2].create_user, {'enable_notifications': True, 'username': self.usernames[2]})
-                )
-            )
-        )
+        Devices(self.sign_in_views).all(
+            lambda sign_in, username: sign_in.create_user(enable_notifications=True, username=username), self.usernames)
         self.homes = [sign_in.get_home_view() for sign_in in self.sign_in_views]
-        self.public_keys = self.loop.run_until_complete(
-            run_in_parallel(
-                (
-                    (self.homes[0].get_public_key,),
-                    (self.homes[1].get_public_key,),
-                    (self.homes[2].get_public_key,)
-                )
-            )
-        )
+        self.devices = Devices(self.homes)
+        self.public_keys = self.devices.all(lambda home: home.get_public_key())
 
         self.homes[0].just_fyi('Admin adds future members to contacts')
 
-        for i in range(3):
-            self.homes[i].navigate_back_to_home_view()
-            self.homes[i].chats_tab.click()
+        def _open_chats(home):
+            home.navigate_back_to_home_view()
+            home.chats_tab.click()
+
+        self.devices.all(_open_chats)
 
         for i in range(1, 3):
             self.homes[0].add_contact(self.public_keys[i])
 
         self.homes[0].just_fyi('Members add admin to contacts to see PNs and put app in background')
-        self.loop.run_until_complete(
-            run_in_parallel(
-                (
-                    (self.homes[1].handle_contact_request, {'username': self.usernames[0]}),
-                    (self.homes[2].handle_contact_request, {'username': self.usernames[0]})
-                )
-            )
-        )
-        for i in range(1, 3):
-            self.homes[i].navigate_back_to_home_view()
+        def _accept_contact_request(index):
+            self.homes[index].handle_contact_request(username=self.usernames[0])
+            self.homes[index].navigate_back_to_home_view()
+
+        self.devices.run(_accept_contact_request, indexes=(1, 2))
 
         self.homes[0].just_fyi('Admin creates group chat')
         self.chat_name = self.homes[0].get_random_chat_name()
@@ -120,11 +104,7 @@ class TestGroupChatMultipleDeviceMergedNewUI(MultipleSharedDeviceTestCase):
             chat_element.emojis_below_message(emoji="love").wait_for_element_text(1)
             chat_element.emojis_below_message(emoji="laugh").wait_for_element_text(1)
 
-        self.loop.run_until_complete(run_in_parallel((
-            (_check_reactions_count, {'chat_view_index': 0}),
-            (_check_reactions_count, {'chat_view_index': 1}),
-            (_check_reactions_count, {'chat_view_index': 2})
-        )))
+        self.devices.run(_check_reactions_count)
 
         self.chats[0].just_fyi("Admin checks info about voted users")
         self.chats[0].chat_element_by_text(message).emojis_below_message(
@@ -179,11 +159,7 @@ class TestGroupChatMultipleDeviceMergedNewUI(MultipleSharedDeviceTestCase):
                 self.errors.append(
                     "Incorrect reactions count for %s after changing the reactions" % self.usernames[chat_view_index])
 
-        self.loop.run_until_complete(run_in_parallel((
-            (_check_reactions_count_after_change, {'chat_view_index': 0}),
-            (_check_reactions_count_after_change, {'chat_view_index': 1}),
-            (_check_reactions_count_after_change, {'chat_view_index': 2})
-        )))
+        self.devices.run(_check_reactions_count_after_change)
 
         self.chats[0].just_fyi("Admin relogins")
         self.chats[0].reopen_app()
@@ -226,9 +202,11 @@ class TestGroupChatMultipleDeviceMergedNewUI(MultipleSharedDeviceTestCase):
 
     @marks.testrail_id(703297)
     def test_group_chat_send_image_save_and_share(self):
-        [self.homes[i].navigate_back_to_home_view() for i in range(3)]
-        for i in range(3):
-            self.homes[i].get_chat(self.chat_name).click()
+        def _open_group_chat(home):
+            home.navigate_back_to_home_view()
+            home.get_chat(self.chat_name).click()
+
+        self.devices.all(_open_group_chat)
 
         self.chats[1].just_fyi("Member_1 sends an image")
         image_description = "test image"
@@ -304,10 +282,7 @@ class TestGroupChatMultipleDeviceMergedNewUI(MultipleSharedDeviceTestCase):
             self.homes[index].groups_tab.click()
             self.homes[index].get_chat(self.chat_name).click()
 
-        self.loop.run_until_complete(run_in_parallel((
-            (_proceed_to_chat, {'index': 1}),
-            (_proceed_to_chat, {'index': 2})
-        )))
+        self.devices.run(_proceed_to_chat, indexes=(1, 2))
 
         message_1, message_2 = 'message from old member', 'message from new member'
 
@@ -341,11 +316,7 @@ class TestGroupChatMultipleDeviceMergedNewUI(MultipleSharedDeviceTestCase):
                 if not self.chats[index].chat_element_by_text(message_text).is_element_displayed(30):
                     self.errors.append('%s if not shown for device %s' % (message_text, index))
 
-        self.loop.run_until_complete(run_in_parallel((
-            (_check_messages, {'index': 0}),
-            (_check_messages, {'index': 1}),
-            (_check_messages, {'index': 2})
-        )))
+        self.devices.run(_check_messages)
 
         self.errors.verify_no_errors()
 
@@ -428,10 +399,7 @@ class TestGroupChatMultipleDeviceMergedNewUI(MultipleSharedDeviceTestCase):
                         "Message '%s' is missed on Pinned messages list for user %s" % (message, self.usernames[index])
                     )
 
-        self.loop.run_until_complete(run_in_parallel((
-            (_check_pinned_messages, {'index': 0}),
-            (_check_pinned_messages, {'index': 1})
-        )))
+        self.devices.run(_check_pinned_messages, indexes=(0, 1))
 
         self.errors.verify_no_errors()
 
@@ -7,6 +7,7 @@ from _pytest.outcomes import Failed
 from appium.webdriver.connectiontype import ConnectionType
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
 
+from support.device_executor import Devices
 from tests import marks, run_in_parallel, pytest_config_global, transl
 from tests.base_test_case import create_shared_drivers, MultipleSharedDeviceTestCase
 from views.chat_view import CommunityView, ChatView
@@ -286,11 +287,13 @@ class TestCommunityOneDeviceMerged(MultipleSharedDeviceTestCase):
                 self.home.just_fyi("Check Status community screen")
                 card.click()
                 self.community_view.join_button.save_new_screenshot_of_element('status_community_join_button_aaa.png')
+                self.community_view.community_logo.save_new_screenshot_of_element('status_community_logo_aaa.png')
+                screen = self.community_view.get_screen_capture()
                 if self.community_view.join_button.is_element_differs_from_template(
-                        'status_community_join_button.png'):
+                        'status_community_join_button.png', screen=screen):
                     self.errors.append("Status community Join button is different from expected template.")
-                self.community_view.community_logo.save_new_screenshot_of_element('status_community_logo_aaa.png')
-                if self.community_view.community_logo.is_element_differs_from_template('status_community_logo.png'):
+                if self.community_view.community_logo.is_element_differs_from_template('status_community_logo.png',
+                                                                                       screen=screen):
                     self.errors.append("Status community logo is different from expected template.")
 
                     # self.community_view.close_community_view_button.click()
@@ -315,10 +318,14 @@ class TestCommunityMultipleDeviceMerged(MultipleSharedDeviceTestCase):
                                                                                    'username': self.username_1}),
                                                       (self.device_2.create_user, {'username': self.username_2}))))
         self.homes = self.home_1, self.home_2 = self.device_1.get_home_view(), self.device_2.get_home_view()
+        self.devices = Devices(self.homes)
         self.public_key_2 = self.home_2.get_public_key()
         self.profile_1 = self.home_1.get_profile_view()
-        [home.navigate_back_to_home_view() for home in self.homes]
-        [home.chats_tab.click() for home in self.homes]
+        def _open_chats(home):
+            home.navigate_back_to_home_view()
+            home.chats_tab.click()
+
+        self.devices.all(_open_chats)
         self.home_1.add_contact(self.public_key_2)
         self.home_2.handle_contact_request(self.username_1)
         self.text_message = 'hello'
@@ -844,10 +851,14 @@ class TestCommunityMultipleDeviceMergedTwo(MultipleSharedDeviceTestCase):
                                                       (self.device_2.create_user, {'enable_notifications': True,
                                                                                    'username': self.username_2}))))
         self.homes = self.home_1, self.home_2 = self.device_1.get_home_view(), self.device_2.get_home_view()
+        self.devices = Devices(self.homes)
         self.public_key_2 = self.home_2.get_public_key()
         self.profile_1 = self.home_1.get_profile_view()
-        [home.navigate_back_to_home_view() for home in self.homes]
-        [home.chats_tab.click() for home in self.homes]
+        def _open_chats(home):
+            home.navigate_back_to_home_view()
+            home.chats_tab.click()
+
+        self.devices.all(_open_chats)
         self.home_1.add_contact(self.public_key_2)
         self.home_2.handle_contact_request(self.username_1)
         self.text_message = 'hello'
@@ -973,12 +984,14 @@ class TestCommunityMultipleDeviceMergedTwo(MultipleSharedDeviceTestCase):
             'quote reply (one row)': '>',
         }
 
-        for home in self.homes:
+        def _open_community_channel(home):
             home.navigate_back_to_home_view()
             home.communities_tab.click()
             community = home.get_chat(self.community_name, community=True).click()
             community.get_channel(self.channel_name).click()
 
+        self.devices.all(_open_community_channel)
+
         for message, symbol in markdown.items():
             self.home_1.just_fyi('Checking that "%s" is applied (%s) in community channel' % (message, symbol))
             message_to_send = symbol + message + symbol if 'quote' not in message else symbol + message
@@ -991,11 +1004,13 @@ class TestCommunityMultipleDeviceMergedTwo(MultipleSharedDeviceTestCase):
                 self.errors.append(
                     '%s is not displayed with markdown in community channel for the recipient (device 1) \n' % message)
 
-        for home in self.homes:
+        def _open_recent_chats(home):
             home.navigate_back_to_home_view()
             home.chats_tab.click()
             home.recent_tab.click()
 
+        self.devices.all(_open_recent_chats)
+
         self.home_1.get_chat(self.username_2).click()
         self.home_2.get_chat(self.username_1).click()
 
@@ -1028,8 +1043,7 @@ class TestCommunityMultipleDeviceMergedTwo(MultipleSharedDeviceTestCase):
 
     @marks.testrail_id(702948)
     def test_community_hashtag_links_to_community_channels(self):
-        for home in self.homes:
-            home.navigate_back_to_home_view()
+        self.devices.all(lambda home: home.navigate_back_to_home_view())
         self.home_2.chats_tab.click()
         self.home_1.communities_tab.click()
 
@@ -1105,10 +1119,12 @@ class TestCommunityMultipleDeviceMergedTwo(MultipleSharedDeviceTestCase):
         if not self.channel_1.chat_element_by_text(cats_message).is_element_displayed(30):
             self.errors.append("Sender was not navigated to the cats channel")
 
-        for home in self.homes:
+        def _open_chats(home):
             home.navigate_back_to_home_view()
             home.chats_tab.click()
 
+        self.devices.all(_open_chats)
+
         self.home_2.just_fyi("Device 2 sends a message with hashtag in 1-1 chat")
         self.home_2.get_chat(self.username_1).click()
         self.chat_2.send_message(message_with_hashtag)
@@ -1128,8 +1144,7 @@ class TestCommunityMultipleDeviceMergedTwo(MultipleSharedDeviceTestCase):
 
     @marks.testrail_id(703629)
     def test_community_join_when_node_owner_offline(self):
-        for home in self.homes:
-            home.navigate_back_to_home_view()
+        self.devices.all(lambda home: home.navigate_back_to_home_view())
         if self.home_2.get_chat(self.community_name, community=True).is_element_displayed():
             CommunityView(self.home_2.driver).leave_community(self.community_name)
         self.home_1.communities_tab.click()
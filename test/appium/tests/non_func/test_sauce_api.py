@@ -0,0 +1,103 @@
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+from aiohttp import web
+
+from support.sauce_api import SauceApi
+
+
+class SauceStub(object):
+    """SauceLabs REST API endpoints used by SauceApi, served from a background thread"""
+
+    def __init__(self):
+        self.job_updates = list()
+        self.job_logs = {'job_with_log': [{'message': 'Started test_one'}]}
+        self.storage_files = ['status.apk']
+        self.storage_requests = 0
+        self.update_delay = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='sauce-stub', daemon=True)
+        self.runner = None
+        self.url = None
+
+    async def update_job(self, request):
+        self.job_updates.append((request.match_info['job_id'], await request.json()))
+        await asyncio.sleep(self.update_delay)
+        return web.json_response(dict())
+
+    async def get_job_log(self, request):
+        log = self.job_logs.get(request.match_info['job_id'])
+        if log is None:
+            return web.json_response({'message': 'Not found'}, status=404)
+        return web.json_response(log)
+
+    async def get_storage_files(self, request):
+        self.storage_requests += 1
+        query = request.query.get('q', '')
+        return web.json_response({'items': [{'name': name} for name in self.storage_files if query in name]})
+
+    async def _start(self, sock):
+        app = web.Application()
+        app.router.add_put('/rest/v1/{username}/jobs/{job_id}', self.update_job)
+        app.router.add_get('/rest/v1/{username}/jobs/{job_id}/assets/log.json', self.get_job_log)
+        app.router.add_get('/v1/storage/files', self.get_storage_files)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.SockSite(self.runner, sock).start()
+
+    def start(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        self.url = 'http://127.0.0.1:%s' % sock.getsockname()[1]
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(sock), self.loop).result(10)
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result(10)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(10)
+
+
+@pytest.fixture
+def sauce_stub():
+    stub = SauceStub()
+    stub.start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def sauce_api(sauce_stub, tmp_path):
+    api = SauceApi('user', 'key', None, base_url=sauce_stub.url, cache_dir=str(tmp_path))
+    yield api
+    api.close()
+
+
+class TestSauceApi(object):
+
+    def test_job_updates_are_merged_and_sent_in_order(self, sauce_stub, sauce_api):
+        sauce_stub.update_delay = 1
+        sauce_api.update_job('job', name='first')
+        end_time = time.time() + 10
+        while not sauce_stub.job_updates and time.time() < end_time:
+            time.sleep(0.05)
+        # both updates wait until the first one is sent, so they are sent as one request
+        sauce_api.update_job('job', name='second')
+        sauce_api.update_job('job', passed=True)
+        sauce_api.flush()
+        assert sauce_stub.job_updates == [('job', {'name': 'first'}), ('job', {'name': 'second', 'passed': True})]
+
+    def test_job_commands_are_none_if_log_is_not_available(self, sauce_api):
+        commands = sauce_api.get_jobs_commands(['job_with_log', 'job_without_log'], timeout=1, poll_frequency=0.2)
+        assert commands == {'job_with_log': [{'message': 'Started test_one'}], 'job_without_log': None}
+
+    def test_only_uploaded_files_are_cached(self, sauce_stub, sauce_api):
+        assert sauce_api.is_uploaded('status.apk')
+        assert sauce_api.is_uploaded('status.apk')
+        assert sauce_stub.storage_requests == 1
+        assert not sauce_api.is_uploaded('missing.apk')
+        assert not sauce_api.is_uploaded('missing.apk')
+        assert sauce_stub.storage_requests == 3
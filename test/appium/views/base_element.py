@@ -5,8 +5,7 @@ from io import BytesIO
 from timeit import timeit
 
 import emoji
-import imagehash
-from PIL import Image, ImageChops, ImageStat
+from PIL import Image
 from appium.webdriver.common.mobileby import MobileBy
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver import ActionChains
@@ -14,9 +13,63 @@ from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.wait import WebDriverWait
 
 from tests import transl
+from views.image_checks import TEMPLATES_DIR, ScreenCapture, get_diff_ratio, is_image_equal_to_template, \
+    is_image_similar_to_template, template_index
+from views.keyboard import KEYCODE_DEL
+from views.locator_compiler import compile_locator
+
+
+class AdaptiveWait(object):
+    """
+    Polls `predicate` until it returns a truthy value or `timeout` is over.
+    First polls are fast and the interval grows by `backoff` up to `max_poll_frequency`,
+    so short waits end right after the condition is met and long ones don't flood the device with requests.
+    """
+
+    def __init__(self, driver, timeout=10, poll_frequency=0.25, max_poll_frequency=5, backoff=1.5,
+                 ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.max_poll_frequency = max_poll_frequency
+        self.backoff = backoff
+        self.ignored_exceptions = ignored_exceptions
+
+    def until(self, predicate, message=''):
+        end_time = time.time() + self.timeout
+        interval = self.poll_frequency
+        while True:
+            try:
+                value = predicate()
+                if value:
+                    return value
+            except self.ignored_exceptions:
+                pass
+            remaining_time = end_time - time.time()
+            if remaining_time <= 0:
+                raise TimeoutException(message)
+            time.sleep(min(interval, remaining_time))
+            interval = min(interval * self.backoff, self.max_poll_frequency)
+
+    def until_not(self, predicate, message=''):
+        return self.until(lambda: not predicate(), message)
+
+    def until_not_displayed(self, elements, message=''):
+        from views.page_snapshot import PageSnapshot
+        snapshot = PageSnapshot(self.driver)
+        return self.until_not(lambda: snapshot.invalidate().get_displayed_elements(*elements), message)
 
 
 class BaseElement(object):
+    # implicit wait used while polling in explicit waits and scrolling, can be overridden per element via kwargs
+    search_implicit_wait = 0
+    # seconds during which the last found WebElement is reused by follow-up actions instead of a new lookup
+    web_element_cache_time = 2
+    # look elements up by equivalent UiSelector/accessibility id instead of simple XPath locators
+    compile_locators = True
+    _web_element = None
+    _web_element_found_at = 0
+
     def __init__(self, driver, **kwargs):
         self.driver = driver
         self.by = MobileBy.XPATH
@@ -67,14 +120,21 @@ class BaseElement(object):
     def name(self):
         return self.__class__.__name__
 
+    @property
+    def search_strategy(self):
+        # locator itself stays XPath as it's used to build locators of other elements and for page source checks
+        if self.compile_locators:
+            return compile_locator(self.by, self.locator)
+        return self.by, self.locator
+
     def navigate(self):
         return None
 
     def find_element(self):
         for _ in range(3):
             try:
-                self.driver.info("Find `%s` by `%s`: `%s`" % (self.name, self.by, self.exclude_emoji(self.locator)))
-                return self.driver.find_element(self.by, self.locator)
+                self.driver.info("Find `%s` by `%s`: `%s`", self.name, self.by, self.exclude_emoji(self.locator))
+                return self.driver.find_element(*self.search_strategy)
             except NoSuchElementException:
                 raise NoSuchElementException(
                     "Device %s: %s by %s: `%s` is not found on the screen" % (
@@ -84,14 +144,33 @@ class BaseElement(object):
                 raise exception
 
     def find_elements(self):
-        return self.driver.find_elements(self.by, self.locator)
+        return self.driver.find_elements(*self.search_strategy)
 
-    def click(self):
-        element = self.find_element()
+    def cache_web_element(self, web_element):
+        self._web_element, self._web_element_found_at = web_element, time.time()
+        return web_element
+
+    def get_web_element(self):
+        if self._web_element is not None and \
+                time.time() - self._web_element_found_at <= self.web_element_cache_time:
+            return self._web_element
+        return self.cache_web_element(self.find_element())
+
+    def with_web_element(self, action):
+        # cached WebElement may be stale after re-rendering, so it's looked up again once
         try:
-            element.click()
-        except AttributeError:
-            raise Exception("Element: %s\n Element type: %s" % (element, type(element)))
+            return action(self.get_web_element())
+        except StaleElementReferenceException:
+            return action(self.cache_web_element(self.find_element()))
+
+    def click(self):
+        def click_element(element):
+            try:
+                element.click()
+            except AttributeError:
+                raise Exception("Element: %s\n Element type: %s" % (element, type(element)))
+
+        self.with_web_element(click_element)
         self.driver.info('Tap on found: %s' % self.name)
         return self.navigate()
 
@@ -106,7 +185,8 @@ class BaseElement(object):
             desired_element.name, desired_element.by, desired_element.locator))
         while not desired_element.is_element_displayed(1) and counter <= attempts:
             try:
-                el = self.find_element()
+                with self.driver.implicit_wait_scope(self.search_implicit_wait):
+                    el = self.find_element()
                 try:
                     el.click()
                 except AttributeError:
@@ -119,12 +199,13 @@ class BaseElement(object):
 
     def double_click(self):
         self.driver.info('Double tap on: %s' % self.name)
-        [self.find_element().click() for _ in range(2)]
+        [self.with_web_element(lambda element: element.click()) for _ in range(2)]
 
     def wait_for_element(self, seconds=10):
         try:
-            return WebDriverWait(self.driver, seconds) \
-                .until(expected_conditions.presence_of_element_located((self.by, self.locator)))
+            with self.driver.implicit_wait_scope(self.search_implicit_wait):
+                return self.cache_web_element(WebDriverWait(self.driver, seconds).until(
+                    expected_conditions.presence_of_element_located(self.search_strategy)))
         except TimeoutException:
             raise TimeoutException(
                 "Device `%s`: `%s` by` %s`: `%s` is not found on the screen after wait_for_element" % (
@@ -132,8 +213,9 @@ class BaseElement(object):
 
     def wait_for_elements(self, seconds=10):
         try:
-            return WebDriverWait(self.driver, seconds) \
-                .until(expected_conditions.presence_of_all_elements_located((self.by, self.locator)))
+            with self.driver.implicit_wait_scope(self.search_implicit_wait):
+                return WebDriverWait(self.driver, seconds) \
+                    .until(expected_conditions.presence_of_all_elements_located(self.search_strategy))
         except TimeoutException:
             raise TimeoutException(
                 "Device %s:  %s by %s:`%s` is not found on the screen after wait_for_elements" % (
@@ -141,8 +223,10 @@ class BaseElement(object):
 
     def wait_for_visibility_of_element(self, seconds=10, ignored_exceptions=None):
         try:
-            return WebDriverWait(self.driver, seconds, ignored_exceptions=ignored_exceptions) \
-                .until(expected_conditions.visibility_of_element_located((self.by, self.locator)))
+            with self.driver.implicit_wait_scope(self.search_implicit_wait):
+                return self.cache_web_element(WebDriverWait(self.driver, seconds, ignored_exceptions=ignored_exceptions)
+                                              .until(expected_conditions.visibility_of_element_located(
+                                                  self.search_strategy)))
         except TimeoutException:
             raise TimeoutException(
                 "Device %s: %s by %s:`%s` is not found on the screen after wait_for_visibility_of_element" % (
@@ -150,8 +234,9 @@ class BaseElement(object):
 
     def wait_for_invisibility_of_element(self, seconds=10):
         try:
-            return WebDriverWait(self.driver, seconds) \
-                .until(expected_conditions.invisibility_of_element_located((self.by, self.locator)))
+            with self.driver.implicit_wait_scope(self.search_implicit_wait):
+                return WebDriverWait(self.driver, seconds) \
+                    .until(expected_conditions.invisibility_of_element_located(self.search_strategy))
         except TimeoutException:
             raise TimeoutException(
                 "Device %s: %s by %s: `%s`  is still visible on the screen after %s seconds after wait_for_invisibility_of_element" % (
@@ -174,34 +259,34 @@ class BaseElement(object):
         if not isinstance(text, str):
             text = str(text)
         self.driver.info("Wait for text element `%s` to be equal to `%s`" % (self.name, text))
+        from views.page_snapshot import PageSnapshot
+        snapshot = PageSnapshot(self.driver)
         element_text = str()
-        counter = 0
-        while counter < wait_time:
-            try:
-                element_text = self.find_element().text.strip()
-            except StaleElementReferenceException:
-                time.sleep(1)
-                element_text = self.find_element().text.strip()
-            if element_text == text:
-                self.driver.info('Element %s text is equal to %s' % (self.name, text))
-                return
-            counter += 10
-            time.sleep(10)
-        self.driver.fail(message if message else "`%s` is not equal to expected `%s` in %s sec" % (
-            element_text, text, wait_time))
+
+        def is_text_equal():
+            nonlocal element_text
+            snapshot_text = snapshot.invalidate().get_element_text(self)
+            element_text = (snapshot_text if snapshot_text is not None else self.find_element().text).strip()
+            return element_text == text
+
+        try:
+            AdaptiveWait(self.driver, wait_time).until(is_text_equal)
+            self.driver.info('Element %s text is equal to %s' % (self.name, text))
+        except TimeoutException:
+            self.driver.fail(message if message else "`%s` is not equal to expected `%s` in %s sec" % (
+                element_text, text, wait_time))
 
     def scroll_to_element(self, depth: int = 9, direction='down', down_start_y=0.4, down_end_y=0.05):
         self.driver.info('Scrolling %s to %s' % (direction, self.name))
-        for _ in range(depth):
-            try:
-                return self.find_element()
-            except NoSuchElementException:
-                size = self.driver.get_window_size()
-                if direction == 'down':
-                    self.driver.swipe(500, size["height"] * down_start_y, 500, size["height"] * down_end_y)
-                else:
-                    self.driver.swipe(500, size["height"] * 0.25, 500, size["height"] * 0.8)
-        else:
+        with self.driver.implicit_wait_scope(self.search_implicit_wait):
+            for _ in range(depth):
+                try:
+                    return self.find_element()
+                except NoSuchElementException:
+                    if direction == 'down':
+                        self.driver.gestures.vertical_swipe(down_start_y, down_end_y)
+                    else:
+                        self.driver.gestures.vertical_swipe(0.25, 0.8)
             raise NoSuchElementException(
                 "Device %s: %s by %s: `%s` is not found on the screen" % (
                     self.driver.number, self.name, self.by, self.locator)) from None
@@ -216,15 +301,19 @@ class BaseElement(object):
     #     except TimeoutException:
     #         return False
 
-    def is_element_displayed(self, sec=5, ignored_exceptions=None):
+    def is_element_displayed(self, sec=5, ignored_exceptions=None, snapshot=None):
+        if snapshot:
+            return snapshot.is_element_displayed(self)
         try:
             return self.wait_for_visibility_of_element(sec, ignored_exceptions=ignored_exceptions)
         except TimeoutException:
             return False
 
-    def click_if_shown(self, sec=5):
-        if self.is_element_displayed(sec=sec):
+    def click_if_shown(self, sec=5, snapshot=None):
+        if self.is_element_displayed(sec=sec, snapshot=snapshot):
             self.click()
+            if snapshot:
+                snapshot.invalidate()
 
     def is_element_disappeared(self, sec=20):
         try:
@@ -234,25 +323,31 @@ class BaseElement(object):
 
     @property
     def text(self):
-        return self.find_element().text
+        return self.with_web_element(lambda element: element.text)
 
     @property
     def template(self):
         try:
-            return self.__template
-        except FileNotFoundError:
-            raise FileNotFoundError('Please add %s image as template' % self.name)
+            return template_index.get(self.__template_name).image
+        except AttributeError:
+            raise FileNotFoundError('Please add %s image as template' % self.name) from None
 
     @template.setter
     def template(self, value):
-        self.__template = Image.open(os.sep.join(__file__.split(os.sep)[:-1]) + '/elements_templates/%s' % value)
+        template_index.get(value)
+        self.__template_name = value
 
     @property
     def image(self):
-        return Image.open(BytesIO(base64.b64decode(self.find_element().screenshot_as_base64)))
+        return Image.open(BytesIO(base64.b64decode(
+            self.with_web_element(lambda element: element.screenshot_as_base64))))
+
+    def get_image(self, screen: ScreenCapture = None):
+        # with a screen capture the image is cropped from it instead of a separate element screenshot
+        return screen.get_element_image(self) if screen else self.image
 
     def attribute_value(self, value):
-        attribute_value = self.find_element().get_attribute(value)
+        attribute_value = self.with_web_element(lambda element: element.get_attribute(value))
         if attribute_value.lower() == 'true':
             attribute_state = True
         elif attribute_value.lower() == 'false':
@@ -263,84 +358,72 @@ class BaseElement(object):
 
     # Method-helper for renew screenshots in case if changed
     def save_new_screenshot_of_element(self, name: str):
-        full_path_to_file = os.sep.join(__file__.split(os.sep)[:-1]) + '/elements_templates/%s' % name
+        full_path_to_file = os.path.join(TEMPLATES_DIR, name)
         screen = Image.open(BytesIO(base64.b64decode(self.find_element().screenshot_as_base64)))
         screen.save(full_path_to_file)
+        template_index.invalidate(name)
 
-    def is_element_image_equals_template(self, file_name: str = ''):
+    def is_element_image_equals_template(self, file_name: str = '', screen: ScreenCapture = None):
         if file_name:
             self.template = file_name
-        return not ImageChops.difference(self.image, self.template).getbbox()
+        return is_image_equal_to_template(self.get_image(screen), template_index.get(self.__template_name))
 
-    def is_element_differs_from_template(self, file_name: str = '', diff: int = 0):
+    def is_element_differs_from_template(self, file_name: str = '', diff: int = 0, screen: ScreenCapture = None):
         if file_name:
             self.template = file_name
         result = False
-        difference = ImageChops.difference(self.image, self.template)
-        stat = ImageStat.Stat(difference)
-        diff_ratio = sum(stat.mean) / (len(stat.mean) * 255)
+        diff_ratio = get_diff_ratio(self.get_image(screen), template_index.get(self.__template_name))
         self.driver.info('Image differs from template to %s percents' % str(diff_ratio * 100))
         if diff_ratio * 100 > diff:
             result = True
         return result
 
-    def is_element_image_similar_to_template(self, template_path: str = ''):
-        image_template = os.sep.join(__file__.split(os.sep)[:-1]) + '/elements_templates/%s' % template_path
-        template = imagehash.average_hash(Image.open(image_template))
-        element_image = imagehash.average_hash(self.image)
-        return not bool(template - element_image)
+    def is_element_image_similar_to_template(self, template_path: str = '', screen: ScreenCapture = None):
+        return is_image_similar_to_template(self.get_image(screen), template_index.get(template_path))
 
     def get_element_coordinates(self):
-        element = self.find_element()
-        location = element.location
-        size = element.size
-        return location, size
+        return self.with_web_element(lambda element: (element.location, element.size))
 
     def swipe_left_on_element(self):
         self.driver.info("Swiping left on element %s" % self.name)
         location, size = self.get_element_coordinates()
         x, y = location['x'], location['y']
         width, height = size['width'], size['height']
-        self.driver.swipe(start_x=x + width * 0.75, start_y=y + height / 2, end_x=x, end_y=y + height / 2)
+        self.driver.gestures.swipe(start_x=x + width * 0.75, start_y=y + height / 2, end_x=x, end_y=y + height / 2)
 
     def swipe_right_on_element(self, width_percentage=0.9, start_x=0):
         self.driver.info("Swiping right on element %s" % self.name)
         location, size = self.get_element_coordinates()
         x, y = location['x'], location['y']
         width, height = size['width'], size['height']
-        self.driver.swipe(start_x=x + start_x, start_y=y + height / 2, end_x=x + width * width_percentage,
-                          end_y=y + height / 2)
+        self.driver.gestures.swipe(start_x=x + start_x, start_y=y + height / 2, end_x=x + width * width_percentage,
+                                   end_y=y + height / 2)
 
     def swipe_to_web_element(self, depth=700):
-        element = self.find_element()
-        location = element.location
+        location = self.with_web_element(lambda element: element.location)
         x, y = location['x'], location['y']
-        self.driver.swipe(start_x=x, start_y=y, end_x=x, end_y=depth)
+        self.driver.gestures.swipe(start_x=x, start_y=y, end_x=x, end_y=depth)
+
+    def get_center(self):
+        rect = self.with_web_element(lambda element: element.rect)
+        return int(rect['x'] + rect['width'] / 2), int(rect['y'] + rect['height'] / 2)
 
     def long_press_element(self, element_to_release_on=None):
-        element = self.find_element()
+        x, y = self.get_center()
         self.driver.info("Long press on `%s`" % self.name)
-        action = ActionChains(self.driver)
-        action.click_and_hold(element).perform()
-        time.sleep(2)
-        if element_to_release_on:
-            action.release(element_to_release_on.find_element()).perform()
-        else:
-            action.release(element).perform()
+        release_location = element_to_release_on.get_center() if element_to_release_on else None
+        self.driver.gestures.long_press(x, y, release_location=release_location)
 
     def long_press_until_element_is_shown(self, expected_element):
-        element = self.find_element()
+        x, y = self.get_center()
         self.driver.info("Long press on `%s` until expected element is shown" % self.name)
-        action = ActionChains(self.driver)
         for _ in range(3):
-            action.click_and_hold(element).perform()
-            time.sleep(2)
-            action.release(element).perform()
+            self.driver.gestures.long_press(x, y)
             if expected_element.is_element_displayed():
                 return
 
     def long_press_element_by_coordinate(self, rel_x=0.8, rel_y=0.8):
-        element = self.find_element()
+        element = self.get_web_element()
         location = element.location
         size = element.size
         x = int(location['x'] + size['width'] * rel_x)
@@ -385,26 +468,24 @@ class EditBox(BaseElement):
         super(EditBox, self).__init__(driver, **kwargs)
 
     def send_keys(self, value):
-        self.find_element().send_keys(value)
+        self.with_web_element(lambda element: element.send_keys(value))
         self.driver.info("Type `%s` to `%s`" % (self.exclude_emoji(value), self.name))
 
     def clear(self):
-        self.find_element().clear()
+        self.with_web_element(lambda element: element.clear())
         self.driver.info("Clear text in `%s`" % self.name)
 
     def delete_last_symbols(self, number_of_symbols_to_delete: int):
         self.driver.info("Delete last `%s` symbols from `%s`" % (number_of_symbols_to_delete, self.name))
         self.click()
-        for _ in range(number_of_symbols_to_delete):
-            time.sleep(1)
-            self.driver.press_keycode(67)
+        self.driver.keyboard.press_keycodes([KEYCODE_DEL] * number_of_symbols_to_delete)
 
     def paste_text_from_clipboard(self):
         self.driver.info("Paste text from clipboard into `%s`" % self.name)
         self.long_press_element()
         time.sleep(2)
         action = ActionChains(self.driver)
-        element = self.find_element()
+        element = self.get_web_element()
         location = element.location
         x, y = location['x'], location['y']
         action.move_by_offset(xoffset=x + 25, yoffset=y - 50).click().perform()
@@ -412,7 +493,7 @@ class EditBox(BaseElement):
 
     def cut_text(self):
         self.driver.info("Cut text in `%s`" % self.name)
-        element = self.find_element()
+        element = self.get_web_element()
         location = element.location
         x, y = location['x'], location['y']
         action = ActionChains(self.driver)
@@ -429,7 +510,7 @@ class Text(BaseElement):
 
     @property
     def text(self):
-        text = self.find_element().text
+        text = self.with_web_element(lambda element: element.text)
         self.driver.info("`%s` is `%s`" % (self.name, text))
         return text
 
@@ -455,7 +536,7 @@ class SilentButton(Button):
     def find_element(self):
         for _ in range(3):
             try:
-                return self.driver.find_element(self.by, self.locator)
+                return self.driver.find_element(*self.search_strategy)
             except NoSuchElementException:
                 raise NoSuchElementException(
                     "Device %s: `%s` by `%s`:`%s` not found on the screen" % (
@@ -465,12 +546,12 @@ class SilentButton(Button):
                     continue
 
     def click(self):
-        self.find_element().click()
+        self.with_web_element(lambda element: element.click())
         return self.navigate()
 
     @property
     def text(self):
-        text = self.find_element().text
+        text = self.with_web_element(lambda element: element.text)
         return text
 
 
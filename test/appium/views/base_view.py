@@ -14,7 +14,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from support.device_apps import start_web_browser
 from tests import common_password, pytest_config_global, transl
-from views.base_element import Button, BaseElement, EditBox, Text, CheckBox
+from views.base_element import AdaptiveWait, Button, BaseElement, EditBox, Text, CheckBox
 
 
 class BackButton(Button):
@@ -57,21 +57,21 @@ class HomeButton(TabButton):
 
     def navigate(self):
         from views.home_view import HomeView
-        return HomeView(self.driver)
+        return HomeView.get_instance(self.driver)
 
     def click(self, desired_view='home'):
         from views.chat_view import ChatView
         from views.home_view import HomeView
         if desired_view == 'home':
-            ChatView(self.driver).get_back_to_home_view()
-            element = HomeView(self.driver).plus_button
+            ChatView.get_instance(self.driver).get_back_to_home_view()
+            element = HomeView.get_instance(self.driver).plus_button
             if not element.is_element_displayed():
                 self.click_until_presence_of_element(element)
         elif desired_view == 'chat':
-            element = ChatView(self.driver).chat_message_input
+            element = ChatView.get_instance(self.driver).chat_message_input
             self.click_until_presence_of_element(element)
         elif desired_view == 'other_user_profile':
-            element = ChatView(self.driver).profile_nickname
+            element = ChatView.get_instance(self.driver).profile_nickname
             self.click_until_presence_of_element(element)
         return self.navigate()
 
@@ -87,7 +87,7 @@ class ChatsTab(TabButton):
 
     def navigate(self):
         from views.home_view import HomeView
-        return HomeView(self.driver)
+        return HomeView.get_instance(self.driver)
 
 
 class WalletTab(TabButton):
@@ -96,7 +96,7 @@ class WalletTab(TabButton):
 
     def navigate(self):
         from views.wallet_view import WalletView
-        return WalletView(self.driver)
+        return WalletView.get_instance(self.driver)
 
 
 class BrowserTab(TabButton):
@@ -105,7 +105,7 @@ class BrowserTab(TabButton):
 
     def navigate(self):
         from views.dapps_view import DappsView
-        return DappsView(self.driver)
+        return DappsView.get_instance(self.driver)
 
 
 class DappTabButton(TabButton):
@@ -114,7 +114,7 @@ class DappTabButton(TabButton):
 
     def navigate(self):
         from views.dapps_view import DappsView
-        return DappsView(self.driver)
+        return DappsView.get_instance(self.driver)
 
     def click(self, desired_element_text=None):
         if desired_element_text is None:
@@ -122,7 +122,7 @@ class DappTabButton(TabButton):
         elif desired_element_text == 'webview':
             self.find_element().click()
         else:
-            base_view = BaseView(self.driver)
+            base_view = BaseView.get_instance(self.driver)
             self.click_until_presence_of_element(base_view.element_by_text_part(desired_element_text))
         return self.navigate()
 
@@ -133,11 +133,11 @@ class WalletButton(TabButton):
 
     def navigate(self):
         from views.wallet_view_old_ui import WalletView
-        return WalletView(self.driver)
+        return WalletView.get_instance(self.driver)
 
     def click(self):
         from views.wallet_view_old_ui import WalletView
-        self.click_until_presence_of_element(WalletView(self.driver).multiaccount_more_options)
+        self.click_until_presence_of_element(WalletView.get_instance(self.driver).multiaccount_more_options)
         return self.navigate()
 
 
@@ -147,7 +147,7 @@ class ProfileButton(TabButton):
 
     def navigate(self):
         from views.profile_view import ProfileView
-        return ProfileView(self.driver)
+        return ProfileView.get_instance(self.driver)
 
     def click(self, desired_element_text='privacy'):
         if not self.is_element_displayed():
@@ -155,11 +155,11 @@ class ProfileButton(TabButton):
         from views.profile_view import ProfileView
         ### Profile - legacy
         # if desired_element_text == 'privacy':
-        #     self.click_until_presence_of_element(ProfileView(self.driver).privacy_and_security_button)
+        #     self.click_until_presence_of_element(ProfileView.get_instance(self.driver).privacy_and_security_button)
         # else:
-        #     base_view = BaseView(self.driver)
+        #     base_view = BaseView.get_instance(self.driver)
         #     self.click_until_presence_of_element(base_view.element_by_text_part(desired_element_text))
-        self.click_until_presence_of_element(ProfileView(self.driver).profile_password_button)
+        self.click_until_presence_of_element(ProfileView.get_instance(self.driver).profile_password_button)
         return self.navigate()
 
 
@@ -169,7 +169,7 @@ class StatusButton(TabButton):
 
     def navigate(self):
         from views.chat_view import ChatView
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
 
 class SendMessageButton(Button):
@@ -208,7 +208,7 @@ class EnterQRcodeEditBox(EditBox):
 
     def scan_qr(self, value):
         self.send_keys(value)
-        base_view = BaseView(self.driver)
+        base_view = BaseView.get_instance(self.driver)
         base_view.ok_button.click()
 
     def click(self):
@@ -257,91 +257,115 @@ class SlideButton(Button):
         self.swipe_right_on_element(width_percentage=1.3, start_x=100)
 
 
+class LazyElement(object):
+    """
+    View attribute that builds the element on first access and caches it on the view instance,
+    so creating a view doesn't construct all of its elements upfront
+    """
+
+    def __init__(self, element_class, *args, **kwargs):
+        self.element_class = element_class
+        self.args = args
+        self.kwargs = kwargs
+        self.attribute_name = None
+
+    def __set_name__(self, owner, name):
+        self.attribute_name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        element = self.element_class(view.driver, *self.args, **self.kwargs)
+        view.__dict__[self.attribute_name] = element
+        return element
+
+
 class BaseView(object):
+    # implicit wait used in view-level scrolling helpers, override in a view if its screens render slowly
+    search_implicit_wait = 0
+
+    send_message_button = LazyElement(SendMessageButton)
+    send_contact_request_button = LazyElement(Button, translation_id="send-request")
+    password_input = LazyElement(EditBox, accessibility_id="password-input")
+
+    # Old UI Tabs
+    home_button = LazyElement(HomeButton)
+    wallet_button = LazyElement(WalletButton)
+    profile_button = LazyElement(ProfileButton)
+    dapp_tab_button = LazyElement(DappTabButton)
+    status_button = LazyElement(StatusButton)
+
+    # New UI Tabs
+    communities_tab = LazyElement(CommunitiesTab)
+    chats_tab = LazyElement(ChatsTab)
+    browser_tab = LazyElement(BrowserTab)
+    wallet_tab = LazyElement(WalletTab)
+
+    # Floating screens (introduced by https://github.com/status-im/status-mobile/pull/16438)
+    chat_floating_screen = LazyElement(BaseElement, accessibility_id=":chat-floating-screen")
+    community_floating_screen = LazyElement(BaseElement, accessibility_id=":community-overview-floating-screen")
+    discover_communities_floating_screen = LazyElement(BaseElement,
+                                                       accessibility_id=":discover-communities-floating-screen")
+
+    jump_to_button = LazyElement(Button, accessibility_id="jump-to")
+
+    yes_button = LazyElement(Button, xpath="//*[@text='YES' or @text='GOT IT']")
+    no_button = LazyElement(Button, translation_id="no")
+    back_button = LazyElement(BackButton)
+    allow_button = LazyElement(AllowButton)
+    allow_all_button = LazyElement(Button, xpath="//*[@text='Allow all']")
+    allow_all_the_time = LazyElement(Button, xpath="//*[@text='Allow all the time']")
+    deny_button = LazyElement(Button, translation_id="deny", uppercase=True)
+    ok_button = LazyElement(Button, xpath="//*[@text='OK' or @text='Ok']")
+    add_button = LazyElement(Button, translation_id="add")
+    save_button = LazyElement(Button, translation_id="save")
+    done_button = LazyElement(Button, translation_id="done")
+    delete_button = LazyElement(Button, translation_id="delete", uppercase=True)
+    continue_button = LazyElement(Button, translation_id="continue", uppercase=True)
+    next_button = LazyElement(Button, accessibility_id="next-button")
+    ok_continue_button = LazyElement(Button, xpath="//*[@text='OK, CONTINUE' or @text='Okay, continue']")
+    discard_button = LazyElement(Button, xpath="//*[@text='DISCARD']")
+    confirm_button = LazyElement(Button, translation_id='confirm', uppercase=True)
+
+    cross_icon = LazyElement(Button, xpath="(//android.widget.ImageView[@content-desc='icon'])[1]")
+    close_sticker_view_icon = LazyElement(Button, xpath="//androidx.appcompat.widget.LinearLayoutCompat")
+    native_close_button = LazyElement(Button, id="android:id/aerr_close")
+    close_button = LazyElement(Button, accessibility_id="back-button")
+    navigate_up_button = LazyElement(Button, accessibility_id="Navigate Up")
+    show_roots_button = LazyElement(Button, accessibility_id="Show roots")
+    get_started_button = LazyElement(Button, translation_id="get-started")
+    ok_got_it_button = LazyElement(Button, translation_id="ok-got-it")
+    cross_icon_inside_welcome_screen_button = LazyElement(Button, accessibility_id='hide-home-button')
+    status_in_background_button = LazyElement(Button, xpath="//*[contains(@content-desc,'Status')]")
+    cancel_button = LazyElement(Button, translation_id="cancel", uppercase=True)
+    search_input = LazyElement(EditBox, accessibility_id="search-input")
+    share_button = LazyElement(Button, accessibility_id="share-my-contact-code-button")
+    qr_code_image = LazyElement(Button, accessibility_id="qr-code-image")
+    sign_in_phrase = LazyElement(SignInPhraseText)
+    toast_content_element = LazyElement(BaseElement, accessibility_id="toast-content")
+
+    # share contact screen
+    show_qr_code_button = LazyElement(Button, accessibility_id="show-qr-button")
+
+    link_to_profile_button = LazyElement(Button, accessibility_id="share-qr-code-info-text")
+    sharing_text_native = LazyElement(Text, xpath="//*[@resource-id='android:id/content_preview_text']")
+
+    # checkboxes and toggles
+    checkbox_button = LazyElement(CheckBox, accessibility_id="checkbox-off")
+    slide_button_track = LazyElement(SlideButton)
+
+    # external browser
+    open_in_status_button = LazyElement(OpenInStatusButton)
+
+    apps_button = LazyElement(Button, accessibility_id="Apps")
+    status_app_icon = LazyElement(Button, translation_id="status")
+    airplane_mode_button = LazyElement(AirplaneModeButton)
+    enter_qr_edit_box = LazyElement(EnterQRcodeEditBox)
+
     def __init__(self, driver):
         self.driver = driver
-        self.send_message_button = SendMessageButton(self.driver)
-        self.send_contact_request_button = Button(self.driver, translation_id="send-request")
-        self.password_input = EditBox(self.driver, accessibility_id="password-input")
         from views.sign_in_view import LogInButton
         self.login_button = LogInButton(self.driver)
-        self.continue_button = Button(self.driver, accessibility_id='continue-button')
-
-        # Old UI Tabs
-        self.home_button = HomeButton(self.driver)
-        self.wallet_button = WalletButton(self.driver)
-        self.profile_button = ProfileButton(self.driver)
-        self.dapp_tab_button = DappTabButton(self.driver)
-        self.status_button = StatusButton(self.driver)
-
-        # New UI Tabs
-        self.communities_tab = CommunitiesTab(self.driver)
-        self.chats_tab = ChatsTab(self.driver)
-        self.browser_tab = BrowserTab(self.driver)
-        self.wallet_tab = WalletTab(self.driver)
-
-        # Floating screens (introduced by https://github.com/status-im/status-mobile/pull/16438)
-        self.chat_floating_screen = BaseElement(self.driver, accessibility_id=":chat-floating-screen")
-        self.community_floating_screen = BaseElement(self.driver,
-                                                     accessibility_id=":community-overview-floating-screen")
-        self.discover_communities_floating_screen = BaseElement(self.driver,
-                                                                accessibility_id=":discover-communities-floating-screen")
-
-        self.jump_to_button = Button(self.driver, accessibility_id="jump-to")
-
-        self.yes_button = Button(self.driver, xpath="//*[@text='YES' or @text='GOT IT']")
-        self.no_button = Button(self.driver, translation_id="no")
-        self.back_button = BackButton(self.driver)
-        self.allow_button = AllowButton(self.driver)
-        self.allow_all_button = Button(self.driver, xpath="//*[@text='Allow all']")
-        self.allow_all_the_time = Button(self.driver, xpath="//*[@text='Allow all the time']")
-        self.deny_button = Button(self.driver, translation_id="deny", uppercase=True)
-        self.continue_button = Button(self.driver, translation_id="continue", uppercase=True)
-        self.ok_button = Button(self.driver, xpath="//*[@text='OK' or @text='Ok']")
-        self.next_button = Button(self.driver, translation_id="next")
-        self.add_button = Button(self.driver, translation_id="add")
-        self.save_button = Button(self.driver, translation_id="save")
-        self.done_button = Button(self.driver, translation_id="done")
-        self.delete_button = Button(self.driver, translation_id="delete", uppercase=True)
-        self.ok_continue_button = Button(self.driver, xpath="//*[@text='OK, CONTINUE' or @text='Okay, continue']")
-        self.discard_button = Button(self.driver, xpath="//*[@text='DISCARD']")
-        self.confirm_button = Button(self.driver, translation_id='confirm', uppercase=True)
-
-        self.cross_icon = Button(self.driver, xpath="(//android.widget.ImageView[@content-desc='icon'])[1]")
-        self.close_sticker_view_icon = Button(self.driver, xpath="//androidx.appcompat.widget.LinearLayoutCompat")
-        self.native_close_button = Button(self.driver, id="android:id/aerr_close")
-        self.close_button = Button(self.driver, accessibility_id="back-button")
-        self.navigate_up_button = Button(self.driver, accessibility_id="Navigate Up")
-        self.show_roots_button = Button(self.driver, accessibility_id="Show roots")
-        self.get_started_button = Button(self.driver, translation_id="get-started")
-        self.ok_got_it_button = Button(self.driver, translation_id="ok-got-it")
-        self.cross_icon_inside_welcome_screen_button = Button(self.driver, accessibility_id='hide-home-button')
-        self.status_in_background_button = Button(self.driver, xpath="//*[contains(@content-desc,'Status')]")
-        self.cancel_button = Button(self.driver, translation_id="cancel", uppercase=True)
-        self.search_input = EditBox(self.driver, accessibility_id="search-input")
-        self.share_button = Button(self.driver, accessibility_id="share-my-contact-code-button")
-        self.qr_code_image = Button(self.driver, accessibility_id="qr-code-image")
-        self.sign_in_phrase = SignInPhraseText(self.driver)
-        self.toast_content_element = BaseElement(self.driver, accessibility_id="toast-content")
-        self.next_button = Button(self.driver, accessibility_id="next-button")
-
-        # share contact screen
-        self.show_qr_code_button = Button(self.driver, accessibility_id="show-qr-button")
-
-        self.link_to_profile_button = Button(self.driver, accessibility_id="share-qr-code-info-text")
-        self.sharing_text_native = Text(self.driver, xpath="//*[@resource-id='android:id/content_preview_text']")
-
-        # checkboxes and toggles
-        self.checkbox_button = CheckBox(self.driver, accessibility_id="checkbox-off")
-        self.slide_button_track = SlideButton(self.driver)
-
-        # external browser
-        self.open_in_status_button = OpenInStatusButton(self.driver)
-
-        self.apps_button = Button(self.driver, accessibility_id="Apps")
-        self.status_app_icon = Button(self.driver, translation_id="status")
-        self.airplane_mode_button = AirplaneModeButton(self.driver)
-        self.enter_qr_edit_box = EnterQRcodeEditBox(self.driver)
 
         self.element_types = {
             'base': BaseElement,
@@ -350,6 +374,15 @@ class BaseView(object):
             'text': Text
         }
 
+    @classmethod
+    def get_instance(cls, driver):
+        """Returns the view already created for the driver instead of building a new one"""
+        try:
+            return driver.views[cls]
+        except KeyError:
+            view = driver.views[cls] = cls(driver)
+            return view
+
     @property
     def status_account_name(self):
         return self.get_translation_by_key('main-account')
@@ -494,23 +527,11 @@ class BaseView(object):
 
     def send_as_keyevent(self, keyevent):
         self.driver.info("Sending as keyevent `%s`" % keyevent)
-        keys = {'0': 7, '1': 8, '2': 9, '3': 10, '4': 11, '5': 12, '6': 13, '7': 14, '8': 15, '9': 16,
-
-                ',': 55, '-': 69, '+': 81, '.': 56, '/': 76, '\\': 73, ';': 74, ' ': 62,
-                '[': 71, ']': 72, '=': 70, '\n': 66, '_': [69, 5], ':': [74, 5],
-
-                'a': 29, 'b': 30, 'c': 31, 'd': 32, 'e': 33, 'f': 34, 'g': 35, 'h': 36, 'i': 37, 'j': 38,
-                'k': 39, 'l': 40, 'm': 41, 'n': 42, 'o': 43, 'p': 44, 'q': 45, 'r': 46, 's': 47, 't': 48,
-                'u': 49, 'v': 50, 'w': 51, 'x': 52, 'y': 53, 'z': 54}
-        time.sleep(3)
-        for i in keyevent:
-            if i.isalpha() and i.isupper():
-                keycode, metastate = keys[i.lower()], 64  # META_SHIFT_LEFT_ON Constant Value: 64. Example: i='n' -> 'N'
-            elif type(keys[i]) is list:
-                keycode, metastate = keys[i][0], keys[i][1]
-            else:
-                keycode, metastate = keys[i], None
-            self.driver.press_keycode(keycode=keycode, metastate=metastate)
+        try:
+            AdaptiveWait(self.driver, 3).until(self.driver.is_keyboard_shown)
+        except TimeoutException:
+            pass
+        self.driver.keyboard.type_text(keyevent)
 
     def element_by_text(self, text, element_type='button'):
         element = self.element_types[element_type](self.driver)
@@ -537,36 +558,30 @@ class BaseView(object):
     def swipe_by_custom_coordinates(self, x_start, y_start, x_end, y_end):
         """Uses percentage values based on device width/height"""
         self.driver.info("Swiping based on custom coordinates relative to device height/width")
-        size = self.driver.get_window_size()
-        self.driver.swipe(size["width"] * x_start, size["height"] * y_start, size["width"] * x_end,
-                          size["height"] * y_end)
+        self.driver.gestures.swipe_relative(x_start, y_start, x_end, y_end)
 
     def swipe_up(self):
         self.driver.info("Swiping up")
-        size = self.driver.get_window_size()
-        self.driver.swipe(size["width"] * 0.5, size["height"] * 0.8, size["width"] * 0.5, size["height"] * 0.2)
+        self.driver.gestures.swipe_relative(0.5, 0.8, 0.5, 0.2)
 
     def swipe_down(self):
         self.driver.info("Swiping down")
-        size = self.driver.get_window_size()
-        self.driver.swipe(size["width"] * 0.5, size["height"] * 0.2, size["width"] * 0.5, size["height"] * 0.8)
+        self.driver.gestures.swipe_relative(0.5, 0.2, 0.5, 0.8)
 
     def swipe_left(self):
         self.driver.info("Swiping left")
-        size = self.driver.get_window_size()
-        self.driver.swipe(size["width"] * 0.8, size["height"] * 0.8, size["width"] * 0.2, size["height"] * 0.8)
+        self.driver.gestures.swipe_relative(0.8, 0.8, 0.2, 0.8)
 
     def swipe_right(self):
         self.driver.info("Swiping right")
-        size = self.driver.get_window_size()
-        self.driver.swipe(size["width"] * 0.2, size["height"] * 0.8, size["width"] * 0.8, size["height"] * 0.8)
+        self.driver.gestures.swipe_relative(0.2, 0.8, 0.8, 0.8)
 
     def switch_to_mobile(self, before_login=False, sync=False):
         self.driver.info("Turning on mobile data, syncing is %s" % str(sync))
         self.driver.set_network_connection(4)
         if before_login is False:
             from views.home_view import HomeView
-            home = HomeView(self.driver)
+            home = HomeView.get_instance(self.driver)
             if sync is True:
                 home.continue_syncing_button.wait_and_click()
             else:
@@ -574,56 +589,67 @@ class BaseView(object):
 
     def pull_to_refresh(self, wait_sec=20):
         self.driver.info("Pull to refresh view")
-        self.driver.swipe(500, 500, 500, 1000)
+        self.driver.gestures.swipe(500, 500, 500, 1000)
         time.sleep(wait_sec)
 
+    def get_page_snapshot(self):
+        from views.page_snapshot import PageSnapshot
+        return PageSnapshot(self.driver)
+
+    def get_displayed_elements(self, *elements):
+        return self.get_page_snapshot().get_displayed_elements(*elements)
+
+    def get_screen_capture(self):
+        from views.image_checks import ScreenCapture
+        return ScreenCapture(self.driver)
+
     def get_status_test_dapp_view(self):
         from views.web_views.status_test_dapp import StatusTestDAppView
-        return StatusTestDAppView(self.driver)
+        return StatusTestDAppView.get_instance(self.driver)
 
     def get_dapp_view(self):
         from views.dapps_view import DappsView
-        return DappsView(self.driver)
+        return DappsView.get_instance(self.driver)
 
     def get_home_view(self):
         from views.home_view import HomeView
-        return HomeView(self.driver)
+        return HomeView.get_instance(self.driver)
 
     def get_chat_view(self):
         from views.chat_view import ChatView
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
     def get_community_view(self):
         from views.chat_view import CommunityView
-        return CommunityView(self.driver)
+        return CommunityView.get_instance(self.driver)
 
     def get_sign_in_view(self):
         from views.sign_in_view import SignInView
-        return SignInView(self.driver)
+        return SignInView.get_instance(self.driver)
 
     def get_send_transaction_view(self):
         from views.send_transaction_view import SendTransactionView
-        return SendTransactionView(self.driver)
+        return SendTransactionView.get_instance(self.driver)
 
     def get_base_web_view(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
     def get_profile_view(self):
         from views.profile_view import ProfileView
-        return ProfileView(self.driver)
+        return ProfileView.get_instance(self.driver)
 
     def get_transaction_view(self):
         from views.transactions_view import TransactionsView
-        return TransactionsView(self.driver)
+        return TransactionsView.get_instance(self.driver)
 
     def get_wallet_view(self):
         from views.wallet_view import WalletView
-        return WalletView(self.driver)
+        return WalletView.get_instance(self.driver)
 
     def get_webview_view(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
     @staticmethod
     def get_unique_amount():
@@ -816,7 +842,7 @@ class BaseView(object):
 
     def get_empty_dapp_tab(self):
         from views.web_views.base_web_view import BaseWebView
-        web_view = BaseWebView(self.driver)
+        web_view = BaseWebView.get_instance(self.driver)
         web_view.options_button.click()
         if web_view.new_tab_button.is_element_displayed():
             web_view.new_tab_button.click()
@@ -824,7 +850,7 @@ class BaseView(object):
 
     def get_test_assets(self, token=False, keycard=False):
         from views.home_view import HomeView
-        status_test_dapp = HomeView(self.driver).open_status_test_dapp()
+        status_test_dapp = HomeView.get_instance(self.driver).open_status_test_dapp()
         status_test_dapp.wait_for_d_aap_to_load()
 
         self.just_fyi("Requesting test assets in dapp")
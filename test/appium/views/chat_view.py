@@ -9,9 +9,10 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException,
 from selenium.webdriver import ActionChains
 
 from tests import emojis, common_password
-from views.base_element import Button, EditBox, Text, BaseElement, SilentButton
-from views.base_view import BaseView
+from views.base_element import AdaptiveWait, Button, EditBox, Text, BaseElement, SilentButton
+from views.base_view import BaseView, LazyElement
 from views.home_view import HomeView
+from views.page_snapshot import PageSnapshot
 from views.profile_view import ProfilePictureElement
 
 
@@ -30,7 +31,7 @@ class SendCommand(Button):
 
     def navigate(self):
         from views.send_transaction_view import SendTransactionView
-        return SendTransactionView(self.driver)
+        return SendTransactionView.get_instance(self.driver)
 
     def click(self):
         self.wait_for_element().click()
@@ -43,7 +44,7 @@ class RequestCommand(Button):
 
     def navigate(self):
         from views.send_transaction_view import SendTransactionView
-        return SendTransactionView(self.driver)
+        return SendTransactionView.get_instance(self.driver)
 
     def click(self):
         self.wait_for_element().click()
@@ -55,7 +56,7 @@ class GroupInfoButton(Button):
         super().__init__(driver, translation_id="group-info")
 
     def navigate(self):
-        return GroupChatInfoView(self.driver)
+        return GroupChatInfoView.get_instance(self.driver)
 
     def click(self):
         self.wait_for_element().click()
@@ -68,7 +69,7 @@ class OpenInStatusButton(Button):
 
     def navigate(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
 
 class ViewProfileButton(Button):
@@ -76,7 +77,7 @@ class ViewProfileButton(Button):
         super().__init__(driver, translation_id="view-profile")
 
     def navigate(self):
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
 
 class ChatOptionsButton(Button):
@@ -84,10 +85,10 @@ class ChatOptionsButton(Button):
         super().__init__(driver, accessibility_id="chat-menu-button")
 
     def click(self):
-        self.click_until_presence_of_element(HomeView(self.driver).mark_all_messages_as_read_button)
+        self.click_until_presence_of_element(HomeView.get_instance(self.driver).mark_all_messages_as_read_button)
 
     def navigate(self):
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
 
 class ProfileSendMessageButton(Button):
@@ -95,7 +96,7 @@ class ProfileSendMessageButton(Button):
         super().__init__(driver, accessibility_id="icon, Send message")
 
     def navigate(self):
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
 
 class ChatElementByText(Text):
@@ -190,39 +191,46 @@ class ChatElementByText(Text):
 
     @property
     def status(self) -> str:
-        Text(self.driver, xpath=self.locator).click()
+        sending_element = Text(self.driver, prefix=self.locator, xpath="//*[@content-desc='message-sending']")
         status_element = Text(self.driver, prefix=self.locator,
                               xpath="//*[@content-desc='message-status']/android.widget.TextView")
-        status = ''
-        i = 1
-
-        while i < 5:
-            i += 1
-            if Text(self.driver, prefix=self.locator,
-                    xpath="//*[@content-desc='message-sending']").is_element_displayed(2):
-                status = "Sending"
-                break
-            else:
-                Text(self.driver, xpath=self.locator).click()
-                try:
-                    if status_element.is_element_displayed(2):
-                        status = status_element.text
-                        break
-                except StaleElementReferenceException:
-                    pass
-                time.sleep(2)
-        return status
+        message = Text(self.driver, xpath=self.locator)
+        message.click()
+        last_tap_time = time.time()
+        snapshot = PageSnapshot(self.driver)
+
+        def get_status():
+            nonlocal last_tap_time
+            snapshot.invalidate()
+            if snapshot.is_element_displayed(sending_element):
+                return "Sending"
+            if snapshot.is_element_displayed(status_element):
+                return snapshot.get_element_text(status_element)
+            # status is shown by tap on the message, which may be missed while the message is rendered;
+            # a tap before the status had time to appear would hide it
+            if time.time() - last_tap_time >= 2:
+                message.click()
+                last_tap_time = time.time()
+
+        try:
+            return AdaptiveWait(self.driver, 10, max_poll_frequency=2).until(get_status)
+        except TimeoutException:
+            return ''
 
     def wait_for_status_to_be(self, expected_status: str, timeout: int = 30):
         self.driver.info("Waiting for message to be sent for %s sec" % timeout)
-        start_time = time.time()
         current_status = 'not set'
-        while time.time() - start_time <= timeout:
+
+        def is_status_expected():
+            nonlocal current_status
             current_status = self.status
-            if current_status == expected_status:
-                return
-            time.sleep(1)
-        raise TimeoutException("Message status was not changed to %s, it's %s" % (expected_status, current_status))
+            return current_status == expected_status
+
+        try:
+            AdaptiveWait(self.driver, timeout).until(is_status_expected)
+        except TimeoutException:
+            raise TimeoutException(
+                "Message status was not changed to %s, it's %s" % (expected_status, current_status)) from None
 
     @property
     def sent_status_checkmark(self) -> object:
@@ -320,7 +328,7 @@ class UsernameOptions(Button):
         super().__init__(driver, xpath="//*[@text='%s']/..//*[@content-desc='menu-option']" % username)
 
     def navigate(self):
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
     def click(self):
         self.scroll_to_element()
@@ -368,10 +376,10 @@ class CommunityView(HomeView):
 
         #### OLD UI
         # Main community page (list with channels)
-        self.add_channel_button = HomeView(self.driver).plus_button
+        self.add_channel_button = HomeView.get_instance(self.driver).plus_button
         self.community_create_a_channel_button = Button(self.driver, accessibility_id="community-create-channel")
         self.channel_name_edit_box = EditBox(self.driver, translation_id="name-your-channel-placeholder")
-        self.channel_descripton = ChatView(self.driver).community_description_edit_box
+        self.channel_descripton = ChatView.get_instance(self.driver).community_description_edit_box
         self.community_options_button = Button(self.driver, accessibility_id="community-options-for-community")
         self.view_members_button = Button(self.driver, accessibility_id="view-members")
         self.community_info_button = Button(self.driver, translation_id="community-info")
@@ -416,7 +424,7 @@ class CommunityView(HomeView):
 
     def join_community(self, password=common_password, open_community=True):
         self.driver.info("Joining community")
-        ChatView(self.driver).chat_element_by_text("https://status.app/c/").click_on_link_inside_message_body()
+        ChatView.get_instance(self.driver).chat_element_by_text("https://status.app/c/").click_on_link_inside_message_body()
         self.join_button.wait_and_click(120)
         self.slide_to_request_to_join_button.swipe_right_on_element(width_percentage=16)
         self.password_input.send_keys(password)
@@ -435,7 +443,7 @@ class CommunityView(HomeView):
         self.community_create_a_channel_button.wait_and_click()
         self.channel_name_edit_box.send_keys(name)
         self.channel_descripton.send_keys(description)
-        chat_view = ChatView(self.driver)
+        chat_view = ChatView.get_instance(self.driver)
         chat_view.confirm_create_in_community_button.click()
         self.get_chat(name).click()
         return chat_view
@@ -569,8 +577,8 @@ class CommunityLinkPreviewMessage(ChatElementByText):
                                  xpath="/..//*[@text='%s']" % self.get_translation_by_key("view"))
 
         CommunityViewButton(self.driver, self.locator).click()
-        CommunityView(self.driver).request_access_button.wait_for_element(20)
-        return CommunityView(self.driver)
+        CommunityView.get_instance(self.driver).request_access_button.wait_for_element(20)
+        return CommunityView.get_instance(self.driver)
 
 
 class TransactionMessage(ChatElementByText):
@@ -621,7 +629,7 @@ class OutgoingTransaction(TransactionMessage):
 
             def navigate(self):
                 from views.send_transaction_view import SendTransactionView
-                return SendTransactionView(self.driver)
+                return SendTransactionView.get_instance(self.driver)
 
             def click(self):
                 self.wait_for_element().click()
@@ -644,7 +652,7 @@ class IncomingTransaction(TransactionMessage):
 
             def navigate(self):
                 from views.send_transaction_view import SendTransactionView
-                return SendTransactionView(self.driver)
+                return SendTransactionView.get_instance(self.driver)
 
             def click(self):
                 self.wait_for_element().click()
@@ -730,148 +738,142 @@ class ChatMessageInput(EditBox):
 
 
 class ChatView(BaseView):
+    # Start new chat
+    public_key_edit_box = LazyElement(EditBox, accessibility_id="enter-contact-code-input")
+    scan_contact_code_button = LazyElement(Button, accessibility_id="scan-contact-code-button")
+    view_profile_new_contact_button = LazyElement(Button, accessibility_id="new-contact-button")
+
+    # Chat header
+    add_to_contacts = LazyElement(Button, accessibility_id="add-to-contacts-button")
+    ## Options
+    chat_options = LazyElement(ChatOptionsButton)
+    delete_chat_button = LazyElement(Button, translation_id="close-chat")
+    clear_history_button = LazyElement(Button, translation_id="clear-history")
+    reply_message_button = LazyElement(Button, translation_id="message-reply")
+    share_chat_button = LazyElement(Button, accessibility_id="share-chat-button")
+    clear_button = LazyElement(Button, translation_id="clear-history")
+    view_profile_button = LazyElement(ViewProfileButton)
+    view_profile_by_avatar_button = LazyElement(Button, accessibility_id="member-photo")
+    user_options = LazyElement(Button, accessibility_id="options")
+    open_in_status_button = LazyElement(OpenInStatusButton)
+    close_modal_view_from_chat_button = LazyElement(Button, xpath="//androidx.appcompat.widget.LinearLayoutCompat")
+
+    # Chat input
+    chat_message_input = LazyElement(ChatMessageInput)
+    cancel_reply_button = LazyElement(Button, accessibility_id="reply-cancel-button")
+    url_preview_composer = LazyElement(Button, accessibility_id="url-preview")
+    url_preview_composer_text = LazyElement(Text, xpath='//*[@content-desc="url-preview"]//*[@content-desc="title"]')
+    quote_username_in_message_input = LazyElement(EditBox,
+                                                  xpath="//*[@content-desc='reply-cancel-button']/preceding::android.widget.TextView[3]")
+    chat_item = LazyElement(Button, xpath="(//*[@content-desc='chat-item'])[1]")
+    chat_name_editbox = LazyElement(EditBox, accessibility_id="chat-name-input")
+    commands_button = LazyElement(CommandsButton)
+    send_command = LazyElement(SendCommand)
+    request_command = LazyElement(RequestCommand)
+
+    # General chat view
+    history_start_icon = LazyElement(Button, accessibility_id="history-chat")
+    unpin_message_popup = LazyElement(UnpinMessagePopUp)
+    contact_request_button = LazyElement(Button, accessibility_id="contact-request--button")
+
+    # Stickers
+    show_stickers_button = LazyElement(Button, accessibility_id="show-stickers-icon")
+    get_stickers = LazyElement(Button, translation_id="get-stickers")
+    sticker_icon = LazyElement(Button, accessibility_id="sticker-icon")
+    sticker_message = LazyElement(Button, accessibility_id="sticker-message")
+
+    # Images
+    show_images_button = LazyElement(Button, accessibility_id="open-images-button")
+    take_photo_button = LazyElement(Button, accessibility_id="camera-button")
+    snap_button = LazyElement(Button, accessibility_id="snap")
+    image_from_gallery_button = LazyElement(Button, accessibility_id="open-gallery")
+    images_confirm_selection_button = LazyElement(Button, accessibility_id="confirm-selection")
+    images_area_in_gallery = LazyElement(Button,
+                                         xpath="//*[@content-desc='open-gallery']/following-sibling::android.view.ViewGroup[1]")
+    image_message_in_chat = LazyElement(Button, accessibility_id="image-message")
+    save_image_button = LazyElement(Button, translation_id="save")
+    recent_image_in_gallery = LazyElement(Button, xpath="//*[contains(@resource-id,'thumbnail')]")
+    cancel_send_image_button = LazyElement(Button, accessibility_id="cancel-send-image")
+    share_image_icon_button = LazyElement(Button, accessibility_id="share-image")
+    view_image_options_button = LazyElement(Button, accessibility_id="image-options")
+    save_image_icon_button = LazyElement(Button, accessibility_id="save-image")
+    image_in_android_messenger = LazyElement(Button, accessibility_id="Image")
+
+    # Audio
+    audio_message_in_chat = LazyElement(Button, accessibility_id="audio-message")
+    audio_message_button = LazyElement(Button, accessibility_id="show-audio-message-icon")
+    record_audio_button = LazyElement(Button, accessibility_id="start-stop-audio-recording-button")
+    cancel_audio_message_button = LazyElement(Button, accessibility_id="cancel-message-button")
+    send_audio_message_button = LazyElement(Button, accessibility_id="send-message-button")
+    play_pause_audio_message_button = LazyElement(Button, accessibility_id="play-pause-audio-message-button")
+    audio_message_in_chat_timer = LazyElement(Text,
+                                              xpath="//*[@content-desc='play-pause-audio-message-button']/../..//android.widget.TextView[1]")
+    audio_message_recorded_time = LazyElement(Text, accessibility_id="audio-message-recorded-time")
+
+    # Group chats
+    group_info = LazyElement(GroupInfoButton)
+    leave_chat_button = LazyElement(Button, accessibility_id="leave-chat-button")
+    leave_button = LazyElement(Button, translation_id="leave", uppercase=True)
+    join_chat_button = LazyElement(Button, accessibility_id="join-chat-button")
+    decline_invitation_button = LazyElement(Button, translation_id="group-chat-decline-invitation")
+    remove_user_button = LazyElement(Button, accessibility_id="remove-from-chat")
+    make_admin_button = LazyElement(Button, accessibility_id="make-admin")
+    edit_group_chat_name_button = LazyElement(Button, accessibility_id="edit-button")
+    edit_group_chat_name_edit_box = LazyElement(EditBox, accessibility_id="new-chat-name")
+    done_button = LazyElement(Button, accessibility_id="done")
+    create_group_chat_button = LazyElement(Button, accessibility_id="Create group chat")
+    ## Group invites
+    group_invite_button = LazyElement(Button, accessibility_id="invite-chat-button")
+    group_invite_link_text = LazyElement(Text, xpath="//*[@content-desc='invitation-link']/android.widget.TextView")
+    introduce_yourself_edit_box = LazyElement(EditBox, accessibility_id="introduce-yourself-input")
+    request_membership_button = LazyElement(Button, translation_id="request-membership")
+    group_membership_request_button = LazyElement(Button, accessibility_id="invitation-requests-button")
+    accept_group_invitation_button = LazyElement(Button, accessibility_id="accept-invitation-button")
+    decline_group_invitation_button = LazyElement(Button, accessibility_id="decline-invitation-button")
+    retry_group_invite_button = LazyElement(Button, accessibility_id="retry-button")
+    remove_group_invite_button = LazyElement(Button, accessibility_id="remove-group-button")
+
+    # Contact's profile
+    contact_profile_picture = LazyElement(ProfilePictureElement)
+    profile_send_message_button = LazyElement(ProfileSendMessageButton)
+    profile_options_button = LazyElement(Button, accessibility_id="contact-actions")
+    profile_block_contact_button = LazyElement(Button, accessibility_id="block-user")
+    confirm_block_contact_button = LazyElement(Button, accessibility_id="block-contact")
+    unblock_contact_button = LazyElement(Button, accessibility_id="icon, Unblock")
+    profile_mute_contact = LazyElement(Button, accessibility_id="Mute-item-button")
+    profile_unmute_contact = LazyElement(Button, accessibility_id="Unmute-item-button")
+    profile_send_contact_request_button = LazyElement(Button, accessibility_id="icon, Send contact request")
+    contact_request_message_input = LazyElement(EditBox, accessibility_id="contact-request-message")
+    confirm_send_contact_request_button = LazyElement(EditBox, accessibility_id="send-contact-request")
+    profile_add_to_contacts_button = LazyElement(Button, accessibility_id="Add to contacts-item-button")
+    profile_remove_from_contacts = LazyElement(Button, accessibility_id="Remove from contacts-item-button")
+    profile_details = LazyElement(Button, accessibility_id="share-button")
+    profile_nickname = LazyElement(Text, xpath="//*[@content-desc='profile-nickname-item']/android.widget.TextView[2]")
+    profile_nickname_button = LazyElement(Button, accessibility_id="profile-nickname-item")
+    pinned_messages_button = LazyElement(PinnedMessagesOnProfileButton)
+    nickname_input_field = LazyElement(EditBox, accessibility_id="nickname-input")
+    remove_from_contacts = LazyElement(Button, accessibility_id="Remove from contacts-item-button")
+
+    # Communities
+    create_community_button = LazyElement(Button, translation_id="create-community")
+    community_name_edit_box = LazyElement(EditBox, translation_id="name-your-community-placeholder")
+    set_community_image_button = LazyElement(Button, translation_id='community-thumbnail-image',
+                                             suffix='/following-sibling::android.view.ViewGroup')
+    confirm_create_in_community_button = LazyElement(Button, translation_id="create")
+    mentions_list = LazyElement(BaseElement, accessibility_id="mentions-list")
+
+    # New UI
+    pinned_messages_count = LazyElement(Button, xpath="//*[@content-desc='pins-count']//android.widget.TextView")
+    pinned_messages_list = LazyElement(PinnedMessagesList)
+    pin_limit_popover = LazyElement(BaseElement, translation_id="pin-limit-reached")
+    view_pinned_messages_button = LazyElement(Button, accessibility_id="pinned-banner")
+
     def __init__(self, driver):
         super().__init__(driver)
 
-        # Start new chat
-        self.public_key_edit_box = EditBox(self.driver, accessibility_id="enter-contact-code-input")
-        self.scan_contact_code_button = Button(self.driver, accessibility_id="scan-contact-code-button")
-        self.view_profile_new_contact_button = Button(self.driver, accessibility_id="new-contact-button")
-
-        # Chat header
-        self.add_to_contacts = Button(self.driver, accessibility_id="add-to-contacts-button")
-        ## Options
-        self.chat_options = ChatOptionsButton(self.driver)
-        self.delete_chat_button = Button(self.driver, translation_id="close-chat")
-        self.clear_history_button = Button(self.driver, translation_id="clear-history")
-        self.reply_message_button = Button(self.driver, translation_id="message-reply")
-        self.share_chat_button = Button(self.driver, accessibility_id="share-chat-button")
-        self.clear_button = Button(self.driver, translation_id="clear-history")
-        self.view_profile_button = ViewProfileButton(self.driver)
-        self.view_profile_by_avatar_button = Button(self.driver, accessibility_id="member-photo")
-        self.user_options = Button(self.driver, accessibility_id="options")
-        self.open_in_status_button = OpenInStatusButton(self.driver)
-        self.close_modal_view_from_chat_button = Button(self.driver,
-                                                        xpath="//androidx.appcompat.widget.LinearLayoutCompat")
-
-        # Chat input
-        self.chat_message_input = ChatMessageInput(self.driver)
-        self.cancel_reply_button = Button(self.driver, accessibility_id="reply-cancel-button")
-        self.url_preview_composer = Button(self.driver, accessibility_id="url-preview")
-        self.url_preview_composer_text = Text(self.driver,
-                                              xpath='//*[@content-desc="url-preview"]//*[@content-desc="title"]')
-        self.quote_username_in_message_input = EditBox(
-            self.driver,
-            xpath="//*[@content-desc='reply-cancel-button']/preceding::android.widget.TextView[3]")
-        self.chat_item = Button(self.driver, xpath="(//*[@content-desc='chat-item'])[1]")
-        self.chat_name_editbox = EditBox(self.driver, accessibility_id="chat-name-input")
-        self.commands_button = CommandsButton(self.driver)
-        self.send_command = SendCommand(self.driver)
-        self.request_command = RequestCommand(self.driver)
-
-        # General chat view
-        self.history_start_icon = Button(self.driver, accessibility_id="history-chat")
-        self.unpin_message_popup = UnpinMessagePopUp(self.driver)
-        self.contact_request_button = Button(self.driver, accessibility_id="contact-request--button")
-
-        # Stickers
-        self.show_stickers_button = Button(self.driver, accessibility_id="show-stickers-icon")
-        self.get_stickers = Button(self.driver, translation_id="get-stickers")
-        self.sticker_icon = Button(self.driver, accessibility_id="sticker-icon")
-        self.sticker_message = Button(self.driver, accessibility_id="sticker-message")
-
-        # Images
-        self.show_images_button = Button(self.driver, accessibility_id="open-images-button")
-        self.take_photo_button = Button(self.driver, accessibility_id="camera-button")
-        self.snap_button = Button(self.driver, accessibility_id="snap")
-        self.image_from_gallery_button = Button(self.driver, accessibility_id="open-gallery")
-        self.images_confirm_selection_button = Button(self.driver, accessibility_id="confirm-selection")
-        self.images_area_in_gallery = Button(self.driver,
-                                             xpath="//*[@content-desc='open-gallery']/following-sibling::android.view.ViewGroup[1]")
-        self.image_message_in_chat = Button(self.driver, accessibility_id="image-message")
-        self.save_image_button = Button(self.driver, translation_id="save")
-        self.recent_image_in_gallery = Button(self.driver,
-                                              xpath="//*[contains(@resource-id,'thumbnail')]")
-        self.cancel_send_image_button = Button(self.driver, accessibility_id="cancel-send-image")
-        self.share_image_icon_button = Button(self.driver, accessibility_id="share-image")
-        self.view_image_options_button = Button(self.driver, accessibility_id="image-options")
-        self.save_image_icon_button = Button(self.driver, accessibility_id="save-image")
-        self.image_in_android_messenger = Button(self.driver, accessibility_id="Image")
-
-        # Audio
-        self.audio_message_in_chat = Button(self.driver, accessibility_id="audio-message")
-        self.audio_message_button = Button(self.driver, accessibility_id="show-audio-message-icon")
-        self.record_audio_button = Button(self.driver, accessibility_id="start-stop-audio-recording-button")
-        self.cancel_audio_message_button = Button(self.driver, accessibility_id="cancel-message-button")
-        self.send_audio_message_button = Button(self.driver, accessibility_id="send-message-button")
-        self.play_pause_audio_message_button = Button(self.driver, accessibility_id="play-pause-audio-message-button")
-        self.audio_message_in_chat_timer = Text(self.driver,
-                                                xpath="//*[@content-desc='play-pause-audio-message-button']/../..//android.widget.TextView[1]")
-        self.audio_message_recorded_time = Text(self.driver, accessibility_id="audio-message-recorded-time")
-
-        # Group chats
-        self.group_info = GroupInfoButton(self.driver)
-        self.leave_chat_button = Button(self.driver, accessibility_id="leave-chat-button")
-        self.leave_button = Button(self.driver, translation_id="leave", uppercase=True)
-        self.join_chat_button = Button(self.driver, accessibility_id="join-chat-button")
-        self.decline_invitation_button = Button(self.driver, translation_id="group-chat-decline-invitation")
-        self.remove_user_button = Button(self.driver, accessibility_id="remove-from-chat")
-        self.make_admin_button = Button(self.driver, accessibility_id="make-admin")
-        self.edit_group_chat_name_button = Button(self.driver, accessibility_id="edit-button")
-        self.edit_group_chat_name_edit_box = EditBox(self.driver, accessibility_id="new-chat-name")
-        self.done_button = Button(self.driver, accessibility_id="done")
-        self.create_group_chat_button = Button(self.driver, accessibility_id="Create group chat")
-        ## Group invites
-        self.group_invite_button = Button(self.driver, accessibility_id="invite-chat-button")
-        self.group_invite_link_text = Text(self.driver,
-                                           xpath="//*[@content-desc='invitation-link']/android.widget.TextView")
-        self.introduce_yourself_edit_box = EditBox(self.driver, accessibility_id="introduce-yourself-input")
-        self.request_membership_button = Button(self.driver, translation_id="request-membership")
-        self.group_membership_request_button = Button(self.driver, accessibility_id="invitation-requests-button")
-        self.accept_group_invitation_button = Button(self.driver, accessibility_id="accept-invitation-button")
-        self.decline_group_invitation_button = Button(self.driver, accessibility_id="decline-invitation-button")
-        self.retry_group_invite_button = Button(self.driver, accessibility_id="retry-button")
-        self.remove_group_invite_button = Button(self.driver, accessibility_id="remove-group-button")
-
-        # Contact's profile
-        self.contact_profile_picture = ProfilePictureElement(self.driver)
-        self.profile_send_message_button = ProfileSendMessageButton(self.driver)
-        self.profile_options_button = Button(self.driver, accessibility_id="contact-actions")
-        self.profile_block_contact_button = Button(self.driver, accessibility_id="block-user")
-        self.confirm_block_contact_button = Button(self.driver, accessibility_id="block-contact")
-        self.unblock_contact_button = Button(self.driver, accessibility_id="icon, Unblock")
-        self.profile_mute_contact = Button(self.driver, accessibility_id="Mute-item-button")
-        self.profile_unmute_contact = Button(self.driver, accessibility_id="Unmute-item-button")
-        self.profile_send_contact_request_button = Button(self.driver, accessibility_id="icon, Send contact request")
-        self.contact_request_message_input = EditBox(self.driver, accessibility_id="contact-request-message")
-        self.confirm_send_contact_request_button = EditBox(self.driver, accessibility_id="send-contact-request")
-        self.profile_add_to_contacts_button = Button(self.driver, accessibility_id="Add to contacts-item-button")
-        self.profile_remove_from_contacts = Button(self.driver, accessibility_id="Remove from contacts-item-button")
-        self.profile_details = Button(self.driver, accessibility_id="share-button")
-        self.profile_nickname = Text(self.driver,
-                                     xpath="//*[@content-desc='profile-nickname-item']/android.widget.TextView[2]")
-        self.profile_nickname_button = Button(self.driver, accessibility_id="profile-nickname-item")
-        self.pinned_messages_button = PinnedMessagesOnProfileButton(self.driver)
-        self.nickname_input_field = EditBox(self.driver, accessibility_id="nickname-input")
-        self.remove_from_contacts = Button(self.driver, accessibility_id="Remove from contacts-item-button")
-
-        # Communities
-        self.create_community_button = Button(self.driver, translation_id="create-community")
-        self.community_name_edit_box = EditBox(self.driver, translation_id="name-your-community-placeholder")
         self.community_description_edit_box = EditBox(self.driver, xpath='//android.widget.EditText[@text="%s"]' %
                                                                          self.get_translation_by_key(
                                                                              "give-a-short-description-community"))
-        self.set_community_image_button = Button(self.driver, translation_id='community-thumbnail-image',
-                                                 suffix='/following-sibling::android.view.ViewGroup')
-        self.confirm_create_in_community_button = Button(self.driver, translation_id="create")
-        self.mentions_list = BaseElement(self.driver, accessibility_id="mentions-list")
-
-        # New UI
-        self.pinned_messages_count = Button(self.driver,
-                                            xpath="//*[@content-desc='pins-count']//android.widget.TextView")
-        self.pinned_messages_list = PinnedMessagesList(self.driver)
-        self.pin_limit_popover = BaseElement(self.driver, translation_id="pin-limit-reached")
-        self.view_pinned_messages_button = Button(self.driver, accessibility_id="pinned-banner")
 
     def get_outgoing_transaction(self, account=None, transaction_value=None) -> object:
         if account is None:
@@ -1109,14 +1111,13 @@ class ChatView(BaseView):
 
     def scroll_to_start_of_history(self, depth=20):
         self.driver.info('Scrolling th the start of chat history')
-        for _ in range(depth):
-            try:
-                return self.history_start_icon.find_element()
-            except NoSuchElementException:
-                size = self.driver.get_window_size()
-                self.driver.swipe(500, size["height"] * 0.25, 500, size["height"] * 0.8)
-        else:
-            raise Exception('Start of chat history is not reached!')
+        with self.driver.implicit_wait_scope(self.search_implicit_wait):
+            for _ in range(depth):
+                try:
+                    return self.history_start_icon.find_element()
+                except NoSuchElementException:
+                    self.driver.gestures.vertical_swipe(0.25, 0.8)
+        raise Exception('Start of chat history is not reached!')
 
     def user_profile_image_in_mentions_list(self, username):
         return Button(self.driver, xpath="//*[@content-desc='suggestions-list']//*[@text='%s']/"
@@ -1191,7 +1192,7 @@ class ChatView(BaseView):
             xpath="//*[@content-desc='community-name-text'][starts-with(@text,'%s')]/.." % community_name
         )
         community_button.click()
-        return CommunityView(self.driver)
+        return CommunityView.get_instance(self.driver)
 
     def user_list_element_by_name(self, user_name: str):
         return BaseElement(self.driver, xpath="//*[@content-desc='user-list']//*[@text='%s']" % user_name)
@@ -9,11 +9,11 @@ class DiscoverDappsButton(Button):
 
     def navigate(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
     def click(self):
         from views.web_views.base_web_view import BaseWebView
-        self.click_until_presence_of_element(BaseWebView(self.driver).browser_refresh_page_button)
+        self.click_until_presence_of_element(BaseWebView.get_instance(self.driver).browser_refresh_page_button)
         return self.navigate()
 
 
@@ -61,7 +61,7 @@ class DappsView(BaseView):
     def open_url(self, url):
         self.driver.info("Open url '%s'" % url)
         from views.web_views.base_web_view import BaseWebView
-        web_view = BaseWebView(self.driver)
+        web_view = BaseWebView.get_instance(self.driver)
         if not self.enter_url_editbox.is_element_displayed():
             web_view.open_tabs_button.click_if_shown()
             web_view.open_new_tab_plus_button.click_if_shown()
@@ -70,7 +70,7 @@ class DappsView(BaseView):
         self.enter_url_editbox.send_keys(url)
         self.confirm()
         from views.web_views.base_web_view import BaseWebView
-        BaseWebView(self.driver).wait_for_d_aap_to_load()
+        BaseWebView.get_instance(self.driver).wait_for_d_aap_to_load()
         return self.get_base_web_view()
 
     def get_browser_entry(self, name):
@@ -0,0 +1,90 @@
+from functools import lru_cache
+
+from selenium.webdriver.remote.command import Command
+
+SWIPE_DURATION = 250
+LONG_PRESS_DURATION = 2000
+TAP_DURATION = 50
+# move to the release location after a long press, an instant jump is ignored by some drop targets
+RELEASE_MOVE_DURATION = 250
+
+
+def _move(x, y, duration=0):
+    return {'type': 'pointerMove', 'duration': int(duration), 'x': int(x), 'y': int(y), 'origin': 'viewport'}
+
+
+def _pause(duration):
+    return {'type': 'pause', 'duration': int(duration)}
+
+
+_pointer_down = {'type': 'pointerDown', 'button': 0}
+_pointer_up = {'type': 'pointerUp', 'button': 0}
+
+
+def _touch_sequence(*actions):
+    return {'actions': [{'type': 'pointer', 'id': 'finger', 'parameters': {'pointerType': 'touch'},
+                         'actions': list(actions)}]}
+
+
+@lru_cache(maxsize=1024)
+def compile_swipe(start_x, start_y, end_x, end_y, duration=SWIPE_DURATION):
+    return _touch_sequence(_move(start_x, start_y), _pointer_down, _move(end_x, end_y, duration), _pointer_up)
+
+
+@lru_cache(maxsize=1024)
+def compile_long_press(x, y, hold=LONG_PRESS_DURATION, release_x=None, release_y=None):
+    actions = [_move(x, y), _pointer_down, _pause(hold)]
+    if release_x is not None and release_y is not None:
+        actions.append(_move(release_x, release_y, RELEASE_MOVE_DURATION))
+    actions.append(_pointer_up)
+    return _touch_sequence(*actions)
+
+
+@lru_cache(maxsize=1024)
+def compile_tap(x, y):
+    return _touch_sequence(_move(x, y), _pointer_down, _pause(TAP_DURATION), _pointer_up)
+
+
+class Gestures(object):
+    """
+    Swipes, long presses and taps sent as one precompiled W3C actions request each.
+    Window size is requested once per session: sessions keep portrait orientation and the window is not resized
+    by the keyboard. Hold durations are pauses inside the action instead of client sleeps.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._window_size = None
+
+    @property
+    def window_size(self):
+        if self._window_size is None:
+            self._window_size = self.driver.get_window_size()
+        return self._window_size
+
+    def get_absolute_location(self, rel_x, rel_y):
+        size = self.window_size
+        return int(size['width'] * rel_x), int(size['height'] * rel_y)
+
+    def perform(self, payload):
+        # copy as `execute` adds session id to the params of the command
+        self.driver.execute(Command.W3C_ACTIONS, dict(payload))
+
+    def swipe(self, start_x, start_y, end_x, end_y, duration=SWIPE_DURATION):
+        self.perform(compile_swipe(int(start_x), int(start_y), int(end_x), int(end_y), duration))
+
+    def swipe_relative(self, rel_start_x, rel_start_y, rel_end_x, rel_end_y, duration=SWIPE_DURATION):
+        """Uses values relative to window width/height"""
+        self.swipe(*self.get_absolute_location(rel_start_x, rel_start_y),
+                   *self.get_absolute_location(rel_end_x, rel_end_y), duration=duration)
+
+    def vertical_swipe(self, rel_start_y, rel_end_y, x=500, duration=SWIPE_DURATION):
+        size = self.window_size
+        self.swipe(x, size['height'] * rel_start_y, x, size['height'] * rel_end_y, duration)
+
+    def long_press(self, x, y, hold=LONG_PRESS_DURATION, release_location=None):
+        release_x, release_y = release_location if release_location else (None, None)
+        self.perform(compile_long_press(int(x), int(y), hold, release_x, release_y))
+
+    def tap(self, x, y):
+        self.perform(compile_tap(int(x), int(y)))
@@ -6,7 +6,7 @@ from typing_extensions import Literal
 
 from tests import test_dapp_url
 from views.base_element import Button, Text, BaseElement, SilentButton, CheckBox, EditBox
-from views.base_view import BaseView, UnreadMessagesCountText
+from views.base_view import BaseView, LazyElement, UnreadMessagesCountText
 
 
 class ChatButton(Button):
@@ -15,7 +15,7 @@ class ChatButton(Button):
 
     def navigate(self):
         from views.chat_view import ChatView
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
 
 class ActivityTabButton(Button):
@@ -49,18 +49,18 @@ class ChatElement(SilentButton):
     def navigate(self):
         if self.community:
             from views.chat_view import CommunityView
-            return CommunityView(self.driver)
+            return CommunityView.get_instance(self.driver)
         else:
             from views.chat_view import ChatView
-            return ChatView(self.driver)
+            return ChatView.get_instance(self.driver)
 
     def click(self):
         if self.community:
             from views.chat_view import CommunityView
-            desired_element = CommunityView(self.driver).community_description_text
+            desired_element = CommunityView.get_instance(self.driver).community_description_text
         else:
             from views.chat_view import ChatView
-            desired_element = ChatView(self.driver).chat_message_input
+            desired_element = ChatView.get_instance(self.driver).chat_message_input
         self.click_until_presence_of_element(desired_element=desired_element)
 
         return self.navigate()
@@ -239,120 +239,109 @@ class ShareQRCodeInfoText(Text):
 
 
 class HomeView(BaseView):
-    def __init__(self, driver):
-        super().__init__(driver)
-
-        self.plus_button = Button(self.driver, accessibility_id="new-chat-button")
-        self.plus_community_button = Button(self.driver, accessibility_id="new-communities-button")
-        self.chat_name_text = Text(self.driver, accessibility_id="chat-name-text")
-        self.start_new_chat_button = ChatButton(self.driver, accessibility_id="start-1-1-chat-button")
-        self.new_group_chat_button = ChatButton(self.driver, accessibility_id="start-group-chat-button")
-        self.join_public_chat_button = ChatButton(self.driver, accessibility_id="join-public-chat-button")
-        self.universal_qr_scanner_button = Button(self.driver, accessibility_id="universal-qr-scanner")
-        self.invite_friends_button = Button(self.driver, accessibility_id="invite-friends-button")
-        self.stop_status_service_button = Button(self.driver, accessibility_id="STOP")
-        self.my_profile_on_start_new_chat_button = Button(self.driver,
-                                                          xpath="//*[@content-desc='current-account-photo']")
-        self.communities_button = ChatButton(self.driver, accessibility_id="create-community")
-        self.create_closed_community_button = ChatButton(self.driver, accessibility_id="create-closed-community")
-        self.create_open_community_button = ChatButton(self.driver, accessibility_id="create-open-community")
-        self.create_token_gated_community_button = ChatButton(self.driver,
-                                                              accessibility_id="create-token-gated-community")
-        self.ens_banner_close_button = Button(self.driver, accessibility_id=":ens-banner-close-button")
-        self.user_name_text = Text(
-            self.driver, xpath="//*[@text='User found']/following-sibling::*/android.widget.TextView[1]")
-
-        # Notification centre
-        self.notifications_button = Button(self.driver, accessibility_id="notifications-button")
-        self.notifications_unread_badge = BaseElement(self.driver, accessibility_id="activity-center-unread-count")
-        self.open_activity_center_button = Button(self.driver, accessibility_id="open-activity-center-button")
-        self.close_activity_centre = Button(self.driver, accessibility_id="close-activity-center")
-
-        self.notifications_select_button = Button(self.driver, translation_id="select")
-        self.notifications_reject_and_delete_button = Button(self.driver, accessibility_id="reject-and-delete"
-                                                                                           "-activity-center")
-        self.notifications_accept_and_add_button = Button(self.driver,
-                                                          accessibility_id="accept-and-add-activity-center")
-        self.notifications_select_all = Button(self.driver, xpath="(//android.widget.CheckBox["
-                                                                  "@content-desc='checkbox-off'])[1]")
-
-        # Tabs and elements on messages home view
-        self.recent_tab = Button(self.driver, accessibility_id="tab-recent")
-        self.groups_tab = Button(self.driver, accessibility_id="tab-groups")
-        self.contacts_tab = Button(self.driver, accessibility_id="tab-contacts")
-        self.contact_new_badge = Button(self.driver, accessibility_id="notification-dot")
-        self.pending_contact_request_button = Button(self.driver,
-                                                     accessibility_id="open-activity-center-contact-requests")
-        self.pending_contact_request_text = Text(
-            self.driver,
-            xpath='//*[@content-desc="pending-contact-requests-count"]/android.widget.TextView')
-
-        # Tabs and elements on community home view
-        self.pending_communities_tab = Button(self.driver, accessibility_id="pending-tab")
-        self.joined_communities_tab = Button(self.driver, accessibility_id="joined-tab")
-        self.opened_communities_tab = Button(self.driver, accessibility_id="opened-tab")
-
-        # Options on long tap
-        self.chats_menu_invite_friends_button = Button(self.driver, accessibility_id="chats-menu-invite-friends-button")
-        self.close_chat_button = Button(self.driver, accessibility_id="close-chat")
-        self.confirm_closing_chat_button = Button(self.driver, accessibility_id="Confirm")
-        self.clear_history_button = Button(self.driver, accessibility_id="clear-history")
-        self.mute_chat_button = MuteButton(self.driver, accessibility_id="mute-chat")
-        self.mute_community_button = MuteButton(self.driver, accessibility_id="mute-community")
-        self.unmute_community_button = MuteButton(self.driver, accessibility_id="unmute-community")
-        self.mute_channel_button = MuteButton(self.driver, accessibility_id="chat-toggle-muted")
-        self.mark_all_messages_as_read_button = Button(self.driver, accessibility_id="mark-as-read")
-
-        # Connection icons
-        self.mobile_connection_off_icon = Button(self.driver, accessibility_id="conn-button-mobile-sync-off")
-        self.mobile_connection_on_icon = Button(self.driver, accessibility_id="conn-button-mobile-sync")
-        self.connection_offline_icon = Button(self.driver, accessibility_id="conn-button-offline")
-
-        # Sync using mobile data bottom sheet
-        self.continue_syncing_button = Button(self.driver, accessibility_id="mobile-network-continue-syncing")
-        self.stop_syncing_button = Button(self.driver, accessibility_id="mobile-network-stop-syncing")
-        self.remember_my_choice_checkbox = CheckBox(self.driver, accessibility_id=":checkbox-on")
-
-        # Connection status bottom sheet
-        self.connected_to_n_peers_text = Text(self.driver, accessibility_id="connected-to-n-peers")
-        self.connected_to_node_text = Text(self.driver, accessibility_id="connected-to-mailserver")
-        self.waiting_for_wi_fi = Text(self.driver, accessibility_id="waiting-wi-fi")
-        self.use_mobile_data_switch = Button(self.driver, accessibility_id="mobile-network-use-mobile")
-        self.connection_settings_button = Button(self.driver, accessibility_id="settings")
-        self.not_connected_to_node_text = Text(self.driver, accessibility_id="not-connected-nodes")
-        self.not_connected_to_peers_text = Text(self.driver, accessibility_id="not-connected-to-peers")
-
-        # New UI
-        self.new_chat_button = Button(self.driver, accessibility_id="new-chat-button")
-        self.discover_communities_button = Button(self.driver, accessibility_id="communities-home-discover-card")
-
-        # New UI bottom sheet
-        self.start_a_new_chat_bottom_sheet_button = Button(self.driver, accessibility_id="start-a-new-chat")
-        self.add_a_contact_chat_bottom_sheet_button = Button(self.driver, accessibility_id="add-a-contact")
-
-        # Activity centre
-        self.all_activity_tab_button = ActivityTabButton(self.driver, translation_id="all")
-        self.mention_activity_tab_button = ActivityTabButton(self.driver, accessibility_id="tab-mention")
-        self.reply_activity_tab_button = ActivityTabButton(self.driver, accessibility_id="tab-reply")
-        self.activity_notification_swipe_button = Button(self.driver, accessibility_id="notification-swipe")
-        self.activity_unread_filter_button = Button(self.driver, accessibility_id="selector-filter")
-        self.more_options_activity_button = Button(self.driver, accessibility_id="activity-center-open-more")
-        self.mark_all_read_activity_button = Button(self.driver, translation_id="mark-all-notifications-as-read")
-
-        # Share tab
-        self.share_qr_code_info_text = ShareQRCodeInfoText(self.driver)
-        self.link_to_profile_button = Button(self.driver, accessibility_id="link-to-profile")
-        self.link_to_profile_text = Text(self.driver, accessibility_id="share-qr-code-info-text")
-        self.close_share_tab_button = Button(self.driver, accessibility_id="close-shell-share-tab")
-        self.qr_code_image_element = BaseElement(self.driver, accessibility_id='share-qr-code')
-        self.share_profile_tab_button = Button(self.driver, accessibility_id="Profile")
-        self.share_wallet_tab_button = Button(self.driver, accessibility_id="Wallet")
-        self.account_avatar = BaseElement(self.driver, accessibility_id="account-avatar")
-        self.account_name_text = Text(
-            self.driver, xpath="//*[@content-desc='link-to-profile']/preceding-sibling::android.widget.TextView")
-        self.share_link_to_profile_button = Button(self.driver, accessibility_id='link-to-profile')
-        # Discover communities
-        self.community_card_item = BaseElement(self.driver, accessibility_id="community-card-item")
+    plus_button = LazyElement(Button, accessibility_id="new-chat-button")
+    plus_community_button = LazyElement(Button, accessibility_id="new-communities-button")
+    chat_name_text = LazyElement(Text, accessibility_id="chat-name-text")
+    start_new_chat_button = LazyElement(ChatButton, accessibility_id="start-1-1-chat-button")
+    new_group_chat_button = LazyElement(ChatButton, accessibility_id="start-group-chat-button")
+    join_public_chat_button = LazyElement(ChatButton, accessibility_id="join-public-chat-button")
+    universal_qr_scanner_button = LazyElement(Button, accessibility_id="universal-qr-scanner")
+    invite_friends_button = LazyElement(Button, accessibility_id="invite-friends-button")
+    stop_status_service_button = LazyElement(Button, accessibility_id="STOP")
+    my_profile_on_start_new_chat_button = LazyElement(Button, xpath="//*[@content-desc='current-account-photo']")
+    communities_button = LazyElement(ChatButton, accessibility_id="create-community")
+    create_closed_community_button = LazyElement(ChatButton, accessibility_id="create-closed-community")
+    create_open_community_button = LazyElement(ChatButton, accessibility_id="create-open-community")
+    create_token_gated_community_button = LazyElement(ChatButton, accessibility_id="create-token-gated-community")
+    ens_banner_close_button = LazyElement(Button, accessibility_id=":ens-banner-close-button")
+    user_name_text = LazyElement(Text, xpath="//*[@text='User found']/following-sibling::*/android.widget.TextView[1]")
+
+    # Notification centre
+    notifications_button = LazyElement(Button, accessibility_id="notifications-button")
+    notifications_unread_badge = LazyElement(BaseElement, accessibility_id="activity-center-unread-count")
+    open_activity_center_button = LazyElement(Button, accessibility_id="open-activity-center-button")
+    close_activity_centre = LazyElement(Button, accessibility_id="close-activity-center")
+
+    notifications_select_button = LazyElement(Button, translation_id="select")
+    notifications_reject_and_delete_button = LazyElement(Button, accessibility_id="reject-and-delete-activity-center")
+    notifications_accept_and_add_button = LazyElement(Button, accessibility_id="accept-and-add-activity-center")
+    notifications_select_all = LazyElement(Button, xpath="(//android.widget.CheckBox[@content-desc='checkbox-off'])[1]")
+
+    # Tabs and elements on messages home view
+    recent_tab = LazyElement(Button, accessibility_id="tab-recent")
+    groups_tab = LazyElement(Button, accessibility_id="tab-groups")
+    contacts_tab = LazyElement(Button, accessibility_id="tab-contacts")
+    contact_new_badge = LazyElement(Button, accessibility_id="notification-dot")
+    pending_contact_request_button = LazyElement(Button, accessibility_id="open-activity-center-contact-requests")
+    pending_contact_request_text = LazyElement(Text,
+                                               xpath='//*[@content-desc="pending-contact-requests-count"]/android.widget.TextView')
+
+    # Tabs and elements on community home view
+    pending_communities_tab = LazyElement(Button, accessibility_id="pending-tab")
+    joined_communities_tab = LazyElement(Button, accessibility_id="joined-tab")
+    opened_communities_tab = LazyElement(Button, accessibility_id="opened-tab")
+
+    # Options on long tap
+    chats_menu_invite_friends_button = LazyElement(Button, accessibility_id="chats-menu-invite-friends-button")
+    close_chat_button = LazyElement(Button, accessibility_id="close-chat")
+    confirm_closing_chat_button = LazyElement(Button, accessibility_id="Confirm")
+    clear_history_button = LazyElement(Button, accessibility_id="clear-history")
+    mute_chat_button = LazyElement(MuteButton, accessibility_id="mute-chat")
+    mute_community_button = LazyElement(MuteButton, accessibility_id="mute-community")
+    unmute_community_button = LazyElement(MuteButton, accessibility_id="unmute-community")
+    mute_channel_button = LazyElement(MuteButton, accessibility_id="chat-toggle-muted")
+    mark_all_messages_as_read_button = LazyElement(Button, accessibility_id="mark-as-read")
+
+    # Connection icons
+    mobile_connection_off_icon = LazyElement(Button, accessibility_id="conn-button-mobile-sync-off")
+    mobile_connection_on_icon = LazyElement(Button, accessibility_id="conn-button-mobile-sync")
+    connection_offline_icon = LazyElement(Button, accessibility_id="conn-button-offline")
+
+    # Sync using mobile data bottom sheet
+    continue_syncing_button = LazyElement(Button, accessibility_id="mobile-network-continue-syncing")
+    stop_syncing_button = LazyElement(Button, accessibility_id="mobile-network-stop-syncing")
+    remember_my_choice_checkbox = LazyElement(CheckBox, accessibility_id=":checkbox-on")
+
+    # Connection status bottom sheet
+    connected_to_n_peers_text = LazyElement(Text, accessibility_id="connected-to-n-peers")
+    connected_to_node_text = LazyElement(Text, accessibility_id="connected-to-mailserver")
+    waiting_for_wi_fi = LazyElement(Text, accessibility_id="waiting-wi-fi")
+    use_mobile_data_switch = LazyElement(Button, accessibility_id="mobile-network-use-mobile")
+    connection_settings_button = LazyElement(Button, accessibility_id="settings")
+    not_connected_to_node_text = LazyElement(Text, accessibility_id="not-connected-nodes")
+    not_connected_to_peers_text = LazyElement(Text, accessibility_id="not-connected-to-peers")
+
+    # New UI
+    new_chat_button = LazyElement(Button, accessibility_id="new-chat-button")
+    discover_communities_button = LazyElement(Button, accessibility_id="communities-home-discover-card")
+
+    # New UI bottom sheet
+    start_a_new_chat_bottom_sheet_button = LazyElement(Button, accessibility_id="start-a-new-chat")
+    add_a_contact_chat_bottom_sheet_button = LazyElement(Button, accessibility_id="add-a-contact")
+
+    # Activity centre
+    all_activity_tab_button = LazyElement(ActivityTabButton, translation_id="all")
+    mention_activity_tab_button = LazyElement(ActivityTabButton, accessibility_id="tab-mention")
+    reply_activity_tab_button = LazyElement(ActivityTabButton, accessibility_id="tab-reply")
+    activity_notification_swipe_button = LazyElement(Button, accessibility_id="notification-swipe")
+    activity_unread_filter_button = LazyElement(Button, accessibility_id="selector-filter")
+    more_options_activity_button = LazyElement(Button, accessibility_id="activity-center-open-more")
+    mark_all_read_activity_button = LazyElement(Button, translation_id="mark-all-notifications-as-read")
+
+    # Share tab
+    share_qr_code_info_text = LazyElement(ShareQRCodeInfoText)
+    link_to_profile_button = LazyElement(Button, accessibility_id="link-to-profile")
+    link_to_profile_text = LazyElement(Text, accessibility_id="share-qr-code-info-text")
+    close_share_tab_button = LazyElement(Button, accessibility_id="close-shell-share-tab")
+    qr_code_image_element = LazyElement(BaseElement, accessibility_id='share-qr-code')
+    share_profile_tab_button = LazyElement(Button, accessibility_id="Profile")
+    share_wallet_tab_button = LazyElement(Button, accessibility_id="Wallet")
+    account_avatar = LazyElement(BaseElement, accessibility_id="account-avatar")
+    account_name_text = LazyElement(Text,
+                                    xpath="//*[@content-desc='link-to-profile']/preceding-sibling::android.widget.TextView")
+    share_link_to_profile_button = LazyElement(Button, accessibility_id='link-to-profile')
+    # Discover communities
+    community_card_item = LazyElement(BaseElement, accessibility_id="community-card-item")
 
     def wait_for_syncing_complete(self):
         self.driver.info('Waiting for syncing to complete')
@@ -474,7 +463,7 @@ class HomeView(BaseView):
         chat_view.community_description_edit_box.send_keys(description)
         if set_image:
             from views.profile_view import ProfileView
-            set_picture_view = ProfileView(self.driver)
+            set_picture_view = ProfileView.get_instance(self.driver)
             set_picture_view.element_by_translation_id("community-thumbnail-upload").scroll_and_click()
             set_picture_view.element_by_translation_id("community-image-pick").scroll_and_click()
             set_picture_view.select_photo_from_gallery(file_name)
@@ -545,15 +534,15 @@ class HomeView(BaseView):
         self.driver.info("Leaving chat '%s' by long press" % username)
         self.get_chat(username).long_press_element()
         from views.chat_view import ChatView
-        ChatView(self.driver).leave_chat_button.click()
-        ChatView(self.driver).leave_button.click()
+        ChatView.get_instance(self.driver).leave_chat_button.click()
+        ChatView.get_instance(self.driver).leave_button.click()
 
     def clear_chat_long_press(self, username):
         self.driver.info("Clearing history in chat '%s' by long press" % username)
         self.get_chat(username).long_press_element()
         self.clear_history_button.click()
         from views.chat_view import ChatView
-        ChatView(self.driver).clear_button.click()
+        ChatView.get_instance(self.driver).clear_button.click()
 
     def mute_chat_long_press(self, chat_name, mute_period="mute-till-unmute", community=False, community_channel=False):
         self.driver.info("Muting chat with %s" % chat_name)
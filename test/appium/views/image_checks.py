@@ -0,0 +1,86 @@
+import base64
+import os
+from io import BytesIO
+
+import imagehash
+import numpy
+from PIL import Image
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'elements_templates')
+
+
+class ElementTemplate(object):
+    def __init__(self, path):
+        self.image = Image.open(path)
+        self.image.load()
+        self.pixels = numpy.asarray(self.image, dtype=numpy.int16)
+        self.hash = imagehash.average_hash(self.image)
+
+
+class TemplateIndex(object):
+    """Element templates with pixel arrays and perceptual hashes, loaded once per process"""
+
+    def __init__(self, templates_dir=TEMPLATES_DIR):
+        self.templates_dir = templates_dir
+        self.templates = dict()
+
+    def get(self, name):
+        try:
+            return self.templates[name]
+        except KeyError:
+            path = os.path.join(self.templates_dir, name)
+            if not os.path.isfile(path):
+                raise FileNotFoundError('Please add %s image as template' % name) from None
+            template = self.templates[name] = ElementTemplate(path)
+            return template
+
+    def preload(self):
+        for name in os.listdir(self.templates_dir):
+            if name.endswith('.png'):
+                self.get(name)
+        return self
+
+    def invalidate(self, name):
+        self.templates.pop(name, None)
+
+
+template_index = TemplateIndex()
+
+
+class ScreenCapture(object):
+    """One full-screen screenshot to crop images of any number of elements from"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.driver.info("Take screenshot for image checks")
+        self.screenshot = Image.open(BytesIO(base64.b64decode(self.driver.get_screenshot_as_base64())))
+        self.screenshot.load()
+
+    def get_element_image(self, element):
+        rect = element.with_web_element(lambda web_element: web_element.rect)
+        x, y = int(rect['x']), int(rect['y'])
+        return self.screenshot.crop((x, y, x + int(rect['width']), y + int(rect['height'])))
+
+
+def _get_overlapping_pixels(image, template: ElementTemplate):
+    # same area as ImageChops.difference compares for images of different size
+    pixels = numpy.asarray(image.convert(template.image.mode), dtype=numpy.int16)
+    height = min(pixels.shape[0], template.pixels.shape[0])
+    width = min(pixels.shape[1], template.pixels.shape[1])
+    return pixels[:height, :width], template.pixels[:height, :width]
+
+
+def is_image_equal_to_template(image, template: ElementTemplate):
+    pixels, template_pixels = _get_overlapping_pixels(image, template)
+    return numpy.array_equal(pixels, template_pixels)
+
+
+def get_diff_ratio(image, template: ElementTemplate):
+    pixels, template_pixels = _get_overlapping_pixels(image, template)
+    if not pixels.size:
+        return 0
+    return float(numpy.abs(pixels - template_pixels).mean()) / 255
+
+
+def is_image_similar_to_template(image, template: ElementTemplate):
+    return not bool(template.hash - imagehash.average_hash(image))
@@ -0,0 +1,81 @@
+import re
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import ActionChains, Keys
+from selenium.webdriver.common.actions import interaction
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.pointer_input import PointerInput
+
+from views.gestures import TAP_DURATION
+
+KEYCODE_ENTER = 66
+KEYCODE_DEL = 67
+# W3C keys which UiAutomator2 sends as these Android keycodes
+_w3c_keys = {KEYCODE_ENTER: Keys.ENTER, KEYCODE_DEL: Keys.BACKSPACE}
+
+# printable ASCII which `input text` can type; `%s` is how it encodes a space, so it can't be typed literally
+_shell_text = re.compile(r'^[\x20-\x7e]+$')
+_shell_special_chars = re.compile(r'''([\\'"`()<>|;&*~$#!?\[\]{}])''')
+
+
+def escape_shell_text(text: str):
+    return _shell_special_chars.sub(r'\\\1', text).replace(' ', '%s')
+
+
+class Keyboard(object):
+    """
+    Sends whole strings and key sequences to the device in one command instead of one request per character:
+    `input text`/`input keyevent` via `mobile: shell` when the server allows it, otherwise one W3C actions sequence.
+    Use `EditBox.send_keys` for semantic typing into an element, and this for fast injection into the focused field.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.shell_available = True
+
+    def shell_input(self, *args):
+        if not self.shell_available:
+            return False
+        try:
+            self.driver.execute_script('mobile: shell', {'command': 'input', 'args': list(args)})
+            return True
+        except WebDriverException:
+            # Appium server is started without `--relaxed-security` (e.g. on SauceLabs), no reason to try again
+            self.shell_available = False
+            return False
+
+    def type_text(self, text: str):
+        if _shell_text.match(text) and '%s' not in text and self.shell_input('text', escape_shell_text(text)):
+            return
+        ActionChains(self.driver).send_keys(text).perform()
+
+    def press_keycodes(self, keycodes):
+        keycodes = [int(keycode) for keycode in keycodes]
+        if not keycodes or self.shell_input('keyevent', *[str(keycode) for keycode in keycodes]):
+            return
+        if all(keycode in _w3c_keys for keycode in keycodes):
+            ActionChains(self.driver).send_keys(''.join(_w3c_keys[keycode] for keycode in keycodes)).perform()
+            return
+        for keycode in keycodes:
+            self.driver.press_keycode(keycode)
+
+    def tap_locations(self, locations, pause=0):
+        """Taps locations in one actions request, `pause` is seconds between taps"""
+        actions = ActionBuilder(self.driver, mouse=PointerInput(interaction.POINTER_TOUCH, 'touch'))
+        for x, y in locations:
+            actions.pointer_action.move_to_location(x, y).pointer_down().pause(TAP_DURATION / 1000).pointer_up()
+            if pause:
+                actions.pointer_action.pause(pause)
+        actions.perform()
+
+    def tap_elements(self, elements, pause=0):
+        """Taps elements in the given order with one actions request, each distinct element is located once"""
+        centers = dict()
+        locations = list()
+        for element in elements:
+            key = (element.by, element.locator)
+            if key not in centers:
+                rect = element.with_web_element(lambda web_element: web_element.rect)
+                centers[key] = (int(rect['x'] + rect['width'] / 2), int(rect['y'] + rect['height'] / 2))
+            locations.append(centers[key])
+        self.tap_locations(locations, pause)
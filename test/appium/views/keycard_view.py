@@ -26,16 +26,15 @@ class KeycardView(BaseView):
 
     def enter_default_pin(self):
         self.driver.info("Enter default pin 111111")
-        [self.one_button.click() for _ in range(6)]
+        self.driver.keyboard.tap_elements([self.one_button] * 6)
 
     def enter_default_puk(self):
         self.driver.info("Enter default pin 1111 1111 1111")
-        [self.one_button.click() for _ in range(12)]
+        self.driver.keyboard.tap_elements([self.one_button] * 12)
 
     def enter_another_pin(self):
         self.driver.info("Enter not-default pin 222222")
-        for _ in range(6):
-            self.two_button.click()
+        self.driver.keyboard.tap_elements([self.two_button] * 6)
 
     def get_recovery_word(self, word_id):
         word_element = SilentButton(self.driver, accessibility_id="word%s" % word_id)
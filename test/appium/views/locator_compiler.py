@@ -0,0 +1,146 @@
+import ast
+import glob
+import os
+import re
+from functools import lru_cache
+
+from appium.webdriver.common.mobileby import MobileBy
+
+# unique locators seen by compile_locator during the session
+compilation_stats = {'compiled': 0, 'xpath': 0}
+
+_literal = r'''(?:"[^"]*"|'[^']*')'''
+_attribute = r'@(?:text|content-desc|resource-id)'
+_condition = re.compile(r'''\s*(?:(?P<attr>%s)\s*=\s*(?P<eq>%s)|(?P<func>contains|starts-with)\(\s*(?P<func_attr>%s)\s*,\s*(?P<arg>%s)\s*\))\s*''' % (
+    _attribute, _literal, _attribute, _literal))
+_path = re.compile(r'^(?P<open>\()?//(?P<tag>\*|[\w.$]+)\[(?P<predicate>.+)\](?(open)\)\[(?P<index>[1-9]\d*)\])$')
+
+_selector_methods = {
+    ('@text', 'eq'): 'text',
+    ('@text', 'contains'): 'textContains',
+    ('@text', 'starts-with'): 'textStartsWith',
+    ('@content-desc', 'eq'): 'description',
+    ('@content-desc', 'contains'): 'descriptionContains',
+    ('@content-desc', 'starts-with'): 'descriptionStartsWith',
+    ('@resource-id', 'eq'): 'resourceId',
+}
+
+
+def _java_string(literal):
+    value = literal[1:-1]
+    return '"%s"' % value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _parse_conditions(predicate):
+    conditions = list()
+    position = 0
+    while True:
+        match = _condition.match(predicate, position)
+        if not match:
+            return None
+        if match.group('attr'):
+            conditions.append((match.group('attr'), 'eq', match.group('eq')))
+        else:
+            conditions.append((match.group('func_attr'), match.group('func'), match.group('arg')))
+        position = match.end()
+        if position == len(predicate):
+            return conditions
+        separator = re.compile(r'and\s+').match(predicate, position)
+        if not separator:
+            return None
+        position = separator.end()
+
+
+def compile_xpath(xpath: str):
+    """
+    Translates simple XPath shapes into equivalent faster strategies:
+    `//*[@content-desc="x"]` into accessibility id, attribute checks on text/content-desc/resource-id
+    (with optional class name and `(...)[n]` index) into a UiSelector. Returns None if there is no equivalent.
+    """
+    match = _path.match(xpath.strip())
+    if not match:
+        return None
+    conditions = _parse_conditions(match.group('predicate'))
+    if not conditions:
+        return None
+    tag, index = match.group('tag'), match.group('index')
+    if tag == '*' and not index and len(conditions) == 1 and conditions[0][:2] == ('@content-desc', 'eq'):
+        return MobileBy.ACCESSIBILITY_ID, conditions[0][2][1:-1]
+    selector = 'new UiSelector()'
+    if tag != '*':
+        selector += '.className("%s")' % tag
+    for attribute, function, literal in conditions:
+        method = _selector_methods.get((attribute, function))
+        if not method:
+            return None
+        selector += '.%s(%s)' % (method, _java_string(literal))
+    if index:
+        selector += '.instance(%s)' % (int(index) - 1)
+    return MobileBy.ANDROID_UIAUTOMATOR, selector
+
+
+@lru_cache(maxsize=None)
+def compile_locator(by: str, locator: str):
+    if by != MobileBy.XPATH:
+        return by, locator
+    compiled = compile_xpath(locator)
+    if compiled:
+        compilation_stats['compiled'] += 1
+        return compiled
+    compilation_stats['xpath'] += 1
+    return by, locator
+
+
+def _get_static_locator(call: ast.Call, translations: dict):
+    kwargs = {keyword.arg: keyword.value for keyword in call.keywords if keyword.arg}
+    values = dict()
+    for key in ('xpath', 'translation_id', 'prefix', 'suffix', 'uppercase'):
+        if key in kwargs:
+            if not isinstance(kwargs[key], ast.Constant):
+                return None
+            values[key] = kwargs[key].value
+    if 'xpath' in values:
+        locator = values['xpath']
+    elif 'translation_id' in values:
+        text = translations.get(values['translation_id'], '')
+        locator = '//*[@text="%s"]' % text
+        if values.get('uppercase'):
+            locator = '//*[@text="%s" or @text="%s"]' % (text, text.upper())
+        if values.get('suffix'):
+            locator += values['suffix']
+    else:
+        return None
+    return values.get('prefix', '') + locator
+
+
+def get_project_report(views_path=os.path.dirname(os.path.abspath(__file__))):
+    """Counts statically defined XPath locators in views which are compiled to other strategies or left as XPath"""
+    from tests import transl
+    report = {'accessibility_id': list(), 'uiautomator': list(), 'xpath': list(), 'dynamic': 0}
+    for path in sorted(glob.glob(os.path.join(views_path, '**', '*.py'), recursive=True)):
+        with open(path) as source:
+            tree = ast.parse(source.read())
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or \
+                    not {'xpath', 'translation_id'} & {keyword.arg for keyword in node.keywords}:
+                continue
+            locator = _get_static_locator(node, transl)
+            if locator is None:
+                report['dynamic'] += 1
+                continue
+            compiled = compile_xpath(locator)
+            if not compiled:
+                report['xpath'].append(locator)
+            elif compiled[0] == MobileBy.ACCESSIBILITY_ID:
+                report['accessibility_id'].append(locator)
+            else:
+                report['uiautomator'].append(locator)
+    return report
+
+
+if __name__ == '__main__':
+    project_report = get_project_report()
+    print("Compiled to accessibility id: %s" % len(project_report['accessibility_id']))
+    print("Compiled to UiSelector: %s" % len(project_report['uiautomator']))
+    print("Left as XPath: %s" % len(project_report['xpath']))
+    print("Built at runtime (not analysed): %s" % project_report['dynamic'])
@@ -0,0 +1,97 @@
+from appium.webdriver.common.mobileby import MobileBy
+from lxml import etree
+from selenium.common.exceptions import NoSuchElementException
+
+
+def xpath_literal(value: str):
+    if '"' not in value:
+        return '"%s"' % value
+    if "'" not in value:
+        return "'%s'" % value
+    return "concat(%s)" % ", '\"', ".join('"%s"' % part for part in value.split('"'))
+
+
+class PageSnapshot(object):
+    """
+    One `driver.page_source` fetch evaluated locally for any number of elements.
+    Snapshot is fetched lazily on first lookup and again after `invalidate()`, e.g. when an element was clicked.
+    Locators that can't be evaluated on the page source (UiAutomator selectors, invalid XPath 1.0)
+    fall back to the regular Appium lookup.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._tree = None
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            self.driver.info("Get page source snapshot")
+            self._tree = etree.fromstring(self.driver.page_source.encode('utf-8'))
+        return self._tree
+
+    def invalidate(self):
+        self._tree = None
+        return self
+
+    def refresh(self):
+        return self.invalidate().tree
+
+    @staticmethod
+    def get_xpath(element):
+        if element.by == MobileBy.XPATH:
+            return element.locator
+        elif element.by == MobileBy.ACCESSIBILITY_ID:
+            return '//*[@content-desc=%s]' % xpath_literal(element.locator)
+        elif element.by == MobileBy.ID:
+            if ':id/' in element.locator:
+                return '//*[@resource-id=%s]' % xpath_literal(element.locator)
+            suffix = xpath_literal(':id/%s' % element.locator)
+            return '//*[@resource-id=%s or substring(@resource-id, string-length(@resource-id) - ' \
+                   'string-length(%s) + 1) = %s]' % (xpath_literal(element.locator), suffix, suffix)
+        elif element.by == MobileBy.CLASS_NAME:
+            return '//%s' % element.locator
+        return None
+
+    def find_nodes(self, element):
+        xpath = self.get_xpath(element)
+        if xpath is None:
+            return None
+        try:
+            nodes = self.tree.xpath(xpath)
+        except (etree.XPathEvalError, etree.XPathSyntaxError):
+            return None
+        return [node for node in nodes if isinstance(node, etree._Element)]
+
+    def is_element_present(self, element):
+        nodes = self.find_nodes(element)
+        if nodes is None:
+            with self.driver.implicit_wait_scope(0):
+                return bool(element.find_elements())
+        return bool(nodes)
+
+    def is_element_displayed(self, element):
+        nodes = self.find_nodes(element)
+        if nodes is None:
+            with self.driver.implicit_wait_scope(0):
+                return any(web_element.is_displayed() for web_element in element.find_elements())
+        return any(node.get('displayed', 'true') == 'true' for node in nodes)
+
+    def get_element_text(self, element):
+        nodes = self.find_nodes(element)
+        if nodes is None:
+            return None
+        if not nodes:
+            raise NoSuchElementException("Device %s: %s by %s: `%s` is not found in page source" % (
+                self.driver.number, element.name, element.by, element.locator))
+        return nodes[0].get('text', '')
+
+    def get_displayed_elements(self, *elements):
+        return [element for element in elements if self.is_element_displayed(element)]
+
+    def wait_for_any_element(self, elements, seconds=10):
+        from views.base_element import AdaptiveWait
+        return AdaptiveWait(self.driver, seconds).until(
+            lambda: self.invalidate().get_displayed_elements(*elements),
+            "Device %s: none of %s is shown on the screen after %s seconds" % (
+                self.driver.number, ', '.join(element.name for element in elements), seconds))
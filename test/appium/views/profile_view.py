@@ -5,7 +5,7 @@ from selenium.common import NoSuchElementException
 from tests import common_password
 from tests.base_test_case import AbstractTestCase
 from views.base_element import Text, Button, EditBox, SilentButton
-from views.base_view import BaseView
+from views.base_view import BaseView, LazyElement
 
 
 class OptionsButton(Button):
@@ -19,7 +19,7 @@ class AddNewContactButton(Button):
 
     def navigate(self):
         from views.chat_view import ChatView
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
 
 class LogoutButton(SilentButton):
@@ -43,7 +43,7 @@ class LogoutDialog(BaseView):
 
         def navigate(self):
             from views.sign_in_view import SignInView
-            return SignInView(self.driver)
+            return SignInView.get_instance(self.driver)
 
 
 class ENSusernames(Button):
@@ -52,7 +52,7 @@ class ENSusernames(Button):
 
     def navigate(self):
         from views.dapps_view import DappsView
-        return DappsView(self.driver)
+        return DappsView.get_instance(self.driver)
 
     def click(self):
         self.scroll_to_element().click()
@@ -112,7 +112,7 @@ class FaqButton(Button):
 
     def navigate(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
 
 class MailServerElement(Button):
@@ -121,8 +121,7 @@ class MailServerElement(Button):
         self.server_name = server_name
 
     def click(self):
-        size = self.driver.get_window_size()
-        self.driver.swipe(500, size["height"] * 0.8, 500, size["height"] * 0.05)
+        self.driver.gestures.vertical_swipe(0.8, 0.05)
         self.find_element().click()
 
 
@@ -157,7 +156,7 @@ class PrivacyPolicyButton(Button):
 
     def navigate(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
 
 class TermsOfUseButton(Button):
@@ -166,7 +165,7 @@ class TermsOfUseButton(Button):
 
     def navigate(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
 
 class ProfilePictureElement(Button):
@@ -178,7 +177,7 @@ class KeycardButton(Button):
 
     def navigate(self):
         from views.keycard_view import KeycardView
-        return KeycardView(self.driver)
+        return KeycardView.get_instance(self.driver)
 
     def click(self):
         self.scroll_to_element().click()
@@ -187,188 +186,182 @@ class KeycardButton(Button):
 
 class ProfileView(BaseView):
 
+    options_button = LazyElement(OptionsButton)
+
+    # Header
+    public_key_text = LazyElement(Text, accessibility_id="chat-key")
+    default_username_text = LazyElement(Text, accessibility_id="default-username")
+    contact_name_text = LazyElement(Text, accessibility_id="contact-name")
+    share_my_profile_button = LazyElement(Button, accessibility_id="share-header-button")
+    profile_picture = LazyElement(ProfilePictureElement)
+    online_indicator = LazyElement(Button, accessibility_id="online-profile-photo-dot")
+    edit_picture_button = LazyElement(Button, accessibility_id="edit-profile-photo-button")
+    confirm_edit_button = LazyElement(Button, accessibility_id="done-button")
+    select_from_gallery_button_old = LazyElement(Button, translation_id="profile-pic-pick")
+    capture_button = LazyElement(Button, translation_id="image-source-make-photo")
+    take_photo_button_old = LazyElement(Button, accessibility_id="take-photo")
+    crop_photo_button = LazyElement(Button, accessibility_id="Crop")
+    decline_photo_crop = LazyElement(Button, accessibility_id="Navigate up")
+    shutter_button = LazyElement(Button, accessibility_id="Shutter")
+    accept_photo_button = LazyElement(Button, accessibility_id="Done")
+
+    # ENS
+    username_in_ens_chat_settings_text = LazyElement(EditBox,
+                                                     xpath="//*[@content-desc='chat-icon']/../../android.widget.TextView[2]")
+    ens_usernames_button = LazyElement(ENSusernames)
+    ens_name_in_share_chat_key_text = LazyElement(Text, accessibility_id="ens-username")
+
+    # Contacts
+    contacts_button = LazyElement(Button, accessibility_id="contacts-button")
+    blocked_users_button = LazyElement(Button, accessibility_id="blocked-users-list-button")
+    add_new_contact_button = LazyElement(AddNewContactButton)
+    invite_friends_in_contact_button = LazyElement(Button, accessibility_id="invite-friends-button")
+
+    # Privacy and security
+    privacy_and_security_button = LazyElement(Button, accessibility_id="privacy-and-security-settings-button")
+    accept_new_chats_from = LazyElement(Button, accessibility_id="accept-new-chats-from")
+    accept_new_chats_from_contacts_only = LazyElement(Button, translation_id="contacts")
+    reset_password_button = LazyElement(Button, accessibility_id="reset-password")
+    current_password_edit_box = LazyElement(EditBox, accessibility_id="current-password")
+    new_password_edit_box = LazyElement(EditBox, accessibility_id="new-password")
+    confirm_new_password_edit_box = LazyElement(EditBox, accessibility_id="confirm-new-password")
+    current_password_wrong_text = LazyElement(Text, accessibility_id="current-password-error")
+
+    # Appearance
+    appearance_button = LazyElement(Button, accessibility_id="appearance-settings-button")
+    show_profile_pictures_of = LazyElement(Button, accessibility_id="show-profile-pictures")
+    show_profile_pictures_to = LazyElement(Button, accessibility_id="show-profile-pictures-to")
+    ## Backup recovery phrase
+    backup_recovery_phrase_button = LazyElement(BackupRecoveryPhraseButton)
+    recovery_phrase_table = LazyElement(RecoveryPhraseTable)
+    recovery_phrase_word_number = LazyElement(RecoveryPhraseWordNumberText)
+    recovery_phrase_word_input = LazyElement(RecoveryPhraseWordInput)
+    ## Dapps permissions
+    dapp_permissions_button = LazyElement(DappPermissionsButton)
+    revoke_access_button = LazyElement(Button, translation_id="revoke-access")
+    ## Delete my profile
+    delete_my_profile_button = LazyElement(Button, translation_id="delete-my-profile")
+    delete_my_profile_password_input = LazyElement(EditBox, xpath="//android.widget.EditText")
+    delete_profile_button = LazyElement(Button, accessibility_id="delete-profile-confirm")
+
+    # Notifications
+    profile_notifications_button = LazyElement(Button, accessibility_id="notifications-settings-button")
+    profile_notifications_toggle_button = LazyElement(Button, accessibility_id="local-notifications-settings-button")
+    push_notification_toggle = LazyElement(Button,
+                                           xpath="//*[@content-desc='notifications-button']//*[@content-desc='switch']")
+    wallet_push_notifications = LazyElement(Button, accessibility_id="notifications-button")
+
+    # Sync settings
+    sync_settings_button = LazyElement(SyncSettingsButton)
+    ## Mobile Data
+    use_mobile_data = LazyElement(Button, translation_id="mobile-network-use-mobile",
+                                  suffix="/following-sibling::android.widget.Switch[1]")
+    ask_me_when_on_mobile_network = LazyElement(Button, translation_id="mobile-network-ask-me",
+                                                suffix="/following-sibling::android.widget.Switch[1]")
+    ## Backup settings
+    backup_settings_button = LazyElement(Button, accessibility_id="backup-settings-button")
+    ## Perform backup
+    perform_backup_button = LazyElement(Button, translation_id="perform-backup")
+
+    ## Sync history data
+    sync_history_for_button = LazyElement(Button, accessibility_id="default-sync-period-button")
+    ## History nodes
+    mail_server_button = LazyElement(Button, accessibility_id="offline-messages-settings-button")
+    mail_server_address_input = LazyElement(EditBox, translation_id="mailserver-address",
+                                            suffix="/following-sibling::*[1]/android.widget.EditText")
+    mail_server_connect_button = LazyElement(Button, accessibility_id="mailserver-connect-button")
+    mail_server_auto_selection_button = LazyElement(Button, translation_id="mailserver-automatic",
+                                                    suffix="/following-sibling::*[1]")
+    use_history_node_button = LazyElement(Button, translation_id="offline-messaging-use-history-nodes",
+                                          suffix="/following-sibling::*[1]")
+    mail_server_delete_button = LazyElement(Button, accessibility_id="mailserver-delete-button")
+    ## Device syncing
+    devices_button = LazyElement(Button, accessibility_id="pairing-settings-button")
+    device_name_input = LazyElement(EditBox, accessibility_id="device-name")
+    go_to_pairing_settings_button = LazyElement(Button, translation_id="pairing-go-to-installation", uppercase=True)
+    advertise_device_button = LazyElement(Button, accessibility_id="advertise-device")
+    sync_all_button = LazyElement(Button, translation_id="sync-all-devices")
+    syncing_button = LazyElement(Button, accessibility_id="icon, Syncing, label-component, icon")
+    paired_devices_button = LazyElement(Button,
+                                        accessibility_id="icon, Paired devices, 0 devices, label-component, icon")
+    sync_plus_button = LazyElement(Button,
+                                   xpath="//*[@text='Paired devices']/following-sibling::android.view.ViewGroup[@content-desc='icon']")
+
+    # Keycard
+    keycard_button = LazyElement(Button, accessibility_id="keycard-button")
+    change_pin_button = LazyElement(KeycardButton, translation_id="change-pin")
+    change_puk_button = LazyElement(KeycardButton, translation_id="change-puk")
+    change_pairing_code_button = LazyElement(KeycardButton, translation_id="change-pairing")
+    create_keycard_backup_button = LazyElement(KeycardButton, translation_id="keycard-backup")
+
+    # Advanced
+    advanced_button = LazyElement(AdvancedButton)
+    mutual_contact_request_switcher = LazyElement(Button, accessibility_id="mutual-contact-requests-switch")
+    ## Network
+    active_network_name = LazyElement(Text, xpath="//android.widget.TextView[contains(@text,'with upstream RPC')]")
+    plus_button = LazyElement(Button, xpath="(//android.widget.ImageView[@content-desc='icon'])[2]")
+    custom_chain_button = LazyElement(Button, translation_id="custom")
+    custom_network_symbol_input = LazyElement(EditBox, translation_id="specify-symbol")
+    specify_name_input = LazyElement(EditBox, translation_id="name",
+                                     suffix="/following-sibling::*[1]/android.widget.EditText")
+    specify_network_id_input = LazyElement(EditBox, translation_id="specify-network-id")
+    connect_button = LazyElement(Button, accessibility_id="network-connect-button")
+    ## Toggles
+    transaction_management_enabled_toggle = LazyElement(Button, accessibility_id="transactions-management-enabled")
+    webview_debug_toggle = LazyElement(Button, accessibility_id="webview-debug-switch")
+    waku_bloom_toggle = LazyElement(Button, accessibility_id="waku-bloom-filter-mode-settings-switch")
+    ## Log level
+    log_level_setting_button = LazyElement(Button, accessibility_id="log-level-settings-button")
+    ## Fleet
+    fleet_setting_button = LazyElement(Button, accessibility_id="fleet-settings-button")
+    ## Bootnodes
+    bootnodes_button = LazyElement(Button, accessibility_id="bootnodes-settings-button")
+    bootnode_address_input = LazyElement(EditBox, accessibility_id="bootnode-address")
+    enable_bootnodes = LazyElement(Button, xpath="//android.widget.Switch")
+    add_bootnode_button = LazyElement(Button, accessibility_id="add-bootnode")
+
+    # Need help
+    help_button = LazyElement(HelpButton)
+    submit_bug_button = LazyElement(Button, accessibility_id="submit-bug-button")
+    bug_description_edit_box = LazyElement(EditBox, accessibility_id="bug-report-description")
+    bug_steps_edit_box = LazyElement(EditBox, accessibility_id="bug-report-steps")
+    bug_submit_button = LazyElement(Button, accessibility_id="bug-report-submit")
+    request_a_feature_button = LazyElement(Button, accessibility_id="request-a-feature-button")
+    faq_button = LazyElement(FaqButton)
+
+    # About
+    about_button = LazyElement(AboutButton)
+    privacy_policy_button = LazyElement(PrivacyPolicyButton)
+    terms_of_use_button = LazyElement(TermsOfUseButton)
+    app_version_text = LazyElement(Text, xpath="//*[@content-desc='app-version']//android.widget.TextView[2]")
+    node_version_text = LazyElement(Text, xpath="//*[@content-desc='node-version']//android.widget.TextView[2]")
+
+    # Logout
+    logout_button = LazyElement(LogoutButton)
+    logout_dialog = LazyElement(LogoutDialog)
+    confirm_logout_button = LazyElement(Button, translation_id="logout", uppercase=True)
+
+    # New profile
+    edit_profile_button = LazyElement(Button, accessibility_id="icon, Edit Profile, label-component, icon")
+    change_profile_photo_button = LazyElement(Button,
+                                              xpath="//*[@content-desc='user-avatar']/following-sibling::android.view.ViewGroup[@content-desc='icon']")
+    take_photo_button = LazyElement(Button, accessibility_id="take-photo-button")
+    select_from_gallery_button = LazyElement(Button, accessibility_id="select-from-gallery-button")
+    profile_password_button = LazyElement(Button, accessibility_id="icon, Password, label-component, icon")
+    profile_messages_button = LazyElement(Button, accessibility_id="icon, Messages, label-component, icon")
+    profile_blocked_users_button = LazyElement(Button, accessibility_id="Blocked users, label-component, icon")
+    profile_wallet_button = LazyElement(Button, accessibility_id="icon, Wallet, label-component, icon")
+    network_settings_button = LazyElement(Button, accessibility_id="Network settings, label-component, icon")
+    profile_legacy_button = LazyElement(Button, accessibility_id="icon, Legacy settings, label-component, icon")
+    testnet_mode_toggle = LazyElement(Button, accessibility_id="icon, Testnet mode, label-component")
+    confirm_testnet_mode_change_button = LazyElement(Button, accessibility_id="confirm-testnet-mode-change")
+
     def __init__(self, driver):
         super().__init__(driver)
-        self.options_button = OptionsButton(self.driver)
-
-        # Header
-        self.public_key_text = Text(self.driver, accessibility_id="chat-key")
-        self.default_username_text = Text(self.driver, accessibility_id="default-username")
-        self.contact_name_text = Text(self.driver, accessibility_id="contact-name")
-        self.share_my_profile_button = Button(self.driver, accessibility_id="share-header-button")
-        self.profile_picture = ProfilePictureElement(self.driver)
-        self.online_indicator = Button(self.driver, accessibility_id="online-profile-photo-dot")
-        self.edit_picture_button = Button(self.driver, accessibility_id="edit-profile-photo-button")
-        self.confirm_edit_button = Button(self.driver, accessibility_id="done-button")
-        self.select_from_gallery_button_old = Button(self.driver, translation_id="profile-pic-pick")
-        self.capture_button = Button(self.driver, translation_id="image-source-make-photo")
-        self.take_photo_button_old = Button(self.driver, accessibility_id="take-photo")
-        self.crop_photo_button = Button(self.driver, accessibility_id="Crop")
-        self.decline_photo_crop = Button(self.driver, accessibility_id="Navigate up")
-        self.shutter_button = Button(self.driver, accessibility_id="Shutter")
-        self.accept_photo_button = Button(self.driver, accessibility_id="Done")
-
-        # ENS
-        self.username_in_ens_chat_settings_text = EditBox(
-            self.driver, xpath="//*[@content-desc='chat-icon']/../../android.widget.TextView[2]")
-        self.ens_usernames_button = ENSusernames(self.driver)
-        self.ens_name_in_share_chat_key_text = Text(self.driver, accessibility_id="ens-username")
-
-        # Contacts
-        self.contacts_button = Button(self.driver, accessibility_id="contacts-button")
-        self.blocked_users_button = Button(self.driver, accessibility_id="blocked-users-list-button")
-        self.add_new_contact_button = AddNewContactButton(self.driver)
-        self.invite_friends_in_contact_button = Button(self.driver, accessibility_id="invite-friends-button")
-
-        # Privacy and security
-        self.privacy_and_security_button = Button(self.driver, accessibility_id="privacy-and-security-settings-button")
-        self.accept_new_chats_from = Button(self.driver, accessibility_id="accept-new-chats-from")
-        self.accept_new_chats_from_contacts_only = Button(self.driver, translation_id="contacts")
-        self.reset_password_button = Button(self.driver, accessibility_id="reset-password")
-        self.current_password_edit_box = EditBox(self.driver, accessibility_id="current-password")
-        self.new_password_edit_box = EditBox(self.driver, accessibility_id="new-password")
-        self.confirm_new_password_edit_box = EditBox(self.driver, accessibility_id="confirm-new-password")
-        self.current_password_wrong_text = Text(self.driver, accessibility_id="current-password-error")
-
-        # Appearance
-        self.appearance_button = Button(self.driver, accessibility_id="appearance-settings-button")
-        self.show_profile_pictures_of = Button(self.driver, accessibility_id="show-profile-pictures")
-        self.show_profile_pictures_to = Button(self.driver, accessibility_id="show-profile-pictures-to")
-        ## Backup recovery phrase
-        self.backup_recovery_phrase_button = BackupRecoveryPhraseButton(self.driver)
-        self.recovery_phrase_table = RecoveryPhraseTable(self.driver)
-        self.recovery_phrase_word_number = RecoveryPhraseWordNumberText(self.driver)
-        self.recovery_phrase_word_input = RecoveryPhraseWordInput(self.driver)
-        ## Dapps permissions
-        self.dapp_permissions_button = DappPermissionsButton(self.driver)
-        self.revoke_access_button = Button(self.driver, translation_id="revoke-access")
-        ## Delete my profile
-        self.delete_my_profile_button = Button(self.driver, translation_id="delete-my-profile")
-        self.delete_my_profile_password_input = EditBox(self.driver, xpath="//android.widget.EditText")
-        self.delete_profile_button = Button(self.driver, accessibility_id="delete-profile-confirm")
-
-        # Notifications
-        self.profile_notifications_button = Button(self.driver, accessibility_id="notifications-settings-button")
-        self.profile_notifications_toggle_button = Button(self.driver,
-                                                          accessibility_id="local-notifications-settings-button")
-        self.push_notification_toggle = Button(
-            self.driver, xpath="//*[@content-desc='notifications-button']//*[@content-desc='switch']")
-        self.wallet_push_notifications = Button(self.driver, accessibility_id="notifications-button")
-
-        # Sync settings
-        self.sync_settings_button = SyncSettingsButton(self.driver)
-        ## Mobile Data
-        self.use_mobile_data = Button(self.driver, translation_id="mobile-network-use-mobile",
-                                      suffix="/following-sibling::android.widget.Switch[1]")
-        self.ask_me_when_on_mobile_network = Button(self.driver, translation_id="mobile-network-ask-me",
-                                                    suffix="/following-sibling::android.widget.Switch[1]")
-        ## Backup settings
-        self.backup_settings_button = Button(self.driver, accessibility_id="backup-settings-button")
-        ## Perform backup
-        self.perform_backup_button = Button(self.driver, translation_id="perform-backup")
-
-        ## Sync history data
-        self.sync_history_for_button = Button(self.driver, accessibility_id="default-sync-period-button")
-        ## History nodes
-        self.mail_server_button = Button(self.driver, accessibility_id="offline-messages-settings-button")
-        self.mail_server_address_input = EditBox(self.driver, translation_id="mailserver-address",
-                                                 suffix="/following-sibling::*[1]/android.widget.EditText")
-        self.mail_server_connect_button = Button(self.driver, accessibility_id="mailserver-connect-button")
-        self.mail_server_auto_selection_button = Button(self.driver, translation_id="mailserver-automatic",
-                                                        suffix="/following-sibling::*[1]")
-        self.use_history_node_button = Button(self.driver, translation_id="offline-messaging-use-history-nodes",
-                                              suffix="/following-sibling::*[1]")
-        self.mail_server_delete_button = Button(self.driver, accessibility_id="mailserver-delete-button")
+
         self.mail_server_confirm_delete_button = Button(self.driver,
                                                         xpath='//*[@text="%s"]' % self.get_translation_by_key(
                                                             "delete-mailserver").upper())
-        ## Device syncing
-        self.devices_button = Button(self.driver, accessibility_id="pairing-settings-button")
-        self.device_name_input = EditBox(self.driver, accessibility_id="device-name")
-        self.go_to_pairing_settings_button = Button(self.driver, translation_id="pairing-go-to-installation",
-                                                    uppercase=True)
-        self.advertise_device_button = Button(self.driver, accessibility_id="advertise-device")
-        self.sync_all_button = Button(self.driver, translation_id="sync-all-devices")
-        self.syncing_button = Button(self.driver, accessibility_id="icon, Syncing, label-component, icon")
-        self.paired_devices_button = Button(self.driver,
-                                            accessibility_id="icon, Paired devices, 0 devices, label-component, icon")
-        self.sync_plus_button = Button(
-            self.driver,
-            xpath="//*[@text='Paired devices']/following-sibling::android.view.ViewGroup[@content-desc='icon']")
-
-        # Keycard
-        self.keycard_button = Button(self.driver, accessibility_id="keycard-button")
-        self.change_pin_button = KeycardButton(self.driver, translation_id="change-pin")
-        self.change_puk_button = KeycardButton(self.driver, translation_id="change-puk")
-        self.change_pairing_code_button = KeycardButton(self.driver, translation_id="change-pairing")
-        self.create_keycard_backup_button = KeycardButton(self.driver, translation_id="keycard-backup")
-
-        # Advanced
-        self.advanced_button = AdvancedButton(self.driver)
-        self.mutual_contact_request_switcher = Button(self.driver, accessibility_id="mutual-contact-requests-switch")
-        ## Network
-        self.active_network_name = Text(self.driver,
-                                        xpath="//android.widget.TextView[contains(@text,'with upstream RPC')]")
-        self.plus_button = Button(self.driver, xpath="(//android.widget.ImageView[@content-desc='icon'])[2]")
-        self.custom_chain_button = Button(self.driver, translation_id="custom")
-        self.custom_network_symbol_input = EditBox(self.driver, translation_id="specify-symbol")
-        self.specify_name_input = EditBox(self.driver, translation_id="name",
-                                          suffix="/following-sibling::*[1]/android.widget.EditText")
-        self.specify_network_id_input = EditBox(self.driver, translation_id="specify-network-id")
-        self.connect_button = Button(self.driver, accessibility_id="network-connect-button")
-        ## Toggles
-        self.transaction_management_enabled_toggle = Button(self.driver,
-                                                            accessibility_id="transactions-management-enabled")
-        self.webview_debug_toggle = Button(self.driver, accessibility_id="webview-debug-switch")
-        self.waku_bloom_toggle = Button(self.driver, accessibility_id="waku-bloom-filter-mode-settings-switch")
-        ## Log level
-        self.log_level_setting_button = Button(self.driver, accessibility_id="log-level-settings-button")
-        ## Fleet
-        self.fleet_setting_button = Button(self.driver, accessibility_id="fleet-settings-button")
-        ## Bootnodes
-        self.bootnodes_button = Button(self.driver, accessibility_id="bootnodes-settings-button")
-        self.bootnode_address_input = EditBox(self.driver, accessibility_id="bootnode-address")
-        self.enable_bootnodes = Button(self.driver, xpath="//android.widget.Switch")
-        self.add_bootnode_button = Button(self.driver, accessibility_id="add-bootnode")
-
-        # Need help
-        self.help_button = HelpButton(self.driver)
-        self.submit_bug_button = Button(self.driver, accessibility_id="submit-bug-button")
-        self.bug_description_edit_box = EditBox(self.driver, accessibility_id="bug-report-description")
-        self.bug_steps_edit_box = EditBox(self.driver, accessibility_id="bug-report-steps")
-        self.bug_submit_button = Button(self.driver, accessibility_id="bug-report-submit")
-        self.request_a_feature_button = Button(self.driver, accessibility_id="request-a-feature-button")
-        self.faq_button = FaqButton(self.driver)
-
-        # About
-        self.about_button = AboutButton(self.driver)
-        self.privacy_policy_button = PrivacyPolicyButton(self.driver)
-        self.terms_of_use_button = TermsOfUseButton(self.driver)
-        self.app_version_text = Text(self.driver, xpath="//*[@content-desc='app-version']//android.widget.TextView[2]")
-        self.node_version_text = Text(self.driver,
-                                      xpath="//*[@content-desc='node-version']//android.widget.TextView[2]")
-
-        # Logout
-        self.logout_button = LogoutButton(self.driver)
-        self.logout_dialog = LogoutDialog(self.driver)
-        self.confirm_logout_button = Button(self.driver, translation_id="logout", uppercase=True)
-
-        # New profile
-        self.edit_profile_button = Button(self.driver, accessibility_id="icon, Edit Profile, label-component, icon")
-        self.change_profile_photo_button = Button(
-            self.driver,
-            xpath="//*[@content-desc='user-avatar']/following-sibling::android.view.ViewGroup[@content-desc='icon']")
-        self.take_photo_button = Button(self.driver, accessibility_id="take-photo-button")
-        self.select_from_gallery_button = Button(self.driver, accessibility_id="select-from-gallery-button")
-        self.profile_password_button = Button(self.driver, accessibility_id="icon, Password, label-component, icon")
-        self.profile_messages_button = Button(self.driver, accessibility_id="icon, Messages, label-component, icon")
-        self.profile_blocked_users_button = Button(self.driver, accessibility_id="Blocked users, label-component, icon")
-        self.profile_wallet_button = Button(self.driver, accessibility_id="icon, Wallet, label-component, icon")
-        self.network_settings_button = Button(self.driver, accessibility_id="Network settings, label-component, icon")
-        self.profile_legacy_button = Button(self.driver,
-                                            accessibility_id="icon, Legacy settings, label-component, icon")
-        self.testnet_mode_toggle = Button(self.driver, accessibility_id="icon, Testnet mode, label-component")
-        self.confirm_testnet_mode_change_button = Button(self.driver, accessibility_id="confirm-testnet-mode-change")
 
     def switch_network(self):
         self.profile_wallet_button.click()
@@ -381,7 +374,7 @@ class ProfileView(BaseView):
         self.contacts_button.wait_and_click(30)
         self.element_by_text(username).click()
         from views.chat_view import ChatView
-        return ChatView(self.driver)
+        return ChatView.get_instance(self.driver)
 
     def add_contact_via_contacts_list(self, public_key):
         self.driver.info("Adding user to Contacts via Profile > Contacts")
@@ -57,11 +57,11 @@ class SignWithKeycardButton(Button):
 
     def navigate(self):
         from views.keycard_view import KeycardView
-        return KeycardView(self.driver)
+        return KeycardView.get_instance(self.driver)
 
     def click(self):
         from views.keycard_view import KeycardView
-        self.click_until_presence_of_element(KeycardView(self.driver).two_button)
+        self.click_until_presence_of_element(KeycardView.get_instance(self.driver).two_button)
         return self.navigate()
 
 
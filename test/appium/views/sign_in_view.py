@@ -1,10 +1,10 @@
 import base64
 import os
 
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
 from tests import common_password, appium_root_project_path
-from tests.base_test_case import get_app_path
+from tests.base_test_case import get_app_path, profile_snapshots
 from views.base_element import Button, EditBox, Text
 from views.base_view import BaseView
 
@@ -42,7 +42,7 @@ class MoveAndResetButton(Button):
 
     def navigate(self):
         from views.keycard_view import KeycardView
-        return KeycardView(self.driver)
+        return KeycardView.get_instance(self.driver)
 
 
 class BeginRecoveryButton(Button):
@@ -51,7 +51,7 @@ class BeginRecoveryButton(Button):
 
     def navigate(self):
         from views.keycard_view import KeycardView
-        return KeycardView(self.driver)
+        return KeycardView.get_instance(self.driver)
 
     def click(self):
         self.scroll_to_element().click()
@@ -64,7 +64,7 @@ class LogInButton(Button):
 
     def navigate(self):
         from views.home_view import HomeView
-        return HomeView(self.driver)
+        return HomeView.get_instance(self.driver)
 
 
 class AccessKeyButton(Button):
@@ -82,7 +82,7 @@ class KeycardKeyStorageButton(Button):
 
     def navigate(self):
         from views.keycard_view import KeycardView
-        return KeycardView(self.driver)
+        return KeycardView.get_instance(self.driver)
 
     def click(self):
         self.scroll_to_element().click()
@@ -100,7 +100,7 @@ class PrivacyPolicyLink(Button):
 
     def navigate(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
 
 class TermsOfUseLink(Button):
@@ -120,7 +120,7 @@ class TermsOfUseLink(Button):
 
     def navigate(self):
         from views.web_views.base_web_view import BaseWebView
-        return BaseWebView(self.driver)
+        return BaseWebView.get_instance(self.driver)
 
 
 class UserProfileElement(Button):
@@ -261,29 +261,42 @@ class SignInView(BaseView):
         #     self.confirm_your_password_input.send_keys(password)
         #     self.next_button.click()
         # self.identifiers_button.wait_and_click(30)
+        self.pass_notifications_screen(enable_notifications)
+        self.driver.info("## New multiaccount is created successfully!", device=False)
+        return self.get_home_view()
+
+    def pass_notifications_screen(self, enable_notifications=False):
+        # cancel_button: TODO: remove when issue 20806 is fixed
         if enable_notifications:
             self.enable_notifications_button.wait_and_click()
-            self.cancel_button.click_if_shown()  # TODO: remove when issue 20806 is fixed
-            for _ in range(3):
-                self.allow_button.click_if_shown(sec=10)
-                self.cancel_button.click_if_shown()  # TODO: remove when issue 20806 is fixed
-                self.enable_notifications_button.click_if_shown()
-                if self.chats_tab.is_element_displayed():
-                    break
+            popup_buttons = self.allow_button, self.cancel_button, self.enable_notifications_button
         else:
             self.maybe_later_button.wait_and_click()
-            for _ in range(3):
-                self.cancel_button.click_if_shown()  # TODO: remove when issue 20806 is fixed
-                self.maybe_later_button.click_if_shown()
-                if self.chats_tab.is_element_displayed():
-                    break
+            popup_buttons = self.cancel_button, self.maybe_later_button
+        # one page source per check instead of a separate lookup (and implicit wait) for every button
+        snapshot = self.get_page_snapshot()
+        for _ in range(3):
+            try:
+                snapshot.wait_for_any_element([self.chats_tab, *popup_buttons], 10)
+            except TimeoutException:
+                continue
+            if snapshot.is_element_displayed(self.chats_tab):
+                break
+            for button in popup_buttons:
+                button.click_if_shown(snapshot=snapshot)
         self.chats_tab.wait_for_visibility_of_element(30)
-        self.driver.info("## New multiaccount is created successfully!", device=False)
-        return self.get_home_view()
 
     def recover_access(self, passphrase: str, password: str = common_password, keycard=False,
                        enable_notifications=False, second_user=False, username='Restore user', set_image=False):
         self.driver.info("## Recover access(password:%s, keycard:%s)" % (password, str(keycard)), device=False)
+        # notifications permission and profile image are not part of the app data, such profiles are not snapshotted
+        snapshot_key = None
+        if not (second_user or keycard or enable_notifications or set_image):
+            snapshot_key = profile_snapshots.get_key('recover_access', passphrase=passphrase, password=password,
+                                                     username=username)
+            if self.restore_profile_snapshot(snapshot_key, password):
+                self.driver.info("## Multiaccount is restored from snapshot!", device=False)
+                return self.get_home_view()
 
         if not second_user:
             self.terms_and_privacy_checkbox.click()
@@ -298,26 +311,27 @@ class SignInView(BaseView):
         self.continue_button.click_until_presence_of_element(self.profile_title_input)
         self.set_profile(username, set_image)
         self.set_password(password)
-        if enable_notifications:
-            self.enable_notifications_button.wait_and_click()
-            self.cancel_button.click_if_shown()  # TODO: remove when issue 20806 is fixed
-            for _ in range(3):
-                self.allow_button.click_if_shown(sec=10)
-                self.cancel_button.click_if_shown()  # TODO: remove when issue 20806 is fixed
-                self.enable_notifications_button.click_if_shown()
-                if self.chats_tab.is_element_displayed():
-                    break
-        else:
-            self.maybe_later_button.wait_and_click()
-            for _ in range(3):
-                self.cancel_button.click_if_shown()  # TODO: remove when issue 20806 is fixed
-                self.maybe_later_button.click_if_shown()
-                if self.chats_tab.is_element_displayed():
-                    break
-        self.chats_tab.wait_for_visibility_of_element(30)
+        self.pass_notifications_screen(enable_notifications)
+        if snapshot_key and profile_snapshots.capture(self.driver, snapshot_key):
+            # the app was restarted to capture its data
+            self.sign_in(password)
         self.driver.info("## Multiaccount is recovered successfully!", device=False)
         return self.get_home_view()
 
+    def restore_profile_snapshot(self, snapshot_key, password=common_password):
+        if not profile_snapshots.restore(self.driver, snapshot_key):
+            return False
+        if not self.password_input.is_element_displayed(30):
+            # snapshot doesn't work with this build or device, onboarding goes through UI
+            profile_snapshots.invalidate(snapshot_key)
+            app_id = profile_snapshots.get_app_id(self.driver)
+            self.driver.terminate_app(app_id)
+            self.driver.execute_script('mobile: clearApp', {'appId': app_id})
+            self.driver.activate_app(app_id)
+            return False
+        self.sign_in(password)
+        return True
+
     def sign_in(self, password=common_password):
         self.driver.info("## Sign in (password: %s)" % password, device=False)
         self.password_input.wait_for_visibility_of_element(10)
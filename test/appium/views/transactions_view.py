@@ -92,7 +92,7 @@ class TransactionTable(BaseElement):
                 return element
             except NoSuchElementException:
                 from views.base_view import BaseView
-                BaseView(self.driver).pull_to_refresh()
+                BaseView.get_instance(self.driver).pull_to_refresh()
                 element.scroll_to_element()
         self.driver.fail('Transaction %s %s was not found on Wallet/Transaction screen' % (amount, asset))
 
@@ -69,8 +69,8 @@ class WalletView(BaseView):
 
         # Account adding
         # ToDo: add unique accessibility ids for the next 2 elements:
-        self.create_account_button = HomeView(self.driver).start_a_new_chat_bottom_sheet_button
-        self.add_account_to_watch = HomeView(self.driver).add_a_contact_chat_bottom_sheet_button
+        self.create_account_button = HomeView.get_instance(self.driver).start_a_new_chat_bottom_sheet_button
+        self.add_account_to_watch = HomeView.get_instance(self.driver).add_a_contact_chat_bottom_sheet_button
         self.address_to_watch_input = EditBox(self.driver, accessibility_id='add-address-to-watch')
         self.account_has_activity_label = Text(self.driver, accessibility_id='account-has-activity')
         self.add_account_continue_button = Button(self.driver, accessibility_id='Continue')
@@ -131,8 +131,10 @@ class WalletView(BaseView):
         self.slide_and_confirm_with_password()
 
     def set_amount(self, amount: float):
-        for i in '{:f}'.format(amount).rstrip('0'):
-            Button(self.driver, accessibility_id='keyboard-key-%s' % i).click()
+        keys = '{:f}'.format(amount).rstrip('0')
+        self.driver.info("Set amount %s" % keys)
+        self.driver.keyboard.tap_elements(
+            [Button(self.driver, accessibility_id='keyboard-key-%s' % key) for key in keys])
 
     def disable_mainnet_in_from_network(self):
         if self.from_network_text.text == 'Mainnet':
@@ -160,7 +162,7 @@ class WalletView(BaseView):
     def add_regular_account(self, account_name: str):
         self.add_account_button.click()
         self.create_account_button.click()
-        SignInView(self.driver).profile_title_input.send_keys(account_name)
+        SignInView.get_instance(self.driver).profile_title_input.send_keys(account_name)
         self.slide_and_confirm_with_password()
 
     def add_watch_only_account(self, address: str, account_name: str):
@@ -168,7 +170,7 @@ class WalletView(BaseView):
         self.add_account_to_watch.click()
         self.address_to_watch_input.send_keys(address)
         self.add_account_continue_button.click()
-        SignInView(self.driver).profile_title_input.send_keys(account_name)
+        SignInView.get_instance(self.driver).profile_title_input.send_keys(account_name)
         self.add_watched_address_button.click()
 
     def remove_account(self, account_name: str, watch_only: bool = False):
@@ -1,7 +1,9 @@
 import time
 
+from selenium.common.exceptions import TimeoutException
+
 from tests import common_password
-from views.base_element import Button, Text, EditBox, SilentButton, CheckBox
+from views.base_element import AdaptiveWait, Button, Text, EditBox, SilentButton, CheckBox
 from views.base_view import BaseView
 
 
@@ -11,7 +13,7 @@ class TransactionHistoryButton(Button):
 
     def navigate(self):
         from views.transactions_view import TransactionsView
-        return TransactionsView(self.driver)
+        return TransactionsView.get_instance(self.driver)
 
 
 class AssetCheckBox(CheckBox):
@@ -29,7 +31,7 @@ class BackupRecoveryPhrase(Button):
 
     def navigate(self):
         from views.profile_view import ProfileView
-        return ProfileView(self.driver)
+        return ProfileView.get_instance(self.driver)
 
 
 class AccountElementButton(SilentButton):
@@ -48,7 +50,7 @@ class SendTransactionButton(Button):
 
     def navigate(self):
         from views.send_transaction_view import SendTransactionView
-        return SendTransactionView(self.driver)
+        return SendTransactionView.get_instance(self.driver)
 
 
 class SendTransactionFromMainButton(Button):
@@ -57,7 +59,7 @@ class SendTransactionFromMainButton(Button):
 
     def navigate(self):
         from views.send_transaction_view import SendTransactionView
-        return SendTransactionView(self.driver)
+        return SendTransactionView.get_instance(self.driver)
 
 
 class ReceiveTransactionButton(Button):
@@ -66,7 +68,7 @@ class ReceiveTransactionButton(Button):
 
     def navigate(self):
         from views.send_transaction_view import SendTransactionView
-        return SendTransactionView(self.driver)
+        return SendTransactionView.get_instance(self.driver)
 
 
 class AddCustomTokenButton(Button):
@@ -75,7 +77,7 @@ class AddCustomTokenButton(Button):
 
     def navigate(self):
         from views.add_custom_token_view import AddCustomTokenView
-        return AddCustomTokenView(self.driver)
+        return AddCustomTokenView.get_instance(self.driver)
 
 
 class AccountColorButton(Button):
@@ -177,35 +179,38 @@ class WalletView(BaseView):
 
     def wait_balance_is_changed(self, asset='ETH', initial_balance=0, wait_time=180, scan_tokens=False, navigate_to_home=True):
         self.driver.info('Waiting %ss for %s updated balance' % (wait_time, asset))
-        counter = 0
-        while True:
-            if counter >= wait_time:
-                self.driver.fail(
-                    'Balance %s %s is not changed during %s seconds!' % (asset, initial_balance, wait_time))
-            elif self.asset_by_name(asset).is_element_displayed() and self.get_asset_amount_by_name(
-                    asset) == initial_balance:
+        start_time = time.time()
+        # balance is refreshed right away and then every minute
+        last_refresh_time = 0
+
+        def is_balance_changed():
+            nonlocal last_refresh_time
+            if not self.asset_by_name(asset).is_element_displayed(2):
                 if scan_tokens:
                     self.scan_tokens()
-                if (counter / 60).is_integer():
-                    self.pull_to_refresh()
-                    counter += 20
-                counter += 10
-                time.sleep(10)
-                self.driver.info('Waiting %ss for %s updated balance' % (counter, asset))
-            elif not self.asset_by_name(asset).is_element_displayed(10):
+                self.swipe_up()
+                self.driver.info('Waiting %s seconds for %s to display asset' % (round(time.time() - start_time), asset))
+                return False
+            if self.get_asset_amount_by_name(asset) == initial_balance:
                 if scan_tokens:
                     self.scan_tokens()
-                self.swipe_up()
-                counter += 10
-                time.sleep(10)
-                self.driver.info('Waiting %s seconds for %s to display asset' % (counter, asset))
-            else:
-                self.driver.info('Initial "%s" is not equal expected balance "%s", it is updated!' % (initial_balance,
-                                 self.get_asset_amount_by_name(asset)))
-                if navigate_to_home:
-                    self.wallet_button.double_click()
-                    self.element_by_translation_id("wallet-total-value").scroll_to_element(direction='up')
-                return self
+                if time.time() - last_refresh_time >= 60:
+                    self.pull_to_refresh(wait_sec=0)
+                    last_refresh_time = time.time()
+                self.driver.info('Waiting %ss for %s updated balance' % (round(time.time() - start_time), asset))
+                return False
+            return True
+
+        try:
+            AdaptiveWait(self.driver, wait_time, poll_frequency=1, max_poll_frequency=10).until(is_balance_changed)
+        except TimeoutException:
+            self.driver.fail('Balance %s %s is not changed during %s seconds!' % (asset, initial_balance, wait_time))
+        self.driver.info('Initial "%s" is not equal expected balance "%s", it is updated!' % (initial_balance,
+                         self.get_asset_amount_by_name(asset)))
+        if navigate_to_home:
+            self.wallet_button.double_click()
+            self.element_by_translation_id("wallet-total-value").scroll_to_element(direction='up')
+        return self
 
     def get_sign_in_phrase(self):
         return ' '.join([element.text for element in self.sign_in_phrase.find_elements()])
@@ -365,7 +370,7 @@ class WalletView(BaseView):
         self.account_name_input.send_keys(account_name)
         if keycard:
             from views.keycard_view import KeycardView
-            keycard_view = KeycardView(self.driver)
+            keycard_view = KeycardView.get_instance(self.driver)
             self.add_account_generate_account_button.click()
             keycard_view.enter_default_pin()
         else:
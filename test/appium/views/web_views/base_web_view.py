@@ -1,8 +1,7 @@
-import time
+from selenium.common.exceptions import TimeoutException
 
-from views.base_element import EditBox, Button, BaseElement
+from views.base_element import AdaptiveWait, EditBox, Button, BaseElement
 from views.base_view import BaseView
-from appium.webdriver.common.touch_action import TouchAction
 
 
 class BaseWebView(BaseView):
@@ -44,11 +43,10 @@ class BaseWebView(BaseView):
 
     def wait_for_d_aap_to_load(self, wait_time=35):
         self.driver.info("Waiting %ss for dapp to load" % wait_time)
-        counter = 0
-        while self.progress_bar_icon.is_element_displayed(5):
-            time.sleep(1)
-            counter += 1
-            if counter > wait_time:
+        if self.progress_bar_icon.is_element_displayed(5):
+            try:
+                AdaptiveWait(self.driver, wait_time).until_not_displayed([self.progress_bar_icon])
+            except TimeoutException:
                 self.driver.fail("Page is not loaded during %s seconds" % wait_time)
 
     def open_in_webview(self):
@@ -90,5 +88,4 @@ class BaseWebView(BaseView):
 
     def open_right_collapsed_menu(self):
         # written for status.im
-        size = self.driver.get_window_size()
-        TouchAction(self.driver).tap(None,  size["width"] * 0.92, size["height"] * 0.2, 1).perform()
\ No newline at end of file
+        self.driver.gestures.tap(*self.driver.gestures.get_absolute_location(0.92, 0.2))
\ No newline at end of file
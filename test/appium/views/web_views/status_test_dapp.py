@@ -8,7 +8,7 @@ class RequestSTTButton(Button):
 
     def navigate(self):
         from views.send_transaction_view import SendTransactionView
-        return SendTransactionView(self.driver)
+        return SendTransactionView.get_instance(self.driver)
 
 
 class TransactionsButton(Button):
@@ -26,7 +26,7 @@ class TransactionsButton(Button):
 
         def navigate(self):
             from views.send_transaction_view import SendTransactionView
-            return SendTransactionView(self.driver)
+            return SendTransactionView.get_instance(self.driver)
 
     class SignTypedMessageButton(Button):
         def __init__(self, driver):
@@ -39,7 +39,7 @@ class TransactionsButton(Button):
 
         def navigate(self):
             from views.send_transaction_view import SendTransactionView
-            return SendTransactionView(self.driver)
+            return SendTransactionView.get_instance(self.driver)
 
     class DeployContractButton(Button):
         def __init__(self, driver):
@@ -47,7 +47,7 @@ class TransactionsButton(Button):
 
         def navigate(self):
             from views.send_transaction_view import SendTransactionView
-            return SendTransactionView(self.driver)
+            return SendTransactionView.get_instance(self.driver)
 
     class SendTwoTxOneByOneButton(Button):
         def __init__(self, driver):
@@ -55,7 +55,7 @@ class TransactionsButton(Button):
 
         def navigate(self):
             from views.send_transaction_view import SendTransactionView
-            return SendTransactionView(self.driver)
+            return SendTransactionView.get_instance(self.driver)
 
         def click(self):
             self.swipe_to_web_element()
@@ -69,7 +69,7 @@ class TransactionsButton(Button):
 
         def navigate(self):
             from views.send_transaction_view import SendTransactionView
-            return SendTransactionView(self.driver)
+            return SendTransactionView.get_instance(self.driver)
 
     class TestFiltersButton(Button):
         def __init__(self, driver):
@@ -90,7 +90,7 @@ class SendOneTransactionInBatchButton(Button):
 
     def navigate(self):
         from views.send_transaction_view import SendTransactionView
-        return SendTransactionView(self.driver)
+        return SendTransactionView.get_instance(self.driver)
 
 
 class StatusTestDAppView(BaseWebView):